@@ -0,0 +1,98 @@
+"""
+Benchmark section extraction before and after the dedup-aware block walker.
+
+The "legacy" extractor reproduces the old find_all() over p/span/li/headings,
+which re-emitted the text of every span nested in a paragraph and every list
+item nested in another. Pages are synthetic but shaped like Grokipedia
+articles: paragraphs with inline links and citation spans, and nested lists.
+
+Usage:
+    python benchmarks/bench_sections.py [--sections N] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grokipedia_client.parsers import (  # noqa: E402
+    HEADINGS,
+    available_parsers,
+    build_sections,
+    get_parser,
+)
+
+
+def legacy_parse(html):
+    soup = BeautifulSoup(html, "html.parser")
+    content_root = soup.find("article") or soup.body
+    allowed = list(HEADINGS) + ["p", "span", "ul", "ol", "li"]
+    return build_sections(
+        (el.name.lower(), el.get_text(separator=" ", strip=True))
+        for el in content_root.find_all(allowed, recursive=True)
+    )
+
+
+def make_page(sections):
+    parts = ["<html><body><article><h1>Benchmark Page</h1>"]
+    for i in range(sections):
+        parts.append(f'<h2><span class="mw-headline">Section {i}</span></h2>')
+        for j in range(4):
+            parts.append(
+                f"<p>Paragraph {j} of section {i} mentions "
+                f'<a href="/page/Topic_{j}"><span>Topic {j}</span></a> and '
+                f'<span class="highlight">an inline note</span> before a citation'
+                f'<span class="ref">[{j + 1}]</span>. '
+                + "Filler sentence with ordinary prose. " * 6
+                + "</p>"
+            )
+        parts.append("<ul>")
+        for j in range(3):
+            parts.append(
+                f"<li>Item {j} <span>with detail</span>"
+                f"<ul><li>Sub item {j}a</li><li>Sub item {j}b</li></ul></li>"
+            )
+        parts.append("</ul>")
+    parts.append("</article></body></html>")
+    return "".join(parts)
+
+
+def measure(parse, html, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        sections = parse(html)
+        timings.append(time.perf_counter() - start)
+    size = len(json.dumps(sections, ensure_ascii=False).encode("utf-8"))
+    blocks = sum(len(s["blocks"]) for s in sections)
+    return statistics.median(timings), size, blocks
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--sections", type=int, nargs="+", default=[10, 100])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print(f"{'page':>12} {'extractor':>18} {'median ms':>10} {'JSON bytes':>11} {'blocks':>7}")
+    for count in args.sections:
+        html = make_page(count)
+        label = f"{len(html) // 1024} KiB"
+        base_time, base_size, base_blocks = measure(legacy_parse, html, args.repeat)
+        print(f"{label:>12} {'legacy html.parser':>18} {base_time * 1000:>10.1f} "
+              f"{base_size:>11} {base_blocks:>7}")
+        for name in available_parsers():
+            elapsed, size, blocks = measure(get_parser(name).parse, html, args.repeat)
+            print(f"{label:>12} {name:>18} {elapsed * 1000:>10.1f} {size:>11} {blocks:>7}"
+                  f"  ({1 - size / base_size:.0%} fewer bytes,"
+                  f" {base_time / elapsed:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,4 +2,7 @@
 Grokipedia client module for scraping and accessing Grokipedia content.
 """
 
+from .cache import PageCache
 from .client import GrokipediaScraper
+from .selection import SectionSelector
+from .streaming import StreamingSectionParser
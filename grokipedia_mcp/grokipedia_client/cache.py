@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_MAX_AGE = 3600.0
+
+
+def default_cache_dir() -> str:
+    """
+    Return the default on-disk cache location.
+
+    Uses GROKIPEDIA_CACHE_DIR if set, otherwise $XDG_CACHE_HOME/grokipedia_mcp
+    (falling back to ~/.cache/grokipedia_mcp).
+    """
+    explicit = os.getenv("GROKIPEDIA_CACHE_DIR")
+    if explicit:
+        return explicit
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "grokipedia_mcp")
+
+
+def normalize_title(page_title: str) -> str:
+    """
+    Normalise a page title so "Elon_Musk" and " Elon  Musk " share a cache entry.
+    """
+    return " ".join(page_title.replace("_", " ").split())
+
+
+class PageCache:
+    """
+    Persistent on-disk cache of already-structured Grokipedia pages.
+
+    Each page is stored as one JSON file holding its sections together with
+    the ETag / Last-Modified validators used to revalidate it. File access
+    times drive LRU eviction once the directory exceeds max_bytes.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        """
+        Args:
+            directory: Cache directory; defaults to default_cache_dir().
+            max_bytes: Size cap for all cached pages combined.
+            max_age: Seconds an entry is served without revalidating upstream.
+        """
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, page_title: str) -> str:
+        digest = hashlib.sha256(normalize_title(page_title).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, page_title: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached entry for page_title, or None if it is not cached.
+
+        The entry has keys: title, sections, etag, last_modified, stored_at.
+        Reading an entry marks it as recently used.
+        """
+        path = self._path(page_title)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """
+        Return True if entry is young enough to skip revalidation.
+        """
+        return time.time() - entry.get("stored_at", 0) < self.max_age
+
+    def set(
+        self,
+        page_title: str,
+        sections: List[Dict[str, Any]],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Store the structured sections for page_title, then enforce the size cap.
+        """
+        entry = {
+            "title": normalize_title(page_title),
+            "sections": sections,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+        }
+        path = self._path(page_title)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    def touch(self, page_title: str) -> None:
+        """
+        Reset the freshness clock of an entry after a successful revalidation.
+        """
+        entry = self.get(page_title)
+        if entry is not None:
+            self.set(
+                page_title,
+                entry["sections"],
+                entry.get("etag"),
+                entry.get("last_modified"),
+            )
+
+    def _evict(self) -> None:
+        """
+        Delete least recently used entries until the cache fits in max_bytes.
+        """
+        with self._lock:
+            files = []
+            total = 0
+            with os.scandir(self.directory) as it:
+                for item in it:
+                    if not item.name.endswith(".json"):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, item.path))
+                    total += stat.st_size
+            files.sort()
+            for _, size, path in files:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+
+    def clear(self) -> None:
+        """
+        Remove every cached page.
+        """
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
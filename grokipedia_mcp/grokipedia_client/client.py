@@ -1,16 +1,65 @@
-from typing import List, Dict, Any, Optional
+import codecs
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from .cache import PageCache, normalize_title
+from .parsers import get_parser
+from .selection import SectionSelector
+from .streaming import StreamingSectionParser
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_POOL_SIZE = 16
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    Create a keep-alive session whose connection pool can serve pool_size
+    concurrent requests to grokipedia.com.
+    """
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class GrokipediaScraper:
     """
-    Scraper for Grokipedia pages using BeautifulSoup.
+    Scraper for Grokipedia pages using a pluggable HTML parser backend.
     """
 
+    def __init__(
+        self,
+        cache: Optional[PageCache] = None,
+        parser: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Args:
+            cache: Optional on-disk cache of structured pages, revalidated with
+                ETag / Last-Modified. If None, every call fetches and parses.
+            parser: Parser backend name ("selectolax", "lxml" or "html.parser").
+                If None, the fastest installed backend is used. Ignored by
+                iter_sections() and, when a cache is set, by heading-filtered
+                or budgeted requests that miss it: those are streamed through
+                StreamingSectionParser.
+            session: Shared HTTP session. If None, a pooled keep-alive session
+                is created.
+        """
+        self.cache = cache
+        self.parser = get_parser(parser)
+        self.session = session or create_session()
+
     def scrape_sections(
         self,
-        page_title: str
+        page_title: str,
+        headings: Optional[List[str]] = None,
+        max_level: Optional[int] = None,
+        max_blocks: Optional[int] = None,
+        max_chars: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Scrape Grokipedia and return a list of sections:
@@ -18,84 +67,238 @@ class GrokipediaScraper:
           {"heading": "Early life", "level": 2, "blocks": ["para...", "• bullet ..."]},
           ...
         ]
+
+        The optional headings, max_level, max_blocks and max_chars arguments
+        narrow the result; see SectionSelector.
         """
+        selector = SectionSelector(headings, max_level, max_blocks, max_chars)
+        return self._scrape_sections(page_title, selector)
+
+    def _scrape_sections(
+        self,
+        page_title: str,
+        selector: SectionSelector
+    ) -> List[Dict[str, Any]]:
         url = f"https://grokipedia.com/page/{page_title.replace(' ', '_')}"
-        response = requests.get(url, timeout=30)
+        if self.cache is None:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            # Sections are extracted lazily, so selection stops the walk early
+            return selector.select(self.parser.iter_sections(response.text))
+
+        entry = self.cache.get(page_title)
+        if entry is not None and self.cache.is_fresh(entry):
+            return selector.select(entry["sections"])
+
+        if selector.may_stop_early:
+            # Stream so the download stops once the selection is complete. The
+            # streaming parser may pick a different content root than
+            # self.parser, so its output is never stored in the shared cache.
+            sections = self._stream_sections(
+                page_title, entry, DEFAULT_CHUNK_SIZE, store=False
+            )
+            try:
+                return selector.select(sections)
+            finally:
+                sections.close()
+
+        response = self.session.get(url, headers=self._validators(entry), timeout=30)
+        if entry is not None and response.status_code == 304:
+            self.cache.touch(page_title)
+            return selector.select(entry["sections"])
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        content_root = (
-            soup.find("article")
-            or soup.find("div", {"class": "markdown-body"})
-            or soup.find("div", {"id": "content"})
-            or soup.body
+        # The whole page is parsed so any later selection can be served from cache
+        sections = self.parse_sections(response.text)
+        self.cache.set(
+            page_title,
+            sections,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
         )
-        if not content_root:
-            return []
-
-        allowed = ["h1", "h2", "h3", "h4", "h5", "h6", "p", "span", "ul", "ol", "li"]
-        elements = list(content_root.find_all(allowed, recursive=True))
+        return selector.select(sections)
 
-        def start_section(
-            heading_text: Optional[str] = None, 
-            level: Optional[int] = None
-        ):
-            return {"heading": heading_text, "level": level, "blocks": []}
+    def iter_sections(
+        self,
+        page_title: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a Grokipedia page and yield its sections as they are parsed.
 
-        def push_block(section: Dict[str, Any], text: str):
-            t = (text or "").strip()
-            if t:
-                section["blocks"].append(t)
+        The response body is read in chunks and fed to a StreamingSectionParser,
+        so no DOM is built and the first section is available before the
+        download finishes. Sections match scrape_sections() except that the
+        first content container on the page is used as the content root.
 
-        sections: List[Dict[str, Any]] = []
-        current = start_section()
+        Args:
+            page_title: The page title (e.g., "Elon Musk").
+            chunk_size: Bytes read from the response per step.
+        """
+        entry = self.cache.get(page_title) if self.cache is not None else None
+        if entry is not None and self.cache.is_fresh(entry):
+            yield from entry["sections"]
+            return
+        yield from self._stream_sections(page_title, entry, chunk_size)
 
-        for el in elements:
-            name = el.name.lower()
+    def _stream_sections(
+        self,
+        page_title: str,
+        entry: Optional[Dict[str, Any]],
+        chunk_size: int,
+        store: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch a page that is missing from the cache or stale, and stream its sections.
 
-            if name in ("h1", "h2", "h3", "h4", "h5", "h6"):
-                if current["heading"] is not None or current["blocks"]:
-                    sections.append(current)
-                level = int(name[1])
-                heading_text = el.get_text(separator=" ", strip=True) or None
-                current = start_section(heading_text, level)
-                continue
+        A fully read page is written to the cache unless store is False.
+        """
+        url = f"https://grokipedia.com/page/{page_title.replace(' ', '_')}"
+        with self.session.get(
+            url, headers=self._validators(entry), timeout=30, stream=True
+        ) as response:
+            if entry is not None and response.status_code == 304:
+                self.cache.touch(page_title)
+                yield from entry["sections"]
+                return
+            response.raise_for_status()
 
-            if name == "li":
-                li_text = el.get_text(separator=" ", strip=True)
-                if li_text:
-                    push_block(current, f"• {li_text}")
-                continue
+            # Sections are only kept in full when they have to be cached
+            collected: Optional[List[Dict[str, Any]]] = (
+                [] if self.cache is not None and store else None
+            )
+            parser = StreamingSectionParser()
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+                errors="replace"
+            )
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                for section in parser.feed(decoder.decode(chunk)):
+                    if collected is not None:
+                        collected.append(section)
+                    yield section
+            for section in parser.feed(decoder.decode(b"", final=True)) + parser.close():
+                if collected is not None:
+                    collected.append(section)
+                yield section
 
-            if name in ("p", "span"):
-                push_block(current, el.get_text(separator=" ", strip=True))
-                continue
+            if collected is not None:
+                self.cache.set(
+                    page_title,
+                    collected,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
 
-        if current["heading"] is not None or current["blocks"]:
-            sections.append(current)
+    @staticmethod
+    def _validators(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build conditional request headers from a cached entry.
+        """
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
 
-        return [s for s in sections if s["heading"] is not None or s["blocks"]]
+    def parse_sections(
+        self,
+        html: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse Grokipedia page HTML into a list of heading/level/blocks sections.
+        """
+        return self.parser.parse(html)
 
     def scrape_page(
         self,
-        page_title: str
+        page_title: str,
+        headings: Optional[List[str]] = None,
+        max_level: Optional[int] = None,
+        max_blocks: Optional[int] = None,
+        max_chars: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Scrape a Grokipedia page and return structured JSON data.
 
         Args:
             page_title: The page title (e.g., "Elon Musk").
+            headings: Only return these sections and their subsections.
+            max_level: Skip sections with a deeper heading level.
+            max_blocks: Maximum number of blocks across all sections.
+            max_chars: Character budget for headings and blocks combined.
 
         Returns:
-            dict with keys: page_title, url, content (list of sections).
+            dict with keys: page_title, url, content (list of sections), plus
+            truncated=True when a block or character budget cut the content.
+
+        Raises:
+            ValueError: If a selection limit is out of range.
         """
         url = f"https://grokipedia.com/page/{page_title.replace(' ', '_')}"
+        selector = SectionSelector(headings, max_level, max_blocks, max_chars)
         try:
-            sections = self.scrape_sections(page_title)
-            return {"page_title": page_title, "url": url, "content": sections}
-        except requests.RequestException as e:
+            sections = self._scrape_sections(page_title, selector)
+            result = {"page_title": page_title, "url": url, "content": sections}
+            if selector.truncated:
+                result["truncated"] = True
+            return result
+        except (requests.RequestException, OSError) as e:
+            # Network, HTTP and cache-directory failures become a per-page error
             return {
                 "page_title": page_title,
                 "url": url,
                 "error": f"Failed to fetch page: {e}",
             }
+
+    def scrape_pages(
+        self,
+        page_titles: List[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape several Grokipedia pages concurrently.
+
+        Pages are fetched over the shared pooled session by at most
+        max_concurrency worker threads, so the total latency approaches that of
+        the slowest page. Titles that normalise to the same page are fetched
+        once.
+
+        Args:
+            page_titles: Page titles (e.g., ["Elon Musk", "SpaceX"]).
+            max_concurrency: Maximum number of pages fetched at the same time.
+
+        Returns:
+            One scrape_page() result per title, in input order. Failed pages
+            carry an "error" key instead of "content".
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        unique: Dict[str, str] = {}
+        for title in page_titles:
+            unique.setdefault(normalize_title(title), title)
+        if not unique:
+            return []
+
+        workers = min(max_concurrency, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = dict(zip(unique, executor.map(self.scrape_page, unique.values())))
+
+        return [
+            {**results[normalize_title(title)], "page_title": title}
+            for title in page_titles
+        ]
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP session.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
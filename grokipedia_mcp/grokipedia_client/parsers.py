@@ -0,0 +1,311 @@
+"""
+Pluggable HTML parser backends for turning Grokipedia pages into sections.
+
+Every backend produces the same list of
+{"heading": ..., "level": ..., "blocks": [...]} sections. The C-accelerated
+backends (selectolax/lexbor, lxml) are used automatically when installed;
+BeautifulSoup with the pure-Python "html.parser" is the fallback.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # pragma: no cover - optional dependency
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
+HEADINGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+# Elements emitted as headings or blocks. Their descendants are never
+# visited, so text nested inside them (a span in a p, a li in a li) is
+# emitted once, as part of the outermost block.
+BLOCKS = frozenset(HEADINGS + ("p", "span", "li"))
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+NON_TEXT = ("script", "style", "template")
+
+
+class SectionBuilder:
+    """
+    Incrementally group (tag name, stripped text) pairs into sections.
+
+    add() returns the previous section once a new heading closes it, so
+    callers can hand sections on before the rest of the page is processed.
+    """
+
+    def __init__(self):
+        self.current = self._start_section()
+
+    @staticmethod
+    def _start_section(
+        heading_text: Optional[str] = None,
+        level: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return {"heading": heading_text, "level": level, "blocks": []}
+
+    @staticmethod
+    def _has_content(section: Dict[str, Any]) -> bool:
+        return section["heading"] is not None or bool(section["blocks"])
+
+    def add(self, name: str, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Add one element; return the section it completes, if any.
+        """
+        if name in HEADINGS:
+            finished = self.current if self._has_content(self.current) else None
+            self.current = self._start_section(text or None, int(name[1]))
+            return finished
+
+        if name == "li":
+            if text:
+                self.current["blocks"].append(f"• {text}")
+        elif name in ("p", "span"):
+            if text:
+                self.current["blocks"].append(text)
+        return None
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the last open section, if it has any content.
+        """
+        finished = self.current if self._has_content(self.current) else None
+        self.current = self._start_section()
+        return finished
+
+
+def group_sections(items: Iterable[Tuple[str, str]]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily group (tag name, stripped text) pairs, in document order, into sections.
+
+    Items are only pulled from the source as sections are requested, so a
+    consumer that stops early also stops the extraction behind it.
+    """
+    builder = SectionBuilder()
+    for name, text in items:
+        finished = builder.add(name, text)
+        if finished is not None:
+            yield finished
+    finished = builder.finish()
+    if finished is not None:
+        yield finished
+
+
+def build_sections(items: Iterable[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Group (tag name, stripped text) pairs, in document order, into sections.
+    """
+    return list(group_sections(items))
+
+
+def iter_blocks(
+    root: Any,
+    children: Callable[[Any], Iterable[Any]],
+    tag_name: Callable[[Any], Optional[str]]
+) -> Iterator[Any]:
+    """
+    Yield the outermost BLOCKS elements under root, in document order.
+
+    Works on any tree through the children() and tag_name() accessors, and
+    uses an explicit stack so deeply nested pages cannot hit the recursion
+    limit.
+
+    Args:
+        root: The content root element.
+        children: Returns a node's child nodes.
+        tag_name: Returns a node's lowercase tag name, or None for text,
+            comments and other non-element nodes.
+    """
+    stack = list(children(root))
+    stack.reverse()
+    while stack:
+        node = stack.pop()
+        name = tag_name(node)
+        if name is None:
+            continue
+        if name in BLOCKS:
+            yield node
+        else:
+            nested = list(children(node))
+            nested.reverse()
+            stack.extend(nested)
+
+
+def _join_text(parts: Iterable[str]) -> str:
+    """
+    Mirror get_text(separator=" ", strip=True): strip each string, drop empties.
+    """
+    return " ".join(t for t in (p.strip() for p in parts) if t)
+
+
+class SoupParser:
+    """
+    Reference backend: BeautifulSoup with the built-in "html.parser".
+    """
+
+    name = "html.parser"
+
+    def iter_items(self, html: str) -> Iterator[Tuple[str, str]]:
+        soup = BeautifulSoup(html, "html.parser")
+        content_root = (
+            soup.find("article")
+            or soup.find("div", {"class": "markdown-body"})
+            or soup.find("div", {"id": "content"})
+            or soup.body
+        )
+        if not content_root:
+            return
+        for el in iter_blocks(content_root, _soup_children, _soup_tag):
+            yield el.name.lower(), el.get_text(separator=" ", strip=True)
+
+    def iter_sections(self, html: str) -> Iterator[Dict[str, Any]]:
+        return group_sections(self.iter_items(html))
+
+    def parse(self, html: str) -> List[Dict[str, Any]]:
+        return build_sections(self.iter_items(html))
+
+
+class LxmlParser:
+    """
+    Backend using lxml's libxml2 HTML parser.
+    """
+
+    name = "lxml"
+
+    def iter_items(self, html: str) -> Iterator[Tuple[str, str]]:
+        try:
+            doc = lxml.html.document_fromstring(html)
+        except etree.ParserError:
+            return
+        # lxml elements with no children are falsy, so test against None
+        content_root = doc.find(".//article")
+        if content_root is None:
+            content_root = _first(doc.xpath(
+                ".//div[contains(concat(' ', normalize-space(@class), ' '), ' markdown-body ')]"
+            ))
+        if content_root is None:
+            content_root = _first(doc.xpath(".//div[@id='content']"))
+        if content_root is None:
+            content_root = doc.find("body")
+        if content_root is None:
+            return
+        for el in iter_blocks(content_root, iter, _lxml_tag):
+            yield el.tag, _join_text(_lxml_strings(el))
+
+    def iter_sections(self, html: str) -> Iterator[Dict[str, Any]]:
+        return group_sections(self.iter_items(html))
+
+    def parse(self, html: str) -> List[Dict[str, Any]]:
+        return build_sections(self.iter_items(html))
+
+
+class SelectolaxParser:
+    """
+    Backend using selectolax's lexbor HTML5 parser.
+    """
+
+    name = "selectolax"
+
+    def iter_items(self, html: str) -> Iterator[Tuple[str, str]]:
+        tree = LexborHTMLParser(html)
+        content_root = (
+            tree.css_first("article")
+            or tree.css_first("div.markdown-body")
+            or tree.css_first("div#content")
+            or tree.body
+        )
+        if content_root is None:
+            return
+        for node in content_root.css(",".join(NON_TEXT)):
+            node.decompose()
+        for node in iter_blocks(content_root, _lexbor_children, _lexbor_tag):
+            yield node.tag, _join_text(
+                child.text_content or ""
+                for child in node.traverse(include_text=True)
+                if child.tag == "-text"
+            )
+
+    def iter_sections(self, html: str) -> Iterator[Dict[str, Any]]:
+        return group_sections(self.iter_items(html))
+
+    def parse(self, html: str) -> List[Dict[str, Any]]:
+        return build_sections(self.iter_items(html))
+
+
+def _first(elements: List[Any]) -> Optional[Any]:
+    return elements[0] if elements else None
+
+
+def _soup_children(el: Any) -> Iterable[Any]:
+    return el.contents
+
+
+def _soup_tag(el: Any) -> Optional[str]:
+    return el.name.lower() if isinstance(el, Tag) else None
+
+
+def _lxml_tag(el: Any) -> Optional[str]:
+    # Comments and processing instructions have a callable tag
+    return el.tag if isinstance(el.tag, str) else None
+
+
+def _lexbor_children(node: Any) -> Iterable[Any]:
+    return node.iter()
+
+
+def _lexbor_tag(node: Any) -> Optional[str]:
+    return None if node.tag.startswith(("-", "_")) else node.tag
+
+
+def _lxml_strings(el: Any) -> Iterator[str]:
+    """
+    Yield the text strings under an lxml element, skipping comments and NON_TEXT.
+
+    Unlike stripping those elements first, this keeps the text on either side
+    of them as separate strings, as BeautifulSoup does.
+    """
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str) and child.tag not in NON_TEXT:
+            yield from _lxml_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+PARSERS = {
+    SelectolaxParser.name: (SelectolaxParser, LexborHTMLParser is not None),
+    LxmlParser.name: (LxmlParser, lxml is not None),
+    SoupParser.name: (SoupParser, True),
+}
+
+
+def available_parsers() -> List[str]:
+    """
+    Return the installed backend names, fastest first.
+    """
+    return [name for name, (_, installed) in PARSERS.items() if installed]
+
+
+def get_parser(name: Optional[str] = None):
+    """
+    Return a parser backend by name, or the fastest installed one if name is None.
+
+    Raises:
+        ValueError: If name is unknown or its library is not installed.
+    """
+    if name is None:
+        name = available_parsers()[0]
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser backend: {name}")
+    parser_cls, installed = PARSERS[name]
+    if not installed:
+        raise ValueError(f"Parser backend {name!r} is not installed")
+    return parser_cls()
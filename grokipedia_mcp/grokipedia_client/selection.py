@@ -0,0 +1,140 @@
+"""
+Section selection and size budgets for scraped Grokipedia pages.
+
+SectionSelector keeps only the requested headings, heading levels, block
+count and character budget. It consumes sections lazily and stops at the
+first section it no longer needs, so paired with a streamed page (see
+GrokipediaScraper.iter_sections) the rest of the download is skipped.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from .cache import normalize_title
+
+
+class SectionSelector:
+    """
+    Pick and truncate sections to keep scraped payloads small.
+
+    Criteria are applied in document order while sections are consumed, and
+    consumption stops as soon as the result is complete, so a lazy section
+    source is never read further than needed.
+    """
+
+    def __init__(
+        self,
+        headings: Optional[List[str]] = None,
+        max_level: Optional[int] = None,
+        max_blocks: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ):
+        """
+        Args:
+            headings: Only return sections with these headings (matched
+                case-insensitively) together with their subsections.
+            max_level: Drop sections whose heading level is deeper than this;
+                max_level=1 keeps only the lead of a typical article.
+            max_blocks: Maximum number of blocks returned across all sections.
+            max_chars: Character budget for headings and blocks combined; the
+                block that crosses it is cut short. Roughly 4 characters per
+                LLM token.
+
+        Raises:
+            ValueError: If a limit is out of range.
+        """
+        if max_level is not None and not 1 <= max_level <= 6:
+            raise ValueError("max_level must be between 1 and 6")
+        if max_blocks is not None and max_blocks < 0:
+            raise ValueError("max_blocks must not be negative")
+        if max_chars is not None and max_chars < 0:
+            raise ValueError("max_chars must not be negative")
+        self.headings = (
+            {self._key(h) for h in headings} if headings is not None else None
+        )
+        self.max_level = max_level
+        self.max_blocks = max_blocks
+        self.max_chars = max_chars
+        self.truncated = False
+
+    @property
+    def may_stop_early(self) -> bool:
+        """
+        True if a heading filter or budget can end selection before the last section.
+        """
+        return (
+            self.headings is not None
+            or self.max_blocks is not None
+            or self.max_chars is not None
+        )
+
+    @staticmethod
+    def _key(heading: Optional[str]) -> str:
+        return normalize_title(heading or "").casefold()
+
+    def select(self, sections: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return the selected sections; sets truncated if a budget cut content.
+        """
+        self.truncated = False
+        selected: List[Dict[str, Any]] = []
+        found = set()
+        subtree_level: Optional[int] = None
+        blocks_left = self.max_blocks
+        chars_left = self.max_chars
+
+        for section in sections:
+            level = section["level"]
+
+            if self.headings is not None:
+                key = self._key(section["heading"])
+                in_subtree = (
+                    subtree_level is not None
+                    and level is not None
+                    and level > subtree_level
+                )
+                if not in_subtree:
+                    if key in self.headings and section["heading"] is not None:
+                        found.add(key)
+                        subtree_level = level
+                    else:
+                        subtree_level = None
+                        if found == self.headings:
+                            break
+                        continue
+
+            if self.max_level is not None and level is not None and level > self.max_level:
+                continue
+
+            if blocks_left == 0 or chars_left == 0:
+                self.truncated = True
+                break
+
+            heading = section["heading"]
+            if chars_left is not None and heading:
+                if len(heading) > chars_left:
+                    self.truncated = True
+                    break
+                chars_left -= len(heading)
+
+            blocks: List[str] = []
+            for block in section["blocks"]:
+                if blocks_left == 0:
+                    self.truncated = True
+                    break
+                if chars_left is not None and len(block) > chars_left:
+                    if chars_left:
+                        blocks.append(block[:chars_left].rstrip())
+                    chars_left = 0
+                    self.truncated = True
+                    break
+                blocks.append(block)
+                if blocks_left is not None:
+                    blocks_left -= 1
+                if chars_left is not None:
+                    chars_left -= len(block)
+
+            selected.append({"heading": heading, "level": level, "blocks": blocks})
+            if self.truncated:
+                break
+
+        return selected
@@ -0,0 +1,205 @@
+"""
+Single-pass, event-driven section extraction for Grokipedia pages.
+
+StreamingSectionParser is fed the page HTML in chunks as it downloads and
+hands back each section as soon as the next heading closes it. No document
+tree is built: only the currently open elements and the text of the block
+still being read are held in memory.
+"""
+
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+from .parsers import BLOCKS, NON_TEXT, SectionBuilder, _join_text
+
+# Elements that never have an end tag
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+
+
+class _Block:
+    """
+    A block element whose text is still being collected.
+    """
+
+    __slots__ = ("name", "parts")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.parts: List[str] = []
+
+
+class _Open:
+    """
+    An entry on the stack of currently open elements.
+    """
+
+    __slots__ = ("name", "block", "is_root", "is_body")
+
+    def __init__(self, name: str, block: Optional[_Block], is_root: bool, is_body: bool):
+        self.name = name
+        self.block = block
+        self.is_root = is_root
+        self.is_body = is_body
+
+
+class StreamingSectionParser(HTMLParser):
+    """
+    Incremental HTML-to-sections parser built on the standard library tokenizer.
+
+    Produces the same sections as the html.parser backend, with one
+    difference: the content root is the first <article>, div.markdown-body or
+    div#content encountered, rather than the best match in the whole
+    document. Pages with none of these fall back to <body>; their sections
+    are only released once the page has been fully read.
+
+    Usage:
+        parser = StreamingSectionParser()
+        for chunk in chunks:
+            for section in parser.feed(chunk):
+                ...
+        for section in parser.close():
+            ...
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._stack: List[_Open] = []
+        self._text: List[str] = []
+        self._block: Optional[_Block] = None
+        self._builder = SectionBuilder()
+        self._ready: List[Dict[str, Any]] = []
+        self._fallback: Optional[List[Dict[str, Any]]] = []
+        self._root_found = False
+        self._root_closed = False
+        self._skip_depth = 0
+
+    def feed(self, data: str) -> List[Dict[str, Any]]:
+        """
+        Feed the next chunk of HTML and return any sections it completed.
+        """
+        super().feed(data)
+        return self._take_ready()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        Finish parsing and return the remaining sections.
+        """
+        super().close()
+        self._flush_text()
+        while self._stack:
+            self._pop()
+        finished = self._builder.finish()
+        if finished is not None:
+            self._emit(finished)
+        if self._fallback is not None:
+            self._ready.extend(self._fallback)
+            self._fallback = None
+        return self._take_ready()
+
+    # HTMLParser callbacks
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        self._flush_text()
+        if tag in VOID_ELEMENTS:
+            return
+        collecting = self._collecting()
+        is_root = not self._root_found and self._is_root(tag, attrs)
+        if is_root:
+            self._start_root()
+            collecting = True
+
+        block = None
+        if collecting and tag in BLOCKS and self._block is None:
+            block = self._block = _Block(tag)
+        if tag in NON_TEXT:
+            self._skip_depth += 1
+        self._stack.append(_Open(tag, block, is_root, tag == "body"))
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        self._flush_text()
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index].name == tag:
+                while len(self._stack) > index:
+                    self._pop()
+                return
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._text.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush_text()
+
+    # Internals
+
+    @staticmethod
+    def _is_root(tag: str, attrs) -> bool:
+        if tag == "article":
+            return True
+        if tag != "div":
+            return False
+        attributes = dict(attrs)
+        return (
+            "markdown-body" in (attributes.get("class") or "").split()
+            or attributes.get("id") == "content"
+        )
+
+    def _collecting(self) -> bool:
+        """
+        True while inside the content root, or inside <body> before any root.
+        """
+        if self._root_found:
+            return not self._root_closed and any(o.is_root for o in self._stack)
+        return any(o.is_body for o in self._stack)
+
+    def _start_root(self) -> None:
+        """
+        Drop everything collected from <body> so far; the root takes over.
+        """
+        self._root_found = True
+        self._fallback = None
+        self._block = None
+        self._builder = SectionBuilder()
+        for entry in self._stack:
+            entry.block = None
+
+    def _flush_text(self) -> None:
+        """
+        Hand the text read since the last tag to the open block, if any.
+
+        The tokenizer may split one text node across several handle_data
+        calls, so pieces are joined before being treated as a single string.
+        """
+        if not self._text:
+            return
+        if self._block is not None:
+            self._block.parts.append("".join(self._text))
+        self._text = []
+
+    def _pop(self) -> None:
+        entry = self._stack.pop()
+        if entry.name in NON_TEXT:
+            self._skip_depth -= 1
+        if entry.is_root:
+            self._root_closed = True
+        if entry.block is not None:
+            self._block = None
+            finished = self._builder.add(entry.block.name, _join_text(entry.block.parts))
+            if finished is not None:
+                self._emit(finished)
+
+    def _emit(self, section: Dict[str, Any]) -> None:
+        if self._root_found:
+            self._ready.append(section)
+        else:
+            self._fallback.append(section)
+
+    def _take_ready(self) -> List[Dict[str, Any]]:
+        ready, self._ready = self._ready, []
+        return ready
@@ -1,26 +1,60 @@
+from typing import Optional
+
 from fastmcp import FastMCP
 
-from grokipedia_client import GrokipediaScraper
+from grokipedia_client import GrokipediaScraper, PageCache
 
 mcp = FastMCP("grokipedia")
 
-_scraper = GrokipediaScraper()
+# Upper bound for scrape_grokipedia_pages, matching the session's pool size
+MAX_CONCURRENCY = 16
+
+_scraper = GrokipediaScraper(cache=PageCache())
 
 
 @mcp.tool
 def scrape_grokipedia(
-    page_title: str
+    page_title: str,
+    headings: Optional[list[str]] = None,
+    max_level: Optional[int] = None,
+    max_blocks: Optional[int] = None,
+    max_chars: Optional[int] = None
 ) -> dict:
     """
     Scrape a Grokipedia page and return structured JSON.
 
     Args:
         page_title: The page title (e.g., "Elon Musk").
+        headings: Only return sections with these headings, plus their subsections.
+        max_level: Skip sections below this heading level (1 keeps only the lead).
+        max_blocks: Maximum number of text blocks to return.
+        max_chars: Character budget for the returned text (about 4 per token).
+
+    Returns:
+        dict with keys: page_title, url, content (list of sections), and
+        truncated=True if a budget cut the content short.
+    """
+    return _scraper.scrape_page(page_title, headings, max_level, max_blocks, max_chars)
+
+
+@mcp.tool
+def scrape_grokipedia_pages(
+    page_titles: list[str],
+    max_concurrency: int = 8
+) -> dict:
+    """
+    Scrape several Grokipedia pages concurrently and return structured JSON.
+
+    Args:
+        page_titles: Page titles (e.g., ["Elon Musk", "SpaceX"]).
+        max_concurrency: Maximum number of pages fetched at the same time (1-16).
 
     Returns:
-        dict with keys: page_title, url, content (list of sections).
+        dict with key pages: one result per title, in order. Each has
+        page_title and url, plus content on success or error on failure.
     """
-    return _scraper.scrape_page(page_title)
+    max_concurrency = max(1, min(max_concurrency, MAX_CONCURRENCY))
+    return {"pages": _scraper.scrape_pages(page_titles, max_concurrency)}
 
 
 if __name__ == "__main__":
@@ -1,7 +1,14 @@
+import os
+import threading
+import time
+
 import pytest
-from unittest.mock import Mock, patch
+import requests
+from unittest.mock import MagicMock, Mock, patch
 
+from grokipedia_client.cache import PageCache
 from grokipedia_client.client import GrokipediaScraper
+from grokipedia_client.selection import SectionSelector
 
 
 class TestGrokipediaScraper:
@@ -9,7 +16,7 @@ class TestGrokipediaScraper:
 
     def test_scrape_sections_success(self, sample_html):
         """Test successful scraping of sections from HTML."""
-        with patch("grokipedia_client.client.requests.get") as mock_get:
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.text = sample_html
             mock_response.raise_for_status.return_value = None
@@ -39,7 +46,7 @@ class TestGrokipediaScraper:
 
     def test_scrape_sections_no_content(self):
         """Test scraping with no content found."""
-        with patch("grokipedia_client.client.requests.get") as mock_get:
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.text = "<html><body>No content here</body></html>"
             mock_response.raise_for_status.return_value = None
@@ -52,7 +59,7 @@ class TestGrokipediaScraper:
 
     def test_scrape_sections_http_error(self):
         """Test error handling for HTTP failures."""
-        with patch("grokipedia_client.client.requests.get") as mock_get:
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
             mock_get.side_effect = Exception("HTTP 404: Not Found")
 
             scraper = GrokipediaScraper()
@@ -62,7 +69,7 @@ class TestGrokipediaScraper:
 
     def test_scrape_page_success(self, sample_html):
         """Test successful page scraping with structured return."""
-        with patch("grokipedia_client.client.requests.get") as mock_get:
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.text = sample_html
             mock_response.raise_for_status.return_value = None
@@ -79,8 +86,8 @@ class TestGrokipediaScraper:
 
     def test_scrape_page_http_error(self):
         """Test scrape_page error handling."""
-        with patch("grokipedia_client.client.requests.get") as mock_get:
-            mock_get.side_effect = Exception("Network error")
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.side_effect = requests.ConnectionError("Network error")
 
             scraper = GrokipediaScraper()
             result = scraper.scrape_page("Test Page")
@@ -91,12 +98,20 @@ class TestGrokipediaScraper:
             assert "Network error" in result["error"]
             assert "content" not in result
 
+    def test_scrape_page_does_not_hide_programming_errors(self):
+        """Test that unexpected exceptions are not turned into error results."""
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.side_effect = TypeError("bad call")
+
+            with pytest.raises(TypeError, match="bad call"):
+                GrokipediaScraper().scrape_page("Test Page")
+
     def test_url_formatting(self):
         """Test that page titles are properly URL-encoded."""
         scraper = GrokipediaScraper()
 
         # Test spaces converted to underscores
-        with patch("grokipedia_client.client.requests.get") as mock_get:
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
             mock_get.side_effect = Exception("Expected error")
             try:
                 scraper.scrape_sections("Test Page")
@@ -123,7 +138,7 @@ class TestGrokipediaScraper:
         </html>
         """
 
-        with patch("grokipedia_client.client.requests.get") as mock_get:
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.text = test_html
             mock_response.raise_for_status.return_value = None
@@ -136,3 +151,320 @@ class TestGrokipediaScraper:
             section = sections[0]
             assert section["heading"] == "Main Section"
             assert len(section["blocks"]) == 3  # p, span, li content
+
+
+class TestPageCache:
+    """Test cases for the on-disk Grokipedia page cache."""
+
+    @staticmethod
+    def _response(html, status_code=200, headers=None):
+        response = Mock()
+        response.text = html
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.raise_for_status.return_value = None
+        return response
+
+    def test_fresh_entry_skips_network(self, tmp_path, sample_html):
+        """Test that a fresh cached page is served without fetching."""
+        scraper = GrokipediaScraper(cache=PageCache(str(tmp_path)))
+
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.return_value = self._response(sample_html, headers={"ETag": '"v1"'})
+            first = scraper.scrape_sections("Test Page")
+            second = scraper.scrape_sections("Test_Page")
+
+        assert first == second
+        mock_get.assert_called_once()
+
+    def test_stale_entry_revalidates_with_validators(self, tmp_path, sample_html):
+        """Test that expired entries send If-None-Match and reuse sections on 304."""
+        cache = PageCache(str(tmp_path), max_age=0)
+        scraper = GrokipediaScraper(cache=cache)
+        validators = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"}
+
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.return_value = self._response(sample_html, headers=validators)
+            first = scraper.scrape_sections("Test Page")
+
+            mock_get.return_value = self._response("", status_code=304)
+            with patch.object(scraper, "parse_sections") as mock_parse:
+                second = scraper.scrape_sections("Test Page")
+
+        assert second == first
+        mock_parse.assert_not_called()
+        headers = mock_get.call_args[1]["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == validators["Last-Modified"]
+
+    def test_size_cap_evicts_least_recently_used(self, tmp_path):
+        """Test that the oldest pages are removed once max_bytes is exceeded."""
+        cache = PageCache(str(tmp_path), max_bytes=600)
+        sections = [{"heading": "H", "level": 2, "blocks": ["x" * 200]}]
+
+        cache.set("First", sections)
+        os.utime(cache._path("First"), (1, 1))
+        cache.set("Second", sections)
+        cache.set("Third", sections)
+
+        assert cache.get("First") is None
+        assert cache.get("Third")["sections"] == sections
+
+
+class TestIterSections:
+    """Test cases for streaming section extraction."""
+
+    @staticmethod
+    def _response(chunks, headers=None):
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response.headers = headers or {}
+        response.iter_content.return_value = iter(chunks)
+        return response
+
+    def test_sections_match_scrape_sections(self, sample_html):
+        """Test that streamed sections equal the buffered result."""
+        scraper = GrokipediaScraper(parser="html.parser")
+        data = sample_html.encode("utf-8")
+        chunks = [data[i:i + 10] for i in range(0, len(data), 10)]
+
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.return_value = self._response(chunks)
+            streamed = list(scraper.iter_sections("Test Page"))
+
+        assert streamed == scraper.parse_sections(sample_html)
+        assert mock_get.call_args[1]["stream"] is True
+
+    def test_first_section_before_download_finishes(self):
+        """Test that sections are yielded while the body is still arriving."""
+        scraper = GrokipediaScraper()
+        consumed = []
+
+        def chunks():
+            for chunk in (b"<html><body><article><h2>A</h2><p>x</p>", b"<h2>B</h2>",
+                          b"<p>y</p></article></body></html>"):
+                consumed.append(chunk)
+                yield chunk
+
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.return_value = self._response(chunks())
+            sections = scraper.iter_sections("Test Page")
+            first = next(sections)
+
+            assert first == {"heading": "A", "level": 2, "blocks": ["x"]}
+            assert len(consumed) == 2
+            assert list(sections) == [{"heading": "B", "level": 2, "blocks": ["y"]}]
+
+    def test_multibyte_characters_split_across_chunks(self):
+        """Test that UTF-8 sequences split between chunks are decoded intact."""
+        scraper = GrokipediaScraper()
+        data = "<html><body><article><h2>Café</h2></article></body></html>".encode("utf-8")
+        split = data.index("é".encode("utf-8")) + 1
+
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.return_value = self._response([data[:split], data[split:]])
+            sections = list(scraper.iter_sections("Test Page"))
+
+        assert sections == [{"heading": "Café", "level": 2, "blocks": []}]
+
+    def test_streamed_page_is_cached(self, tmp_path, sample_html):
+        """Test that a fully streamed page is stored in the page cache."""
+        scraper = GrokipediaScraper(cache=PageCache(str(tmp_path)))
+
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.return_value = self._response([sample_html.encode("utf-8")])
+            streamed = list(scraper.iter_sections("Test Page"))
+            again = list(scraper.iter_sections("Test Page"))
+
+        assert again == streamed
+        mock_get.assert_called_once()
+
+    def test_cached_selection_stops_download_early(self, tmp_path):
+        """Test that a selection on a cache miss streams and skips the rest of the page."""
+        scraper = GrokipediaScraper(cache=PageCache(str(tmp_path)))
+        consumed = []
+
+        def chunks():
+            for chunk in (b"<html><body><article><h2>A</h2><p>x</p>", b"<h2>B</h2><p>y</p>",
+                          b"<h2>C</h2>", b"<p>z</p>", b"<h2>D</h2></article></body></html>"):
+                consumed.append(chunk)
+                yield chunk
+
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.return_value = self._response(chunks())
+            result = scraper.scrape_page("Test Page", headings=["A"])
+
+        assert result["content"] == [{"heading": "A", "level": 2, "blocks": ["x"]}]
+        assert mock_get.call_args[1]["stream"] is True
+        # Section B, which ends the selection, is complete once C's heading arrives
+        assert len(consumed) == 3
+        # Streamed selections never fill the cache, even when read in full
+        assert scraper.cache.get("Test Page") is None
+
+    def test_cached_selection_reading_whole_page_is_not_cached(self, tmp_path, sample_html):
+        """Test that only the configured parser backend fills the page cache."""
+        scraper = GrokipediaScraper(cache=PageCache(str(tmp_path)), parser="html.parser")
+
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.return_value = self._response([sample_html.encode("utf-8")])
+            scraper.scrape_page("Test Page", max_chars=10 ** 6)
+
+        assert scraper.cache.get("Test Page") is None
+
+
+class TestScrapePages:
+    """Test cases for concurrent batch scraping."""
+
+    @staticmethod
+    def _response(html):
+        response = Mock()
+        response.text = html
+        response.raise_for_status.return_value = None
+        return response
+
+    def test_results_in_input_order_with_errors(self, sample_html):
+        """Test that each title gets its own result or error, in order."""
+        scraper = GrokipediaScraper()
+
+        def fake_get(url, **kwargs):
+            if url.endswith("Missing"):
+                raise requests.HTTPError("HTTP 404: Not Found")
+            return self._response(sample_html)
+
+        with patch("grokipedia_client.client.requests.Session.get", side_effect=fake_get):
+            results = scraper.scrape_pages(["First", "Missing", "Second"])
+
+        assert [r["page_title"] for r in results] == ["First", "Missing", "Second"]
+        assert results[0]["content"] == results[2]["content"]
+        assert "HTTP 404" in results[1]["error"]
+        assert "content" not in results[1]
+
+    def test_pages_fetched_concurrently(self, sample_html):
+        """Test that total latency approaches the slowest page, not the sum."""
+        scraper = GrokipediaScraper()
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_get(url, **kwargs):
+            with lock:
+                active.append(url)
+                peak.append(len(active))
+            time.sleep(0.2)
+            with lock:
+                active.remove(url)
+            return self._response(sample_html)
+
+        titles = [f"Page {i}" for i in range(6)]
+        with patch("grokipedia_client.client.requests.Session.get", side_effect=slow_get):
+            start = time.perf_counter()
+            results = scraper.scrape_pages(titles, max_concurrency=3)
+            elapsed = time.perf_counter() - start
+
+        assert len(results) == 6
+        assert max(peak) == 3
+        assert elapsed < 0.2 * 6 / 2
+
+    def test_duplicate_titles_fetched_once(self, sample_html):
+        """Test that titles naming the same page share one fetch."""
+        scraper = GrokipediaScraper()
+
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_get.return_value = self._response(sample_html)
+            results = scraper.scrape_pages(["Elon Musk", "Elon_Musk"])
+
+        mock_get.assert_called_once()
+        assert [r["page_title"] for r in results] == ["Elon Musk", "Elon_Musk"]
+
+    def test_invalid_concurrency(self):
+        """Test that a concurrency limit below one is rejected."""
+        with pytest.raises(ValueError):
+            GrokipediaScraper().scrape_pages(["Test"], max_concurrency=0)
+
+
+class TestSectionSelector:
+    """Test cases for section selection and truncation."""
+
+    SECTIONS = [
+        {"heading": "Title", "level": 1, "blocks": ["Lead paragraph."]},
+        {"heading": "Early life", "level": 2, "blocks": ["Born.", "Grew up."]},
+        {"heading": "Education", "level": 3, "blocks": ["School."]},
+        {"heading": "Career", "level": 2, "blocks": ["Worked."]},
+        {"heading": "Legacy", "level": 2, "blocks": ["Remembered."]},
+    ]
+
+    def test_no_criteria_returns_everything(self):
+        """Test that an empty selector keeps every section."""
+        selector = SectionSelector()
+        assert selector.select(self.SECTIONS) == self.SECTIONS
+        assert selector.truncated is False
+
+    def test_headings_include_subsections(self):
+        """Test that a selected heading brings its deeper subsections along."""
+        selected = SectionSelector(headings=["early  LIFE"]).select(self.SECTIONS)
+        assert [s["heading"] for s in selected] == ["Early life", "Education"]
+
+    def test_max_level_keeps_lead(self):
+        """Test that max_level=1 returns only the lead section."""
+        selected = SectionSelector(max_level=1).select(self.SECTIONS)
+        assert selected == self.SECTIONS[:1]
+
+    def test_max_blocks_truncates(self):
+        """Test that the block budget cuts across sections."""
+        selector = SectionSelector(max_blocks=2)
+        selected = selector.select(self.SECTIONS)
+        assert [s["blocks"] for s in selected] == [["Lead paragraph."], ["Born."]]
+        assert selector.truncated is True
+
+    def test_max_chars_cuts_block(self):
+        """Test that the character budget counts headings and cuts the last block."""
+        selector = SectionSelector(max_chars=len("Title") + 4)
+        assert selector.select(self.SECTIONS) == [
+            {"heading": "Title", "level": 1, "blocks": ["Lead"]}
+        ]
+        assert selector.truncated is True
+
+    def test_budget_met_exactly_is_not_truncated(self):
+        """Test that using the whole budget on the last block is not a truncation."""
+        selector = SectionSelector(headings=["Legacy"], max_blocks=1)
+        assert selector.select(self.SECTIONS)[0]["blocks"] == ["Remembered."]
+        assert selector.truncated is False
+
+    def test_stops_consuming_early(self):
+        """Test that a lazy source is not read past the selected content."""
+        consumed = []
+
+        def source():
+            for section in self.SECTIONS:
+                consumed.append(section["heading"])
+                yield section
+
+        SectionSelector(headings=["Early life"]).select(source())
+        assert consumed == ["Title", "Early life", "Education", "Career"]
+
+    def test_invalid_limits(self):
+        """Test that out-of-range limits are rejected."""
+        with pytest.raises(ValueError):
+            SectionSelector(max_level=7)
+        with pytest.raises(ValueError):
+            SectionSelector(max_chars=-1)
+
+    def test_scrape_page_reports_truncation(self, sample_html):
+        """Test that scrape_page applies the selection and flags truncation."""
+        with patch("grokipedia_client.client.requests.Session.get") as mock_get:
+            mock_response = Mock()
+            mock_response.text = sample_html
+            mock_response.raise_for_status.return_value = None
+            mock_get.return_value = mock_response
+
+            scraper = GrokipediaScraper()
+            result = scraper.scrape_page("Test Page", headings=["Section 1"], max_blocks=2)
+
+        assert result["content"] == [{
+            "heading": "Section 1",
+            "level": 2,
+            "blocks": ["Content for section 1.", "• Bullet point 1"],
+        }]
+        assert result["truncated"] is True
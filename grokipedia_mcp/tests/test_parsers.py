@@ -0,0 +1,149 @@
+import pytest
+
+from grokipedia_client.parsers import (
+    SoupParser,
+    available_parsers,
+    get_parser,
+)
+from grokipedia_client.streaming import StreamingSectionParser
+
+FAST_PARSERS = [name for name in available_parsers() if name != SoupParser.name]
+
+PAGES = {
+    "article": """
+        <html><body><nav><p>Skip me</p></nav>
+        <article>
+            <h1>Title</h1>
+            <p>Lead with <a href="#">a link</a> and <b>bold <i>nested</i></b> text.</p>
+            <h2>Section</h2>
+            <p>First <span>inline span</span> paragraph.</p>
+            <ul><li>One</li><li>Two <ul><li>Two-a</li></ul></li></ul>
+            <ol><li>Ordered</li></ol>
+            <h3><span>Styled</span> heading</h3>
+            <p>Last.</p>
+        </article></body></html>
+    """,
+    "markdown_body": """
+        <html><body>
+        <div class="prose markdown-body wide"><h2>Main</h2><p>Body text.</p></div>
+        <div id="content"><h2>Ignored</h2></div>
+        </body></html>
+    """,
+    "content_div": """
+        <html><body><div id="content"><h2>Main Section</h2><p>Regular paragraph</p>
+        <span>Span content</span><ul><li>List item 1</li></ul></div></body></html>
+    """,
+    "body_fallback": "<html><body><h4>Only body</h4><p>Text</p></body></html>",
+    "noise": """
+        <html><body><article>
+            <h2>Noise</h2>
+            <p>Keep <!-- comment --> this<script>var dropped = 1;</script>
+               <style>.x { color: red }</style> text</p>
+            <p>   </p>
+            <p>Entities &amp; non&nbsp;breaking&nbsp;spaces&hellip;</p>
+            <h3></h3>
+            <li>Orphan item</li>
+        </article></body></html>
+    """,
+    "leading_blocks": "<html><body><article><p>Before any heading</p><h2>After</h2></article></body></html>",
+    "empty": "<html><body>No content here</body></html>",
+}
+
+
+@pytest.fixture(params=FAST_PARSERS or [pytest.param(None, marks=pytest.mark.skip("no fast parser installed"))])
+def fast_parser(request):
+    """Each installed C-accelerated parser backend."""
+    return get_parser(request.param)
+
+
+@pytest.mark.parametrize("page", sorted(PAGES))
+def test_fast_parser_matches_reference(fast_parser, page):
+    """Fast backends must produce exactly the html.parser output."""
+    expected = SoupParser().parse(PAGES[page])
+
+    assert fast_parser.parse(PAGES[page]) == expected
+
+
+def test_fast_parser_matches_reference_on_sample(fast_parser, sample_html):
+    """Fast backends must match the reference on the shared sample page."""
+    assert fast_parser.parse(sample_html) == SoupParser().parse(sample_html)
+
+
+@pytest.mark.parametrize("name", available_parsers())
+def test_nested_text_emitted_once(name):
+    """Text inside a block is not re-emitted for nested spans, links or list items."""
+    html = """
+        <html><body><article>
+            <h2><span>Styled</span> heading</h2>
+            <p>Intro with <span>an inline span</span> and <a href="#"><span>a link</span></a>.</p>
+            <ul><li>Outer <ul><li>Inner</li></ul></li></ul>
+            <div><span>Loose span</span></div>
+        </article></body></html>
+    """
+
+    assert get_parser(name).parse(html) == [{
+        "heading": "Styled heading",
+        "level": 2,
+        "blocks": [
+            "Intro with an inline span and a link .",
+            "• Outer Inner",
+            "Loose span",
+        ],
+    }]
+
+
+def test_deeply_nested_page_does_not_recurse():
+    """The block walker copes with nesting deeper than the recursion limit."""
+    html = "<html><body><article>" + "<div>" * 5000 + "<p>Deep</p>" + "</div>" * 5000
+    html += "</article></body></html>"
+
+    assert SoupParser().parse(html) == [{"heading": None, "level": None, "blocks": ["Deep"]}]
+
+
+def test_default_parser_prefers_fast_backend():
+    """The fastest installed backend is chosen when none is requested."""
+    assert get_parser().name == available_parsers()[0]
+    assert available_parsers()[-1] == SoupParser.name
+
+
+def test_unknown_parser_raises():
+    """Unknown backend names are rejected."""
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        get_parser("regex")
+
+
+def _stream(html, chunk_size):
+    parser = StreamingSectionParser()
+    sections = []
+    for start in range(0, len(html), chunk_size):
+        sections.extend(parser.feed(html[start:start + chunk_size]))
+    return sections + parser.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+@pytest.mark.parametrize("page", sorted(PAGES))
+def test_streaming_parser_matches_reference(page, chunk_size):
+    """The streaming parser must match html.parser however the input is split."""
+    assert _stream(PAGES[page], chunk_size) == SoupParser().parse(PAGES[page])
+
+
+def test_streaming_parser_emits_sections_early():
+    """A section is released as soon as the next heading closes it."""
+    parser = StreamingSectionParser()
+
+    assert parser.feed("<html><body><article><h2>One</h2><p>First</p>") == []
+    assert parser.feed("<h2>Two</h2>") == [
+        {"heading": "One", "level": 2, "blocks": ["First"]}
+    ]
+    assert parser.close() == [{"heading": "Two", "level": 2, "blocks": []}]
+
+
+def test_streaming_parser_uses_first_content_root():
+    """Unlike the tree parsers, streaming commits to the first content root."""
+    html = (
+        '<html><body><div id="content"><h2>Outer</h2>'
+        "<article><h2>Inner</h2></article></div></body></html>"
+    )
+
+    assert [s["heading"] for s in _stream(html, 16)] == ["Outer", "Inner"]
+    assert [s["heading"] for s in SoupParser().parse(html)] == ["Inner"]
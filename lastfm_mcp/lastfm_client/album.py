@@ -1,5 +1,5 @@
 from typing import Optional
-from .base import LastfmAPIBase
+from .base import AsyncLastfmAPIBase, LastfmAPIBase
 
 
 class AlbumAPI(LastfmAPIBase):
@@ -171,3 +171,7 @@ class AlbumAPI(LastfmAPIBase):
         if page is not None:
             p["page"] = page
         return self._request("album.search", p)
+
+
+class AsyncAlbumAPI(AsyncLastfmAPIBase, AlbumAPI):
+    """Async API client for album-related Last.fm operations."""
@@ -1,5 +1,5 @@
 from typing import Optional
-from .base import LastfmAPIBase
+from .base import AsyncLastfmAPIBase, LastfmAPIBase
 
 
 class ArtistAPI(LastfmAPIBase):
@@ -222,6 +222,36 @@ class ArtistAPI(LastfmAPIBase):
             p["limit"] = limit
         return self._request("artist.gettoptracks", p)
 
+    def iter_top_tracks(
+        self,
+        artist: Optional[str] = None,
+        mbid: Optional[str] = None,
+        autocorrect: Optional[int] = None,
+        limit: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ):
+        """Iterate over an artist's top tracks across all pages.
+
+        Args:
+            artist: The artist name.
+            mbid: MusicBrainz ID.
+            autocorrect: Whether to autocorrect misspelled artist names (0 or 1).
+            limit: Number of results per page.
+            max_pages: Stop after this many pages. If None, read them all.
+            prefetch: Whether to fetch the next page ahead of time.
+
+        Returns:
+            Iterator of track dicts (async iterator on AsyncArtistAPI).
+        """
+        return self._paginate(
+            lambda page: self.get_top_tracks(artist, mbid, autocorrect, page, limit),
+            "toptracks",
+            "track",
+            max_pages=max_pages,
+            prefetch=prefetch,
+        )
+
     def remove_tag(
         self,
         artist: str,
@@ -265,3 +295,7 @@ class ArtistAPI(LastfmAPIBase):
         if page is not None:
             p["page"] = page
         return self._request("artist.search", p)
+
+
+class AsyncArtistAPI(AsyncLastfmAPIBase, ArtistAPI):
+    """Async API client for artist-related Last.fm operations."""
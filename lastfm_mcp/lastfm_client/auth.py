@@ -1,4 +1,4 @@
-from .base import LastfmAPIBase
+from .base import AsyncLastfmAPIBase, LastfmAPIBase
 
 
 class AuthAPI(LastfmAPIBase):
@@ -42,3 +42,7 @@ class AuthAPI(LastfmAPIBase):
             Dict containing an unauthorized token for authentication flow.
         """
         return self._request("auth.gettoken", {})
+
+
+class AsyncAuthAPI(AsyncLastfmAPIBase, AuthAPI):
+    """Async API client for Last.fm authentication operations."""
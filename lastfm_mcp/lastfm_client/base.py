@@ -1,10 +1,78 @@
 import hashlib
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import ResponseCache, canonical_key
+from .pagination import aiter_pages, iter_pages
+from .ratelimit import TokenBucket
+from .singleflight import SingleFlight
 
 BASE_URL = "https://ws.audioscrobbler.com/2.0/"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_ASYNC_POOL_SIZE = 100
+DEFAULT_MAX_RETRIES = 3
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+def create_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> requests.Session:
+    """Create a keep-alive HTTP session with a pooled, retrying adapter.
+
+    Only idempotent methods (GET) are retried; signed POSTs such as scrobbles
+    are never replayed automatically.
+
+    Args:
+        pool_size: Maximum number of connections kept open to the Last.fm host.
+        max_retries: Number of retries for connection errors and 5xx responses.
+
+    Returns:
+        A configured requests.Session that is safe to share between sub-APIs.
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_async_client(
+    pool_size: int = DEFAULT_ASYNC_POOL_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> httpx.AsyncClient:
+    """Create a keep-alive async HTTP client for concurrent Last.fm calls.
+
+    Args:
+        pool_size: Maximum number of concurrent connections to the Last.fm host.
+        max_retries: Number of retries for failed connection attempts.
+
+    Returns:
+        A configured httpx.AsyncClient that is safe to share between sub-APIs.
+    """
+    limits = httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+    )
+    transport = httpx.AsyncHTTPTransport(limits=limits, retries=max_retries)
+    return httpx.AsyncClient(transport=transport, timeout=30)
 
 
 class LastfmAPIBase:
@@ -18,6 +86,10 @@ class LastfmAPIBase:
         api_key: Optional[str] = None,
         api_secret: Optional[str] = None,
         session_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        singleflight: Optional[SingleFlight] = None,
     ):
         """Initialize the base API client.
 
@@ -25,6 +97,12 @@ class LastfmAPIBase:
             api_key: Last.fm API key. If None, reads from LASTFM_API_KEY environment variable.
             api_secret: Last.fm API secret. If None, reads from LASTFM_API_SECRET environment variable.
             session_key: User session key. If None, reads from LASTFM_SESSION_KEY environment variable.
+            session: Pooled HTTP session to send requests through. If None, a new one is created.
+            cache: Response cache for idempotent GET methods. If None, responses are not cached.
+            rate_limiter: Token bucket every request waits on; share one between
+                sub-APIs using the same key. If None, requests are not rate limited.
+            singleflight: In-flight table that lets identical concurrent GETs share
+                one request. If None, every call goes to the network.
 
         Raises:
             RuntimeError: If api_key is not provided via parameter or environment variable.
@@ -36,6 +114,18 @@ class LastfmAPIBase:
         if not self.api_key:
             raise RuntimeError("LASTFM_API_KEY is required")
 
+        self._session = session
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.singleflight = singleflight
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session used for requests, created on first use."""
+        if self._session is None:
+            self._session = create_session()
+        return self._session
+
     def _signature(
         self,
         params: Dict[str, Any]
@@ -49,20 +139,16 @@ class LastfmAPIBase:
         raw = "".join(pieces) + self.api_secret
         return hashlib.md5(raw.encode("utf-8")).hexdigest()
 
-    def _request(self, method: str, params: Dict[str, Any], http_method: str = "GET"):
-        """Make a request to the Last.fm API.
-
-        Args:
-            method: The Last.fm API method name.
-            params: Dictionary of parameters for the API call.
-            http_method: HTTP method to use ('GET' or 'POST').
-
-        Returns:
-            Dict containing the JSON response from the API.
+    def _prepare_params(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        http_method: str = "GET"
+    ) -> Dict[str, Any]:
+        """Add common parameters, and the session key and signature for POST requests.
 
         Raises:
             RuntimeError: If session key or API secret is missing for POST requests.
-            requests.HTTPError: If the API returns a non-2xx status code.
         """
         params = {**params}
         params["api_key"] = self.api_key
@@ -82,9 +168,191 @@ class LastfmAPIBase:
                     "This method requires LASTFM_API_SECRET for signing."
                 )
             params["api_sig"] = self._signature(params)
-            r = requests.post(BASE_URL, data=params, timeout=30)
+        return params
+
+    def _cache_key(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        http_method: str = "GET"
+    ) -> Optional[str]:
+        """Return the cache key for a request, or None if it is not cacheable."""
+        if self.cache is None:
+            return None
+        return self.cache.key_for(method, params, http_method)
+
+    def _cache_store(self, key: Optional[str], method: str, data: Any) -> None:
+        """Cache a successful response under key, skipping Last.fm error payloads."""
+        if key is not None and not (isinstance(data, dict) and "error" in data):
+            self.cache.set(key, data, self.cache.ttl_for(method))
+
+    def _paginate(
+        self,
+        fetch: Callable[[int], Any],
+        container: str,
+        item_key: str,
+        start_page: int = 1,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+        skip: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ):
+        """Iterate over the items of a paged list endpoint; see pagination.iter_pages."""
+        return iter_pages(fetch, container, item_key, start_page, max_pages, prefetch, skip)
+
+    def _request(self, method: str, params: Dict[str, Any], http_method: str = "GET"):
+        """Make a request to the Last.fm API.
+
+        Args:
+            method: The Last.fm API method name.
+            params: Dictionary of parameters for the API call.
+            http_method: HTTP method to use ('GET' or 'POST').
+
+        Returns:
+            Dict containing the JSON response from the API.
+
+        Raises:
+            RuntimeError: If session key or API secret is missing for POST requests.
+            requests.HTTPError: If the API returns a non-2xx status code.
+        """
+        key = self._cache_key(method, params, http_method)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.singleflight is not None and http_method == "GET":
+            return self.singleflight.do(
+                canonical_key(method, params),
+                lambda: self._send(method, params, http_method, key),
+            )
+        return self._send(method, params, http_method, key)
+
+    def _send(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        http_method: str,
+        cache_key: Optional[str]
+    ):
+        """Send one request over the pooled session and cache the response."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        params = self._prepare_params(method, params, http_method)
+        if http_method == "POST":
+            r = self.session.post(BASE_URL, data=params, timeout=30)
+        else:
+            r = self.session.get(BASE_URL, params=params, timeout=30)
+
+        r.raise_for_status()
+        data = r.json()
+        self._cache_store(cache_key, method, data)
+        return data
+
+
+class AsyncLastfmAPIBase(LastfmAPIBase):
+    """Async base class for Last.fm API clients.
+
+    Sends requests through a shared httpx.AsyncClient. Async sub-APIs inherit
+    the parameter handling of their sync counterparts, so every API method
+    returns an awaitable resolving to the JSON response.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        session_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        singleflight: Optional[SingleFlight] = None,
+    ):
+        """Initialize the async base API client.
+
+        Args:
+            api_key: Last.fm API key. If None, reads from LASTFM_API_KEY environment variable.
+            api_secret: Last.fm API secret. If None, reads from LASTFM_API_SECRET environment variable.
+            session_key: User session key. If None, reads from LASTFM_SESSION_KEY environment variable.
+            http_client: Async HTTP client to send requests through. If None, a new one is created.
+            cache: Response cache for idempotent GET methods. If None, responses are not cached.
+            rate_limiter: Token bucket every request waits on, without blocking
+                the event loop. If None, requests are not rate limited.
+            singleflight: In-flight table that lets identical concurrent GETs share
+                one request. If None, every call goes to the network.
+
+        Raises:
+            RuntimeError: If api_key is not provided via parameter or environment variable.
+        """
+        super().__init__(
+            api_key,
+            api_secret,
+            session_key,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            singleflight=singleflight,
+        )
+        self.http_client = http_client or create_async_client()
+
+    def _paginate(
+        self,
+        fetch: Callable[[int], Any],
+        container: str,
+        item_key: str,
+        start_page: int = 1,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+        skip: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ):
+        """Iterate asynchronously over a paged list endpoint; see pagination.aiter_pages."""
+        return aiter_pages(fetch, container, item_key, start_page, max_pages, prefetch, skip)
+
+    async def _request(self, method: str, params: Dict[str, Any], http_method: str = "GET"):
+        """Make a request to the Last.fm API without blocking the event loop.
+
+        Args:
+            method: The Last.fm API method name.
+            params: Dictionary of parameters for the API call.
+            http_method: HTTP method to use ('GET' or 'POST').
+
+        Returns:
+            Dict containing the JSON response from the API.
+
+        Raises:
+            RuntimeError: If session key or API secret is missing for POST requests.
+            httpx.HTTPStatusError: If the API returns a non-2xx status code.
+        """
+        key = self._cache_key(method, params, http_method)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.singleflight is not None and http_method == "GET":
+            return await self.singleflight.ado(
+                canonical_key(method, params),
+                lambda: self._send(method, params, http_method, key),
+            )
+        return await self._send(method, params, http_method, key)
+
+    async def _send(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        http_method: str,
+        cache_key: Optional[str]
+    ):
+        """Send one request over the shared async client and cache the response."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+
+        params = self._prepare_params(method, params, http_method)
+        if http_method == "POST":
+            r = await self.http_client.post(BASE_URL, data=params)
         else:
-            r = requests.get(BASE_URL, params=params, timeout=30)
+            r = await self.http_client.get(BASE_URL, params=params)
 
         r.raise_for_status()
-        return r.json()
+        data = r.json()
+        self._cache_store(cache_key, method, data)
+        return data
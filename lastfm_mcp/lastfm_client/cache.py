@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Collection, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL = 300.0
+
+# Seconds to keep responses for slowly changing read methods
+DEFAULT_TTLS: Dict[str, float] = {
+    "album.getinfo": 86400.0,
+    "album.gettoptags": 86400.0,
+    "album.search": 3600.0,
+    "artist.getcorrection": 86400.0,
+    "artist.getinfo": 86400.0,
+    "artist.getsimilar": 86400.0,
+    "artist.gettopalbums": 21600.0,
+    "artist.gettoptags": 86400.0,
+    "artist.gettoptracks": 21600.0,
+    "artist.search": 3600.0,
+    "chart.gettopartists": 1800.0,
+    "chart.gettoptags": 1800.0,
+    "chart.gettoptracks": 1800.0,
+    "geo.gettopartists": 3600.0,
+    "geo.gettoptracks": 3600.0,
+    "tag.getinfo": 86400.0,
+    "tag.getsimilar": 86400.0,
+    "tag.gettopalbums": 21600.0,
+    "tag.gettopartists": 21600.0,
+    "tag.gettoptags": 21600.0,
+    "tag.gettoptracks": 21600.0,
+    "tag.getweeklychartlist": 86400.0,
+    "track.getcorrection": 86400.0,
+    "track.getinfo": 86400.0,
+    "track.getsimilar": 86400.0,
+    "track.gettoptags": 86400.0,
+    "track.search": 3600.0,
+}
+
+# Method prefixes whose responses depend on the user or on auth state
+UNCACHED_PREFIXES = ("auth.", "library.", "user.")
+
+# Parameters that make an otherwise global method user-specific
+USER_PARAMS = frozenset({"user", "username", "sk"})
+
+# Parameters that do not affect the response and are left out of cache keys
+IGNORED_PARAMS = frozenset({"api_key", "api_sig", "format", "method", "callback"})
+
+
+def canonical_key(
+    method: str,
+    params: Dict[str, Any],
+    ignored: Collection[str] = ()
+) -> str:
+    """Build an unambiguous key for a method call from its sorted, URL-encoded parameters.
+
+    Names and values are percent-encoded, so a value containing "&" or "="
+    can never produce the same key as a different set of parameters.
+    """
+    items = sorted(
+        (k, str(v)) for k, v in params.items() if k not in ignored and v is not None
+    )
+    return method.lower() + "?" + urlencode(items)
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache for idempotent Last.fm responses.
+
+    Entries are keyed on the method name and the canonicalised request
+    parameters (excluding the API key). Cached responses are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        default_ttl: float = DEFAULT_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before the least recently used is evicted.
+            default_ttl: TTL in seconds for methods without an explicit entry in ttls.
+            ttls: Per-method TTL overrides in seconds, merged over DEFAULT_TTLS. A TTL of 0 disables caching.
+            clock: Monotonic time source, mainly for tests.
+        """
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, method: str) -> float:
+        """Return the TTL in seconds for a Last.fm method."""
+        return self.ttls.get(method.lower(), self.default_ttl)
+
+    def key_for(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        http_method: str = "GET"
+    ) -> Optional[str]:
+        """Build the cache key for a request, or None if it must bypass the cache.
+
+        POSTs, auth/user/library methods and requests carrying a user or
+        session key are never cached.
+        """
+        method = method.lower()
+        if http_method != "GET" or method.startswith(UNCACHED_PREFIXES):
+            return None
+        if USER_PARAMS.intersection(params) or self.ttl_for(method) <= 0:
+            return None
+        return canonical_key(method, params, IGNORED_PARAMS)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds, evicting the LRU entry if full."""
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,5 +1,5 @@
 from typing import Optional
-from .base import LastfmAPIBase
+from .base import AsyncLastfmAPIBase, LastfmAPIBase
 
 
 class ChartAPI(LastfmAPIBase):
@@ -67,3 +67,7 @@ class ChartAPI(LastfmAPIBase):
         if limit is not None:
             p["limit"] = limit
         return self._request("chart.gettoptracks", p)
+
+
+class AsyncChartAPI(AsyncLastfmAPIBase, ChartAPI):
+    """Async API client for global chart data operations."""
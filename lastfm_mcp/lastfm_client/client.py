@@ -1,26 +1,61 @@
-from .album import AlbumAPI
-from .artist import ArtistAPI
-from .auth import AuthAPI
-from .chart import ChartAPI
-from .geo import GeoAPI
-from .library import LibraryAPI
-from .tag import TagAPI
-from .track import TrackAPI
-from .user import UserAPI
+from typing import Optional
+
+from .album import AlbumAPI, AsyncAlbumAPI
+from .artist import ArtistAPI, AsyncArtistAPI
+from .auth import AsyncAuthAPI, AuthAPI
+from .base import (
+    DEFAULT_ASYNC_POOL_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_SIZE,
+    create_async_client,
+    create_session,
+)
+from .cache import ResponseCache
+from .chart import AsyncChartAPI, ChartAPI
+from .export import export_recent_tracks
+from .geo import AsyncGeoAPI, GeoAPI
+from .library import AsyncLibraryAPI, LibraryAPI
+from .ratelimit import DEFAULT_RATE_BURST, DEFAULT_RATE_LIMIT, TokenBucket
+from .singleflight import SingleFlight
+from .tag import AsyncTagAPI, TagAPI
+from .track import AsyncTrackAPI, TrackAPI
+from .user import AsyncUserAPI, UserAPI
+
+
+def _make_rate_limiter(
+    rate_limit: Optional[float],
+    rate_burst: int,
+    rate_limiter: Optional[TokenBucket],
+) -> Optional[TokenBucket]:
+    """Return the limiter shared by a client's sub-APIs, or None if disabled."""
+    if rate_limiter is not None:
+        return rate_limiter
+    if rate_limit is None:
+        return None
+    return TokenBucket(rate_limit, rate_burst)
 
 
 class LastfmClient:
     """Main client for accessing Last.fm API endpoints.
 
     This class provides access to various Last.fm APIs through specialized
-    sub-clients for albums, artists, authentication, charts, etc.
+    sub-clients for albums, artists, authentication, charts, etc. All
+    sub-clients share a single pooled HTTP session so connections to Last.fm
+    are kept alive and reused between calls.
     """
 
     def __init__(
         self,
         api_key: str = None,
         api_secret: str = None,
-        session_key: str = None
+        session_key: str = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        cache: ResponseCache = None,
+        rate_limit: Optional[float] = DEFAULT_RATE_LIMIT,
+        rate_burst: int = DEFAULT_RATE_BURST,
+        rate_limiter: TokenBucket = None,
+        coalesce: bool = True,
     ):
         """Initialize the Last.fm client.
 
@@ -28,20 +63,109 @@ class LastfmClient:
             api_key: Last.fm API key for authentication.
             api_secret: Last.fm API secret for authentication.
             session_key: User session key for authenticated requests.
+            pool_size: Maximum number of pooled connections to Last.fm.
+            max_retries: Number of retries for failed idempotent requests.
+            cache: Response cache shared by all sub-clients. If None, responses are not cached.
+            rate_limit: Requests per second allowed across all sub-clients. None disables limiting.
+            rate_burst: Requests that may go out at once after an idle period.
+            rate_limiter: Existing token bucket to share, e.g. with another client
+                using the same API key. Overrides rate_limit and rate_burst.
+            coalesce: Let identical concurrent GETs share one request. Counts are
+                available from singleflight.stats().
         """
-        self.album = AlbumAPI(api_key, api_secret, session_key)
-        self.artist = ArtistAPI(api_key, api_secret, session_key)
-        self.auth = AuthAPI(api_key, api_secret, session_key)
-        self.chart = ChartAPI(api_key, api_secret, session_key)
-        self.geo = GeoAPI(api_key, api_secret, session_key)
-        self.library = LibraryAPI(api_key, api_secret, session_key)
-        self.tag = TagAPI(api_key, api_secret, session_key)
-        self.track = TrackAPI(api_key, api_secret, session_key)
-        self.user = UserAPI(api_key, api_secret, session_key)
+        self.session = create_session(pool_size, max_retries)
+        self.cache = cache
+        self.rate_limiter = _make_rate_limiter(rate_limit, rate_burst, rate_limiter)
+        self.singleflight = SingleFlight() if coalesce else None
+        self.album = AlbumAPI(api_key, api_secret, session_key, self.session, cache, self.rate_limiter, self.singleflight)
+        self.artist = ArtistAPI(api_key, api_secret, session_key, self.session, cache, self.rate_limiter, self.singleflight)
+        self.auth = AuthAPI(api_key, api_secret, session_key, self.session, cache, self.rate_limiter, self.singleflight)
+        self.chart = ChartAPI(api_key, api_secret, session_key, self.session, cache, self.rate_limiter, self.singleflight)
+        self.geo = GeoAPI(api_key, api_secret, session_key, self.session, cache, self.rate_limiter, self.singleflight)
+        self.library = LibraryAPI(api_key, api_secret, session_key, self.session, cache, self.rate_limiter, self.singleflight)
+        self.tag = TagAPI(api_key, api_secret, session_key, self.session, cache, self.rate_limiter, self.singleflight)
+        self.track = TrackAPI(api_key, api_secret, session_key, self.session, cache, self.rate_limiter, self.singleflight)
+        self.user = UserAPI(api_key, api_secret, session_key, self.session, cache, self.rate_limiter, self.singleflight)
+
+    def close(self):
+        """Close the shared HTTP session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncLastfmClient:
+    """Async client for accessing Last.fm API endpoints.
+
+    Mirrors LastfmClient, but every sub-client method returns an awaitable and
+    all sub-clients share one httpx.AsyncClient, so many requests can be in
+    flight at once without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        api_secret: str = None,
+        session_key: str = None,
+        pool_size: int = DEFAULT_ASYNC_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        cache: ResponseCache = None,
+        rate_limit: Optional[float] = DEFAULT_RATE_LIMIT,
+        rate_burst: int = DEFAULT_RATE_BURST,
+        rate_limiter: TokenBucket = None,
+        coalesce: bool = True,
+    ):
+        """Initialize the async Last.fm client.
+
+        Args:
+            api_key: Last.fm API key for authentication.
+            api_secret: Last.fm API secret for authentication.
+            session_key: User session key for authenticated requests.
+            pool_size: Maximum number of concurrent connections to Last.fm.
+            max_retries: Number of retries for failed connection attempts.
+            cache: Response cache shared by all sub-clients. If None, responses are not cached.
+            rate_limit: Requests per second allowed across all sub-clients. None disables limiting.
+            rate_burst: Requests that may go out at once after an idle period.
+            rate_limiter: Existing token bucket to share, e.g. with another client
+                using the same API key. Overrides rate_limit and rate_burst.
+            coalesce: Let identical concurrent GETs share one request. Counts are
+                available from singleflight.stats().
+        """
+        self.http_client = create_async_client(pool_size, max_retries)
+        self.cache = cache
+        self.rate_limiter = _make_rate_limiter(rate_limit, rate_burst, rate_limiter)
+        self.singleflight = SingleFlight() if coalesce else None
+        self.album = AsyncAlbumAPI(api_key, api_secret, session_key, self.http_client, cache, self.rate_limiter, self.singleflight)
+        self.artist = AsyncArtistAPI(api_key, api_secret, session_key, self.http_client, cache, self.rate_limiter, self.singleflight)
+        self.auth = AsyncAuthAPI(api_key, api_secret, session_key, self.http_client, cache, self.rate_limiter, self.singleflight)
+        self.chart = AsyncChartAPI(api_key, api_secret, session_key, self.http_client, cache, self.rate_limiter, self.singleflight)
+        self.geo = AsyncGeoAPI(api_key, api_secret, session_key, self.http_client, cache, self.rate_limiter, self.singleflight)
+        self.library = AsyncLibraryAPI(api_key, api_secret, session_key, self.http_client, cache, self.rate_limiter, self.singleflight)
+        self.tag = AsyncTagAPI(api_key, api_secret, session_key, self.http_client, cache, self.rate_limiter, self.singleflight)
+        self.track = AsyncTrackAPI(api_key, api_secret, session_key, self.http_client, cache, self.rate_limiter, self.singleflight)
+        self.user = AsyncUserAPI(api_key, api_secret, session_key, self.http_client, cache, self.rate_limiter, self.singleflight)
+
+    async def aclose(self):
+        """Close the shared async HTTP client and release pooled connections."""
+        await self.http_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
 
 __all__ = [
     "LastfmClient",
+    "ResponseCache",
+    "SingleFlight",
+    "TokenBucket",
+    "export_recent_tracks",
     "AlbumAPI",
     "ArtistAPI",
     "AuthAPI",
@@ -51,4 +175,14 @@ __all__ = [
     "TagAPI",
     "TrackAPI",
     "UserAPI",
+    "AsyncLastfmClient",
+    "AsyncAlbumAPI",
+    "AsyncArtistAPI",
+    "AsyncAuthAPI",
+    "AsyncChartAPI",
+    "AsyncGeoAPI",
+    "AsyncLibraryAPI",
+    "AsyncTagAPI",
+    "AsyncTrackAPI",
+    "AsyncUserAPI",
 ]
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+from .pagination import is_now_playing, page_items
+from .ratelimit import TokenBucket
+
+DEFAULT_EXPORT_LIMIT = 200
+DEFAULT_EXPORT_CONCURRENCY = 8
+DEFAULT_EXPORT_RATE = 5.0
+DEFAULT_EXPORT_RETRIES = 3
+RETRY_BACKOFF = 0.5
+MAX_RETRY_AFTER = 60.0
+
+# HTTP statuses worth retrying besides 5xx
+RETRYABLE_STATUSES = frozenset({429})
+
+# Last.fm error codes worth retrying: operation failed, service offline,
+# temporarily unavailable, rate limit exceeded
+TRANSIENT_ERRORS = frozenset({8, 11, 16, 29})
+
+# Flat column layout used for Parquet output
+PARQUET_COLUMNS = (
+    ("uts", "int64"),
+    ("date", "string"),
+    ("artist", "string"),
+    ("artist_mbid", "string"),
+    ("album", "string"),
+    ("album_mbid", "string"),
+    ("track", "string"),
+    ("track_mbid", "string"),
+    ("url", "string"),
+)
+
+
+def flatten_track(track: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a user.getrecenttracks track into the PARQUET_COLUMNS layout."""
+    date = track.get("date") or {}
+    artist = track.get("artist") or {}
+    album = track.get("album") or {}
+    return {
+        "uts": int(date["uts"]) if date.get("uts") else None,
+        "date": date.get("#text"),
+        "artist": artist.get("#text") or artist.get("name"),
+        "artist_mbid": artist.get("mbid") or None,
+        "album": album.get("#text"),
+        "album_mbid": album.get("mbid") or None,
+        "track": track.get("name"),
+        "track_mbid": track.get("mbid") or None,
+        "url": track.get("url"),
+    }
+
+
+class _JsonlWriter:
+    """Write each track as one JSON object per line, exactly as Last.fm returned it."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, tracks: List[Dict[str, Any]]) -> None:
+        for track in tracks:
+            self._file.write(json.dumps(track, ensure_ascii=False))
+            self._file.write("\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """Append each page as a row group of flattened tracks (requires pyarrow)."""
+
+    def __init__(self, path: str):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError(
+                "Parquet export requires pyarrow; install it with pip install 'lastfm-mcp[parquet]'."
+            ) from e
+        self._pa = pa
+        self._schema = pa.schema([(name, getattr(pa, kind)()) for name, kind in PARQUET_COLUMNS])
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, tracks: List[Dict[str, Any]]) -> None:
+        if tracks:
+            rows = [flatten_track(t) for t in tracks]
+            self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _open_writer(path: str, format: Optional[str]):
+    fmt = format or ("parquet" if path.endswith(".parquet") else "jsonl")
+    if fmt == "jsonl":
+        return _JsonlWriter(path)
+    if fmt == "parquet":
+        return _ParquetWriter(path)
+    raise ValueError(f"Unsupported export format: {fmt}")
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Return how long to wait before the next attempt.
+
+    Honors a Retry-After header (seconds or HTTP date, capped at
+    MAX_RETRY_AFTER) and otherwise backs off exponentially.
+    """
+    backoff = RETRY_BACKOFF * 2 ** attempt
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return backoff
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return backoff
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+async def _fetch_page(
+    user_api,
+    user: str,
+    page: int,
+    limit: int,
+    from_timestamp: Optional[int],
+    to_timestamp: int,
+    limiter: Optional[TokenBucket],
+    retries: int,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Fetch one page under the rate limiter, retrying transient failures."""
+    for attempt in range(retries + 1):
+        response = None
+        if limiter is not None:
+            await limiter.aacquire()
+        try:
+            data = await user_api.get_recent_tracks(user, page, limit, from_timestamp, to_timestamp)
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if (status < 500 and status not in RETRYABLE_STATUSES) or attempt == retries:
+                raise
+            response = e.response
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+        else:
+            if data.get("error") not in TRANSIENT_ERRORS or attempt == retries:
+                items, total_pages = page_items(data, "recenttracks", "track")
+                return [t for t in items if not is_now_playing(t)], total_pages
+        await asyncio.sleep(_retry_delay(attempt, response))
+
+
+async def export_recent_tracks(
+    user_api,
+    user: str,
+    path: str,
+    format: Optional[str] = None,
+    from_timestamp: Optional[int] = None,
+    to_timestamp: Optional[int] = None,
+    limit: int = DEFAULT_EXPORT_LIMIT,
+    concurrency: int = DEFAULT_EXPORT_CONCURRENCY,
+    rate: float = DEFAULT_EXPORT_RATE,
+    limiter: Optional[TokenBucket] = None,
+    retries: int = DEFAULT_EXPORT_RETRIES,
+) -> int:
+    """Export a user's full scrobble history to a JSONL or Parquet file.
+
+    Page 1 is fetched first to learn totalPages. The remaining pages are then
+    fetched concurrently, at most concurrency at a time and no faster than the
+    rate limiter allows (the client's shared limiter when it has one). They
+    are written to disk strictly in page order as soon as each one and all
+    pages before it have arrived, so memory holds at most concurrency pages
+    regardless of history size.
+
+    Args:
+        user_api: An AsyncUserAPI, e.g. AsyncLastfmClient().user.
+        user: Username whose history to export.
+        path: Output file. Existing files are overwritten.
+        format: "jsonl" or "parquet". If None, inferred from the extension
+            (".parquet" means Parquet, anything else JSONL).
+        from_timestamp: Only export scrobbles after this Unix timestamp.
+        to_timestamp: Only export scrobbles before this Unix timestamp. Defaults
+            to now, which pins the page layout while new scrobbles arrive.
+        limit: Tracks per page (Last.fm allows up to 200).
+        concurrency: Maximum number of pages in flight.
+        rate: Requests per second if neither limiter nor the client's own
+            rate_limiter is set.
+        limiter: Extra rate limiter to wait on; overrides rate.
+        retries: Retries per page for 429, 5xx, network and transient Last.fm errors.
+
+    Returns:
+        Number of tracks written, most recent first. The "now playing" entry
+        is never exported.
+
+    Raises:
+        ValueError: If the format is not supported or concurrency is below 1.
+        RuntimeError: If Last.fm keeps returning an error, or pyarrow is
+            missing for Parquet output.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if to_timestamp is None:
+        to_timestamp = int(time.time())
+    if limiter is None and getattr(user_api, "rate_limiter", None) is None:
+        limiter = TokenBucket(rate)
+
+    def fetch(page: int):
+        return _fetch_page(
+            user_api, user, page, limit, from_timestamp, to_timestamp, limiter, retries
+        )
+
+    writer = _open_writer(path, format)
+    pending: Deque[asyncio.Task] = deque()
+    written = 0
+    try:
+        tracks, total_pages = await fetch(1)
+        writer.write(tracks)
+        written += len(tracks)
+
+        next_page = 2
+        while next_page <= total_pages and len(pending) < concurrency:
+            pending.append(asyncio.ensure_future(fetch(next_page)))
+            next_page += 1
+        while pending:
+            tracks, _ = await pending.popleft()
+            writer.write(tracks)
+            written += len(tracks)
+            if next_page <= total_pages:
+                pending.append(asyncio.ensure_future(fetch(next_page)))
+                next_page += 1
+    finally:
+        for task in pending:
+            task.cancel()
+        writer.close()
+    return written
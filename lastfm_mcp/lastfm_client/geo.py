@@ -1,5 +1,5 @@
 from typing import Optional
-from .base import LastfmAPIBase
+from .base import AsyncLastfmAPIBase, LastfmAPIBase
 
 
 class GeoAPI(LastfmAPIBase):
@@ -51,3 +51,7 @@ class GeoAPI(LastfmAPIBase):
         if limit is not None:
             p["limit"] = limit
         return self._request("geo.gettoptracks", p)
+
+
+class AsyncGeoAPI(AsyncLastfmAPIBase, GeoAPI):
+    """Async API client for geographic chart data operations."""
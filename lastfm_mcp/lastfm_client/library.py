@@ -1,5 +1,5 @@
 from typing import Optional
-from .base import LastfmAPIBase
+from .base import AsyncLastfmAPIBase, LastfmAPIBase
 
 
 class LibraryAPI(LastfmAPIBase):
@@ -27,3 +27,33 @@ class LibraryAPI(LastfmAPIBase):
         if limit is not None:
             p["limit"] = limit
         return self._request("library.getartists", p)
+
+    def iter_artists(
+        self,
+        user: str,
+        limit: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ):
+        """Iterate over the artists in a user's library across all pages.
+
+        Args:
+            user: Username whose library to retrieve.
+            limit: Number of results per page.
+            max_pages: Stop after this many pages. If None, read them all.
+            prefetch: Whether to fetch the next page ahead of time.
+
+        Returns:
+            Iterator of artist dicts (async iterator on AsyncLibraryAPI).
+        """
+        return self._paginate(
+            lambda page: self.get_artists(user, page, limit),
+            "artists",
+            "artist",
+            max_pages=max_pages,
+            prefetch=prefetch,
+        )
+
+
+class AsyncLibraryAPI(AsyncLastfmAPIBase, LibraryAPI):
+    """Async API client for user library operations."""
@@ -0,0 +1,139 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Fetches one page of results given its 1-based page number
+PageFetcher = Callable[[int], Dict[str, Any]]
+AsyncPageFetcher = Callable[[int], Awaitable[Dict[str, Any]]]
+ItemFilter = Callable[[Dict[str, Any]], bool]
+
+
+def page_items(
+    data: Dict[str, Any],
+    container: str,
+    item_key: str
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Extract the items and total page count from one page of a list response.
+
+    Args:
+        data: JSON response, e.g. {"recenttracks": {"track": [...], "@attr": {...}}}.
+        container: Top-level key holding the list, e.g. "recenttracks".
+        item_key: Key of the items inside the container, e.g. "track".
+
+    Returns:
+        Tuple of (items, totalPages). A single item returned as a dict is
+        wrapped in a list.
+
+    Raises:
+        RuntimeError: If Last.fm returned an error payload.
+    """
+    if "error" in data:
+        raise RuntimeError(f"Last.fm error {data['error']}: {data.get('message', '')}")
+    payload = data.get(container) or {}
+    items = payload.get(item_key) or []
+    if isinstance(items, dict):
+        items = [items]
+    attr = payload.get("@attr") or {}
+    total_pages = int(attr.get("totalPages") or 1)
+    return items, total_pages
+
+
+def _is_last_page(page: int, total_pages: int, items: List[Any], max_pages: Optional[int], start_page: int) -> bool:
+    if not items or page >= total_pages:
+        return True
+    return max_pages is not None and page - start_page + 1 >= max_pages
+
+
+def iter_pages(
+    fetch: PageFetcher,
+    container: str,
+    item_key: str,
+    start_page: int = 1,
+    max_pages: Optional[int] = None,
+    prefetch: bool = True,
+    skip: Optional[ItemFilter] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield items from every page of a Last.fm list endpoint.
+
+    Pages are requested on demand until @attr.totalPages is reached. With
+    prefetch, the next page is fetched in a background thread while the caller
+    consumes the current one. Breaking out of the loop stops paging; at most
+    one prefetched page is wasted.
+
+    Args:
+        fetch: Returns the JSON response for a page number.
+        container: Top-level key holding the list, e.g. "recenttracks".
+        item_key: Key of the items inside the container, e.g. "track".
+        start_page: First page to fetch.
+        max_pages: Stop after this many pages. If None, read to the end.
+        prefetch: Whether to fetch the next page ahead of time.
+        skip: Optional predicate for items that should not be yielded.
+
+    Raises:
+        RuntimeError: If Last.fm returns an error payload.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = start_page
+        data = fetch(page)
+        while True:
+            items, total_pages = page_items(data, container, item_key)
+            last = _is_last_page(page, total_pages, items, max_pages, start_page)
+            upcoming = None
+            if not last and executor is not None:
+                upcoming = executor.submit(fetch, page + 1)
+            for item in items:
+                if skip is None or not skip(item):
+                    yield item
+            if last:
+                return
+            page += 1
+            data = upcoming.result() if upcoming is not None else fetch(page)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch: AsyncPageFetcher,
+    container: str,
+    item_key: str,
+    start_page: int = 1,
+    max_pages: Optional[int] = None,
+    prefetch: bool = True,
+    skip: Optional[ItemFilter] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Async counterpart of iter_pages.
+
+    With prefetch, the next page is requested as a task on the running event
+    loop while the caller consumes the current one. Leaving the loop early
+    cancels the pending request.
+    """
+    upcoming: Optional[asyncio.Future] = None
+    try:
+        page = start_page
+        data = await fetch(page)
+        while True:
+            items, total_pages = page_items(data, container, item_key)
+            last = _is_last_page(page, total_pages, items, max_pages, start_page)
+            if not last and prefetch:
+                upcoming = asyncio.ensure_future(fetch(page + 1))
+            for item in items:
+                if skip is None or not skip(item):
+                    yield item
+            if last:
+                return
+            page += 1
+            if upcoming is not None:
+                data = await upcoming
+                upcoming = None
+            else:
+                data = await fetch(page)
+    finally:
+        if upcoming is not None:
+            upcoming.cancel()
+
+
+def is_now_playing(track: Dict[str, Any]) -> bool:
+    """Return True for the "now playing" entry Last.fm prepends to recent tracks."""
+    return str((track.get("@attr") or {}).get("nowplaying", "")).lower() == "true"
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Optional
+
+# Last.fm asks for no more than about five requests per second per API key
+DEFAULT_RATE_LIMIT = 5.0
+DEFAULT_RATE_BURST = 10
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter usable from sync and async code.
+
+    Tokens refill continuously at rate per second up to burst. Each call
+    reserves one token; when the bucket is empty the caller waits until its
+    token is due, so concurrent callers are released in arrival order at the
+    configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the bucket.
+
+        Args:
+            rate: Sustained number of acquisitions allowed per second.
+            burst: Maximum tokens stored, i.e. how many calls may go out at
+                once after an idle period. Defaults to max(1, int(rate)).
+            clock: Monotonic time source, mainly for tests.
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is None:
+            burst = max(1, int(rate))
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
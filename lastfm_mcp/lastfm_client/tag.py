@@ -1,5 +1,5 @@
 from typing import Optional
-from .base import LastfmAPIBase
+from .base import AsyncLastfmAPIBase, LastfmAPIBase
 
 
 class TagAPI(LastfmAPIBase):
@@ -128,3 +128,33 @@ class TagAPI(LastfmAPIBase):
             Dict containing available weekly chart date ranges.
         """
         return self._request("tag.getweeklychartlist", {"tag": tag})
+
+    def iter_top_artists(
+        self,
+        tag: str,
+        limit: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ):
+        """Iterate over the top artists for a tag across all pages.
+
+        Args:
+            tag: The tag name.
+            limit: Number of results per page.
+            max_pages: Stop after this many pages. If None, read them all.
+            prefetch: Whether to fetch the next page ahead of time.
+
+        Returns:
+            Iterator of artist dicts (async iterator on AsyncTagAPI).
+        """
+        return self._paginate(
+            lambda page: self.get_top_artists(tag, page, limit),
+            "topartists",
+            "artist",
+            max_pages=max_pages,
+            prefetch=prefetch,
+        )
+
+
+class AsyncTagAPI(AsyncLastfmAPIBase, TagAPI):
+    """Async API client for tag-related operations."""
@@ -1,5 +1,106 @@
-from typing import Optional
-from .base import LastfmAPIBase
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import httpx
+import requests
+
+from .base import AsyncLastfmAPIBase, LastfmAPIBase
+
+# Last.fm accepts at most this many scrobbles in one track.scrobble request
+MAX_SCROBBLE_BATCH = 50
+
+# Scrobble dict keys and the track.scrobble parameter each one maps to
+_SCROBBLE_FIELDS = (
+    ("artist", "artist"),
+    ("track", "track"),
+    ("timestamp", "timestamp"),
+    ("album", "album"),
+    ("album_artist", "albumArtist"),
+    ("track_number", "trackNumber"),
+    ("mbid", "mbid"),
+    ("duration", "duration"),
+)
+
+
+def _scrobble_batches(
+    scrobbles: Sequence[Dict[str, Any]],
+    sk: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Split scrobbles into track.scrobble parameter sets in array notation.
+
+    Each set holds at most MAX_SCROBBLE_BATCH scrobbles as artist[i], track[i],
+    timestamp[i] and so on. Every scrobble is checked before any set is built,
+    so a bad entry fails the whole call before anything is sent.
+
+    Raises:
+        ValueError: If a scrobble lacks artist, track or timestamp.
+    """
+    for n, item in enumerate(scrobbles):
+        missing = [k for k in ("artist", "track", "timestamp") if item.get(k) in (None, "")]
+        if missing:
+            raise ValueError(f"Scrobble {n} is missing {', '.join(missing)}")
+
+    batches = []
+    for start in range(0, len(scrobbles), MAX_SCROBBLE_BATCH):
+        p: Dict[str, Any] = {}
+        for i, item in enumerate(scrobbles[start:start + MAX_SCROBBLE_BATCH]):
+            for key, name in _SCROBBLE_FIELDS:
+                value = item.get(key)
+                if value is not None and value != "":
+                    p[f"{name}[{i}]"] = value
+        if sk:
+            p["sk"] = sk
+        batches.append(p)
+    return batches
+
+
+def _scrobble_results(
+    scrobbles: Sequence[Dict[str, Any]],
+    responses: Sequence[Union[Dict[str, Any], Exception]]
+) -> Dict[str, Any]:
+    """Match each scrobble with its status from the batch responses.
+
+    A response may be the exception a batch request raised instead, in which
+    case every scrobble of that batch is reported failed with the error.
+
+    Returns:
+        Dict with accepted, ignored and failed counts, the number of requests
+        sent, and a "scrobbles" list holding per-item index, artist, track,
+        timestamp, status ("accepted", "ignored" or "failed"), and for
+        non-accepted items a code and message.
+    """
+    results = []
+    counts = {"accepted": 0, "ignored": 0, "failed": 0}
+    for n, data in enumerate(responses):
+        start = n * MAX_SCROBBLE_BATCH
+        chunk = scrobbles[start:start + MAX_SCROBBLE_BATCH]
+        if isinstance(data, Exception):
+            data = {"error": None, "message": f"{type(data).__name__}: {data}"}
+        entries = ((data.get("scrobbles") or {}).get("scrobble")) or []
+        if isinstance(entries, dict):
+            entries = [entries]
+        for i, item in enumerate(chunk):
+            result = {
+                "index": start + i,
+                "artist": item["artist"],
+                "track": item["track"],
+                "timestamp": item["timestamp"],
+            }
+            if "error" in data:
+                result.update(status="failed", code=data["error"], message=data.get("message", ""))
+            elif i >= len(entries):
+                result.update(status="failed", code=None, message="No result returned for this scrobble")
+            else:
+                ignored = entries[i].get("ignoredMessage") or {}
+                code = int(ignored.get("code") or 0)
+                if code:
+                    result.update(status="ignored", code=code, message=ignored.get("#text", ""))
+                else:
+                    result["status"] = "accepted"
+            counts[result["status"]] += 1
+            results.append(result)
+    return {**counts, "requests": len(responses), "scrobbles": results}
 
 
 class TrackAPI(LastfmAPIBase):
@@ -259,6 +360,52 @@ class TrackAPI(LastfmAPIBase):
             p["sk"] = sk
         return self._request("track.scrobble", p, "POST")
 
+    def scrobble_batch(
+        self,
+        scrobbles: Sequence[Dict[str, Any]],
+        sk: Optional[str] = None,
+        concurrency: int = 1,
+    ):
+        """Add many scrobbles using as few requests as possible.
+
+        Scrobbles are sent MAX_SCROBBLE_BATCH (50) per signed request using
+        Last.fm's array notation. Each request still takes a token from the
+        client's rate limiter.
+
+        Args:
+            scrobbles: Dicts with artist, track and timestamp, and optionally
+                album, album_artist, track_number, mbid and duration.
+            sk: Session key for authentication (optional, uses default if not provided).
+            concurrency: Number of batch requests to send at the same time.
+
+        Returns:
+            Dict with accepted, ignored and failed counts, the number of
+            requests sent, and per-scrobble status in input order. A batch that
+            Last.fm rejects with an error, or whose request fails (HTTP error,
+            timeout, connection error), marks all of its scrobbles failed while
+            the other batches are still sent and reported.
+
+        Raises:
+            ValueError: If a scrobble lacks a required field or concurrency is below 1.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        scrobbles = list(scrobbles)
+        batches = _scrobble_batches(scrobbles, sk)
+
+        def send(p):
+            try:
+                return self._request("track.scrobble", p, "POST")
+            except requests.RequestException as e:
+                return e
+
+        if concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as pool:
+                responses = list(pool.map(send, batches))
+        else:
+            responses = [send(p) for p in batches]
+        return _scrobble_results(scrobbles, responses)
+
     def search(
         self,
         track: str,
@@ -347,3 +494,33 @@ class TrackAPI(LastfmAPIBase):
         if sk:
             p["sk"] = sk
         return self._request("track.updatenowplaying", p, "POST")
+
+
+class AsyncTrackAPI(AsyncLastfmAPIBase, TrackAPI):
+    """Async API client for track-related Last.fm operations."""
+
+    async def scrobble_batch(
+        self,
+        scrobbles: Sequence[Dict[str, Any]],
+        sk: Optional[str] = None,
+        concurrency: int = 1,
+    ):
+        """Async counterpart of TrackAPI.scrobble_batch.
+
+        Up to concurrency batch requests run at once as tasks on the event loop.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        scrobbles = list(scrobbles)
+        batches = _scrobble_batches(scrobbles, sk)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(p):
+            async with semaphore:
+                try:
+                    return await self._request("track.scrobble", p, "POST")
+                except (httpx.HTTPError, ValueError) as e:
+                    return e
+
+        responses = await asyncio.gather(*(send(p) for p in batches))
+        return _scrobble_results(scrobbles, responses)
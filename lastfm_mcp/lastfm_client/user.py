@@ -1,5 +1,6 @@
 from typing import Optional
-from .base import LastfmAPIBase
+from .base import AsyncLastfmAPIBase, LastfmAPIBase
+from .pagination import is_now_playing
 
 
 class UserAPI(LastfmAPIBase):
@@ -299,3 +300,69 @@ class UserAPI(LastfmAPIBase):
         if to_timestamp is not None:
             p["to"] = to_timestamp
         return self._request("user.getweeklytrackchart", p)
+
+    def iter_loved_tracks(
+        self,
+        user: str,
+        limit: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ):
+        """Iterate over a user's loved tracks across all pages.
+
+        Args:
+            user: Username whose loved tracks to retrieve.
+            limit: Number of results per page.
+            max_pages: Stop after this many pages. If None, read them all.
+            prefetch: Whether to fetch the next page ahead of time.
+
+        Returns:
+            Iterator of track dicts (async iterator on AsyncUserAPI).
+        """
+        return self._paginate(
+            lambda page: self.get_loved_tracks(user, page, limit),
+            "lovedtracks",
+            "track",
+            max_pages=max_pages,
+            prefetch=prefetch,
+        )
+
+    def iter_recent_tracks(
+        self,
+        user: str,
+        limit: int = 200,
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ):
+        """Iterate over a user's recent tracks across all pages.
+
+        The next page is prefetched while the current one is consumed, and
+        leaving the loop stops paging. The "now playing" entry is skipped.
+        Pass to_timestamp to pin the window while new scrobbles arrive. On
+        AsyncUserAPI this returns an async iterator.
+
+        Args:
+            user: Username whose recent tracks to retrieve.
+            limit: Number of results per page (Last.fm allows up to 200).
+            from_timestamp: Unix timestamp to start from.
+            to_timestamp: Unix timestamp to end at.
+            max_pages: Stop after this many pages. If None, read the full history.
+            prefetch: Whether to fetch the next page ahead of time.
+
+        Returns:
+            Iterator of track dicts, most recent first.
+        """
+        return self._paginate(
+            lambda page: self.get_recent_tracks(user, page, limit, from_timestamp, to_timestamp),
+            "recenttracks",
+            "track",
+            max_pages=max_pages,
+            prefetch=prefetch,
+            skip=is_now_playing,
+        )
+
+
+class AsyncUserAPI(AsyncLastfmAPIBase, UserAPI):
+    """Async API client for user-related Last.fm operations."""
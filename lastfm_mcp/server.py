@@ -1,48 +1,138 @@
 import os
-from typing import Optional, Any, Dict
+import threading
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional, Any, AsyncIterator, Dict, List
 
 from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware
 
-from lastfm_client.client import (
-    AlbumAPI,
-    ArtistAPI,
-    ChartAPI,
-    GeoAPI,
-    LibraryAPI,
-    TagAPI,
-    TrackAPI,
-    UserAPI,
-)
+from lastfm_client.client import AsyncLastfmClient, ResponseCache
 
 # Initialize MCP server
 mcp = FastMCP("lastfm")
 
+# Response cache for global read methods, kept across credential reloads
+_cache = ResponseCache()
+
+
+class _ClientGeneration:
+    """One AsyncLastfmClient with its registry and the tool calls using it.
+
+    A generation replaced by ``reload_clients`` is retired: it stays open
+    until its last in-flight call finishes and is closed then.
+    """
+
+    def __init__(self):
+        self.client = AsyncLastfmClient(
+            os.getenv("LASTFM_API_KEY", ""),
+            os.getenv("LASTFM_API_SECRET", ""),
+            os.getenv("LASTFM_SESSION_KEY", ""),
+            cache=_cache,
+        )
+        self.registry = {
+            "album": self.client.album,
+            "artist": self.client.artist,
+            "chart": self.client.chart,
+            "geo": self.client.geo,
+            "library": self.client.library,
+            "tag": self.client.tag,
+            "track": self.client.track,
+            "user": self.client.user,
+        }
+        self.active = 0
+        self.retired = False
+
+    async def release(self):
+        """End one call; close the client if it was the last on a retired generation."""
+        self.active -= 1
+        if self.retired and self.active == 0:
+            await self.client.aclose()
+
+
+# Process-wide client generation, built lazily on first tool call
+_generation: Optional[_ClientGeneration] = None
+_generation_lock = threading.Lock()
+
+# Generation leased by the tool call running in the current context
+_leased: ContextVar[Optional[_ClientGeneration]] = ContextVar("lastfm_leased_clients", default=None)
+
+
+def _current() -> _ClientGeneration:
+    """Return the current client generation, building it on first use."""
+    global _generation
+    generation = _generation
+    if generation is None:
+        with _generation_lock:
+            if _generation is None:
+                _generation = _ClientGeneration()
+            generation = _generation
+    return generation
+
 
 def _clients() -> Dict[str, Any]:
-    """Create and return initialized Last.fm API client instances.
+    """Return the process-wide Last.fm API client instances.
+
+    The registry is created on first use and reused by every tool afterwards;
+    call ``reload_clients`` to pick up changed credentials. Inside a tool call
+    the registry leased for that call is returned, so a reload mid-call never
+    switches or closes the client under it.
 
     Returns:
         Dict mapping API names to their corresponding client instances.
     """
-    api_key = os.getenv("LASTFM_API_KEY", "")
-    api_secret = os.getenv("LASTFM_API_SECRET", "")
-    session_key = os.getenv("LASTFM_SESSION_KEY", "")
-    # instantiate clients per type
-    return {
-        "album": AlbumAPI(api_key, api_secret, session_key),
-        "artist": ArtistAPI(api_key, api_secret, session_key),
-        "chart": ChartAPI(api_key, api_secret, session_key),
-        "geo": GeoAPI(api_key, api_secret, session_key),
-        "library": LibraryAPI(api_key, api_secret, session_key),
-        "tag": TagAPI(api_key, api_secret, session_key),
-        "track": TrackAPI(api_key, api_secret, session_key),
-        "user": UserAPI(api_key, api_secret, session_key),
-    }
+    leased = _leased.get()
+    return leased.registry if leased is not None else _current().registry
+
+
+@asynccontextmanager
+async def _lease() -> AsyncIterator[Dict[str, Any]]:
+    """Hold the current client generation open for the duration of a call."""
+    generation = _current()
+    generation.active += 1
+    token = _leased.set(generation)
+    try:
+        yield generation.registry
+    finally:
+        _leased.reset(token)
+        await generation.release()
+
+
+class _LeaseClients(Middleware):
+    """Run every tool call under a lease on the client generation it started with."""
+
+    async def on_call_tool(self, context, call_next):
+        async with _lease():
+            return await call_next(context)
+
+
+mcp.add_middleware(_LeaseClients())
+
+
+async def reload_clients() -> Dict[str, Any]:
+    """Rebuild the client registry from the environment, e.g. after a key rotation.
+
+    Tool calls already running keep the previous client, which is closed once
+    the last of them finishes.
+
+    Returns:
+        Dict mapping API names to the freshly created client instances.
+    """
+    global _generation
+    with _generation_lock:
+        previous = _generation
+        _generation = _ClientGeneration()
+        registry = _generation.registry
+    if previous is not None:
+        previous.retired = True
+        if previous.active == 0:
+            await previous.client.aclose()
+    return registry
 
 
 # -------- Album tools --------
 @mcp.tool(description="album.getInfo — Get album metadata & tracks")
-def album_get_info(
+async def album_get_info(
     artist: Optional[str] = None,
     album: Optional[str] = None,
     mbid: Optional[str] = None,
@@ -63,13 +153,13 @@ def album_get_info(
     Returns:
         Dict containing album information.
     """
-    return _clients()["album"].get_info(
+    return await _clients()["album"].get_info(
         artist, album, mbid, autocorrect, username, lang
     )
 
 
 @mcp.tool(description="album.getTags — Get a user's tags for an album")
-def album_get_tags(
+async def album_get_tags(
     artist: Optional[str] = None,
     album: Optional[str] = None,
     mbid: Optional[str] = None,
@@ -88,11 +178,11 @@ def album_get_tags(
     Returns:
         Dict containing album tags.
     """
-    return _clients()["album"].get_tags(artist, album, mbid, autocorrect, user)
+    return await _clients()["album"].get_tags(artist, album, mbid, autocorrect, user)
 
 
 @mcp.tool(description="album.getTopTags — Get top tags for an album")
-def album_get_top_tags(
+async def album_get_top_tags(
     artist: Optional[str] = None,
     album: Optional[str] = None,
     mbid: Optional[str] = None,
@@ -109,11 +199,11 @@ def album_get_top_tags(
     Returns:
         Dict containing top album tags.
     """
-    return _clients()["album"].get_top_tags(artist, album, mbid, autocorrect)
+    return await _clients()["album"].get_top_tags(artist, album, mbid, autocorrect)
 
 
 @mcp.tool(description="album.search — Search for albums")
-def album_search(
+async def album_search(
     album: str,
     limit: Optional[int] = None,
     page: Optional[int] = None
@@ -128,12 +218,12 @@ def album_search(
     Returns:
         Dict containing search results.
     """
-    return _clients()["album"].search(album, limit, page)
+    return await _clients()["album"].search(album, limit, page)
 
 
 # -------- Artist tools --------
 @mcp.tool(description="artist.getCorrection — Get canonical correction for artist name")
-def artist_get_correction(
+async def artist_get_correction(
     artist: str
 ):
     """Get canonical correction for artist name.
@@ -144,11 +234,11 @@ def artist_get_correction(
     Returns:
         Dict containing corrected artist information.
     """
-    return _clients()["artist"].get_correction(artist)
+    return await _clients()["artist"].get_correction(artist)
 
 
 @mcp.tool(description="artist.getInfo — Get artist info")
-def artist_get_info(
+async def artist_get_info(
     artist: Optional[str] = None,
     mbid: Optional[str] = None,
     lang: Optional[str] = None,
@@ -167,11 +257,11 @@ def artist_get_info(
     Returns:
         Dict containing artist information.
     """
-    return _clients()["artist"].get_info(artist, mbid, lang, autocorrect, username)
+    return await _clients()["artist"].get_info(artist, mbid, lang, autocorrect, username)
 
 
 @mcp.tool(description="artist.getSimilar — Get similar artists")
-def artist_get_similar(
+async def artist_get_similar(
     artist: Optional[str] = None,
     mbid: Optional[str] = None,
     autocorrect: Optional[int] = None,
@@ -188,11 +278,11 @@ def artist_get_similar(
     Returns:
         Dict containing similar artists.
     """
-    return _clients()["artist"].get_similar(artist, mbid, autocorrect, limit)
+    return await _clients()["artist"].get_similar(artist, mbid, autocorrect, limit)
 
 
 @mcp.tool(description="artist.getTags — Get a user's tags for an artist")
-def artist_get_tags(
+async def artist_get_tags(
     artist: Optional[str] = None,
     mbid: Optional[str] = None,
     user: Optional[str] = None,
@@ -209,11 +299,11 @@ def artist_get_tags(
     Returns:
         Dict containing user tags for the artist.
     """
-    return _clients()["artist"].get_tags(artist, mbid, user, autocorrect)
+    return await _clients()["artist"].get_tags(artist, mbid, user, autocorrect)
 
 
 @mcp.tool(description="artist.getTopAlbums — Top albums by artist")
-def artist_get_top_albums(
+async def artist_get_top_albums(
     artist: Optional[str] = None,
     mbid: Optional[str] = None,
     autocorrect: Optional[int] = None,
@@ -232,11 +322,11 @@ def artist_get_top_albums(
     Returns:
         Dict containing top albums.
     """
-    return _clients()["artist"].get_top_albums(artist, mbid, autocorrect, page, limit)
+    return await _clients()["artist"].get_top_albums(artist, mbid, autocorrect, page, limit)
 
 
 @mcp.tool(description="artist.getTopTags — Top tags for artist")
-def artist_get_top_tags(
+async def artist_get_top_tags(
     artist: Optional[str] = None,
     mbid: Optional[str] = None,
     autocorrect: Optional[int] = None,
@@ -251,11 +341,11 @@ def artist_get_top_tags(
     Returns:
         Dict containing top tags.
     """
-    return _clients()["artist"].get_top_tags(artist, mbid, autocorrect)
+    return await _clients()["artist"].get_top_tags(artist, mbid, autocorrect)
 
 
 @mcp.tool(description="artist.getTopTracks — Top tracks by artist")
-def artist_get_top_tracks(
+async def artist_get_top_tracks(
     artist: Optional[str] = None,
     mbid: Optional[str] = None,
     autocorrect: Optional[int] = None,
@@ -274,11 +364,11 @@ def artist_get_top_tracks(
     Returns:
         Dict containing top tracks.
     """
-    return _clients()["artist"].get_top_tracks(artist, mbid, autocorrect, page, limit)
+    return await _clients()["artist"].get_top_tracks(artist, mbid, autocorrect, page, limit)
 
 
 @mcp.tool(description="artist.search — Search for artists")
-def artist_search(artist: str, limit: Optional[int] = None, page: Optional[int] = None):
+async def artist_search(artist: str, limit: Optional[int] = None, page: Optional[int] = None):
     """Search for artists.
 
     Args:
@@ -289,12 +379,12 @@ def artist_search(artist: str, limit: Optional[int] = None, page: Optional[int]
     Returns:
         Dict containing search results.
     """
-    return _clients()["artist"].search(artist, limit, page)
+    return await _clients()["artist"].search(artist, limit, page)
 
 
 # -------- Chart tools --------
 @mcp.tool(description="chart.getTopArtists — Global top artists")
-def chart_get_top_artists(page: Optional[int] = None, limit: Optional[int] = None):
+async def chart_get_top_artists(page: Optional[int] = None, limit: Optional[int] = None):
     """Global top artists.
 
     Args:
@@ -304,11 +394,11 @@ def chart_get_top_artists(page: Optional[int] = None, limit: Optional[int] = Non
     Returns:
         Dict containing top artists chart data.
     """
-    return _clients()["chart"].get_top_artists(page, limit)
+    return await _clients()["chart"].get_top_artists(page, limit)
 
 
 @mcp.tool(description="chart.getTopTags — Global top tags")
-def chart_get_top_tags(page: Optional[int] = None, limit: Optional[int] = None):
+async def chart_get_top_tags(page: Optional[int] = None, limit: Optional[int] = None):
     """Global top tags.
 
     Args:
@@ -318,11 +408,11 @@ def chart_get_top_tags(page: Optional[int] = None, limit: Optional[int] = None):
     Returns:
         Dict containing top tags chart data.
     """
-    return _clients()["chart"].get_top_tags(page, limit)
+    return await _clients()["chart"].get_top_tags(page, limit)
 
 
 @mcp.tool(description="chart.getTopTracks — Global top tracks")
-def chart_get_top_tracks(page: Optional[int] = None, limit: Optional[int] = None):
+async def chart_get_top_tracks(page: Optional[int] = None, limit: Optional[int] = None):
     """Global top tracks.
 
     Args:
@@ -332,12 +422,12 @@ def chart_get_top_tracks(page: Optional[int] = None, limit: Optional[int] = None
     Returns:
         Dict containing top tracks chart data.
     """
-    return _clients()["chart"].get_top_tracks(page, limit)
+    return await _clients()["chart"].get_top_tracks(page, limit)
 
 
 # -------- Geo tools --------
 @mcp.tool(description="geo.getTopArtists — Top artists by country")
-def geo_get_top_artists(
+async def geo_get_top_artists(
     country: str, page: Optional[int] = None, limit: Optional[int] = None
 ):
     """Top artists by country.
@@ -350,11 +440,11 @@ def geo_get_top_artists(
     Returns:
         Dict containing top artists by country.
     """
-    return _clients()["geo"].get_top_artists(country, page, limit)
+    return await _clients()["geo"].get_top_artists(country, page, limit)
 
 
 @mcp.tool(description="geo.getTopTracks — Top tracks by country/metro")
-def geo_get_top_tracks(
+async def geo_get_top_tracks(
     country: str,
     location: Optional[str] = None,
     page: Optional[int] = None,
@@ -371,12 +461,12 @@ def geo_get_top_tracks(
     Returns:
         Dict containing top tracks by location.
     """
-    return _clients()["geo"].get_top_tracks(country, location, page, limit)
+    return await _clients()["geo"].get_top_tracks(country, location, page, limit)
 
 
 # -------- Library tools --------
 @mcp.tool(description="library.getArtists — Artists in a user's library")
-def library_get_artists(
+async def library_get_artists(
     user: str, page: Optional[int] = None, limit: Optional[int] = None
 ):
     """Artists in a user's library.
@@ -389,12 +479,12 @@ def library_get_artists(
     Returns:
         Dict containing artists from user's library.
     """
-    return _clients()["library"].get_artists(user, page, limit)
+    return await _clients()["library"].get_artists(user, page, limit)
 
 
 # -------- Tag tools --------
 @mcp.tool(description="tag.getInfo — Tag metadata and wiki")
-def tag_get_info(tag: str, lang: Optional[str] = None):
+async def tag_get_info(tag: str, lang: Optional[str] = None):
     """Tag metadata and wiki.
 
     Args:
@@ -404,11 +494,11 @@ def tag_get_info(tag: str, lang: Optional[str] = None):
     Returns:
         Dict containing tag information.
     """
-    return _clients()["tag"].get_info(tag, lang)
+    return await _clients()["tag"].get_info(tag, lang)
 
 
 @mcp.tool(description="tag.getSimilar — Similar tags")
-def tag_get_similar(tag: str):
+async def tag_get_similar(tag: str):
     """Similar tags.
 
     Args:
@@ -417,11 +507,11 @@ def tag_get_similar(tag: str):
     Returns:
         Dict containing similar tags.
     """
-    return _clients()["tag"].get_similar(tag)
+    return await _clients()["tag"].get_similar(tag)
 
 
 @mcp.tool(description="tag.getTopAlbums — Top albums for a tag")
-def tag_get_top_albums(
+async def tag_get_top_albums(
     tag: str, page: Optional[int] = None, limit: Optional[int] = None
 ):
     """Top albums for a tag.
@@ -434,11 +524,11 @@ def tag_get_top_albums(
     Returns:
         Dict containing top albums for the tag.
     """
-    return _clients()["tag"].get_top_albums(tag, page, limit)
+    return await _clients()["tag"].get_top_albums(tag, page, limit)
 
 
 @mcp.tool(description="tag.getTopArtists — Top artists for a tag")
-def tag_get_top_artists(
+async def tag_get_top_artists(
     tag: str, page: Optional[int] = None, limit: Optional[int] = None
 ):
     """Top artists for a tag.
@@ -451,21 +541,21 @@ def tag_get_top_artists(
     Returns:
         Dict containing top artists for the tag.
     """
-    return _clients()["tag"].get_top_artists(tag, page, limit)
+    return await _clients()["tag"].get_top_artists(tag, page, limit)
 
 
 @mcp.tool(description="tag.getTopTags — Global top tags")
-def tag_get_top_tags():
+async def tag_get_top_tags():
     """Global top tags.
 
     Returns:
         Dict containing global top tags.
     """
-    return _clients()["tag"].get_top_tags()
+    return await _clients()["tag"].get_top_tags()
 
 
 @mcp.tool(description="tag.getTopTracks — Top tracks for a tag")
-def tag_get_top_tracks(
+async def tag_get_top_tracks(
     tag: str, page: Optional[int] = None, limit: Optional[int] = None
 ):
     """Top tracks for a tag.
@@ -478,11 +568,11 @@ def tag_get_top_tracks(
     Returns:
         Dict containing top tracks for the tag.
     """
-    return _clients()["tag"].get_top_tracks(tag, page, limit)
+    return await _clients()["tag"].get_top_tracks(tag, page, limit)
 
 
 @mcp.tool(description="tag.getWeeklyChartList — Weekly chart date ranges for a tag")
-def tag_get_weekly_chart_list(tag: str):
+async def tag_get_weekly_chart_list(tag: str):
     """Weekly chart date ranges for a tag.
 
     Args:
@@ -491,12 +581,12 @@ def tag_get_weekly_chart_list(tag: str):
     Returns:
         Dict containing available weekly chart date ranges.
     """
-    return _clients()["tag"].get_weekly_chart_list(tag)
+    return await _clients()["tag"].get_weekly_chart_list(tag)
 
 
 # -------- Track tools --------
 @mcp.tool(description="track.getCorrection — Canonical correction for track")
-def track_get_correction(artist: str, track: str):
+async def track_get_correction(artist: str, track: str):
     """Canonical correction for track.
 
     Args:
@@ -506,11 +596,11 @@ def track_get_correction(artist: str, track: str):
     Returns:
         Dict containing corrected track information.
     """
-    return _clients()["track"].get_correction(artist, track)
+    return await _clients()["track"].get_correction(artist, track)
 
 
 @mcp.tool(description="track.getInfo — Track info")
-def track_get_info(
+async def track_get_info(
     artist: Optional[str] = None,
     track: Optional[str] = None,
     mbid: Optional[str] = None,
@@ -529,11 +619,11 @@ def track_get_info(
     Returns:
         Dict containing track information.
     """
-    return _clients()["track"].get_info(artist, track, mbid, autocorrect, username)
+    return await _clients()["track"].get_info(artist, track, mbid, autocorrect, username)
 
 
 @mcp.tool(description="track.getSimilar — Similar tracks")
-def track_get_similar(
+async def track_get_similar(
     artist: Optional[str] = None,
     track: Optional[str] = None,
     mbid: Optional[str] = None,
@@ -552,11 +642,11 @@ def track_get_similar(
     Returns:
         Dict containing similar tracks.
     """
-    return _clients()["track"].get_similar(artist, track, mbid, autocorrect, limit)
+    return await _clients()["track"].get_similar(artist, track, mbid, autocorrect, limit)
 
 
 @mcp.tool(description="track.getTags — User's tags for a track")
-def track_get_tags(
+async def track_get_tags(
     artist: Optional[str] = None,
     track: Optional[str] = None,
     mbid: Optional[str] = None,
@@ -575,11 +665,11 @@ def track_get_tags(
     Returns:
         Dict containing user tags for the track.
     """
-    return _clients()["track"].get_tags(artist, track, mbid, user, autocorrect)
+    return await _clients()["track"].get_tags(artist, track, mbid, user, autocorrect)
 
 
 @mcp.tool(description="track.getTopTags — Top tags for a track")
-def track_get_top_tags(
+async def track_get_top_tags(
     artist: Optional[str] = None,
     track: Optional[str] = None,
     mbid: Optional[str] = None,
@@ -596,11 +686,11 @@ def track_get_top_tags(
     Returns:
         Dict containing top tags for the track.
     """
-    return _clients()["track"].get_top_tags(artist, track, mbid, autocorrect)
+    return await _clients()["track"].get_top_tags(artist, track, mbid, autocorrect)
 
 
 @mcp.tool(description="track.search — Search for tracks")
-def track_search(
+async def track_search(
     track: str,
     artist: Optional[str] = None,
     limit: Optional[int] = None,
@@ -617,12 +707,28 @@ def track_search(
     Returns:
         Dict containing search results.
     """
-    return _clients()["track"].search(track, artist, limit, page)
+    return await _clients()["track"].search(track, artist, limit, page)
+
+
+@mcp.tool(description="track.scrobble — Scrobble many tracks, 50 per request")
+async def track_scrobble_batch(scrobbles: List[Dict[str, Any]], concurrency: int = 1):
+    """Scrobble many tracks, 50 per request.
+
+    Args:
+        scrobbles: Items with artist, track and timestamp (Unix seconds), and
+            optionally album, album_artist, track_number, mbid and duration.
+        concurrency: Number of 50-scrobble requests to send at the same time.
+
+    Returns:
+        Dict with accepted, ignored and failed counts, requests sent, and
+        per-scrobble status in input order.
+    """
+    return await _clients()["track"].scrobble_batch(scrobbles, concurrency=concurrency)
 
 
 # -------- User tools --------
 @mcp.tool(description="user.getFriends — Get a user's friends")
-def user_get_friends(
+async def user_get_friends(
     user: str,
     recent_tracks: Optional[bool] = None,
     page: Optional[int] = None,
@@ -639,11 +745,11 @@ def user_get_friends(
     Returns:
         Dict containing user's friends.
     """
-    return _clients()["user"].get_friends(user, recent_tracks, page, limit)
+    return await _clients()["user"].get_friends(user, recent_tracks, page, limit)
 
 
 @mcp.tool(description="user.getInfo — Get user profile info")
-def user_get_info(user: Optional[str] = None):
+async def user_get_info(user: Optional[str] = None):
     """Get user profile info.
 
     Args:
@@ -652,11 +758,11 @@ def user_get_info(user: Optional[str] = None):
     Returns:
         Dict containing user profile information.
     """
-    return _clients()["user"].get_info(user)
+    return await _clients()["user"].get_info(user)
 
 
 @mcp.tool(description="user.getLovedTracks — Loved tracks by user")
-def user_get_loved_tracks(
+async def user_get_loved_tracks(
     user: str, page: Optional[int] = None, limit: Optional[int] = None
 ):
     """Loved tracks by user.
@@ -669,13 +775,13 @@ def user_get_loved_tracks(
     Returns:
         Dict containing user's loved tracks.
     """
-    return _clients()["user"].get_loved_tracks(user, page, limit)
+    return await _clients()["user"].get_loved_tracks(user, page, limit)
 
 
 @mcp.tool(
     description="user.getPersonalTags — Personal tags for a type (artist/album/track)"
 )
-def user_get_personal_tags(user: str, tag: str, tagging_type: str):
+async def user_get_personal_tags(user: str, tag: str, tagging_type: str):
     """Personal tags for a type (artist/album/track).
 
     Args:
@@ -686,11 +792,11 @@ def user_get_personal_tags(user: str, tag: str, tagging_type: str):
     Returns:
         Dict containing personal tags for the specified type.
     """
-    return _clients()["user"].get_personal_tags(user, tag, tagging_type)
+    return await _clients()["user"].get_personal_tags(user, tag, tagging_type)
 
 
 @mcp.tool(description="user.getRecentTracks — Recent tracks listened by user")
-def user_get_recent_tracks(
+async def user_get_recent_tracks(
     user: str,
     page: Optional[int] = None,
     limit: Optional[int] = None,
@@ -709,13 +815,13 @@ def user_get_recent_tracks(
     Returns:
         Dict containing user's recent tracks.
     """
-    return _clients()["user"].get_recent_tracks(
+    return await _clients()["user"].get_recent_tracks(
         user, page, limit, from_timestamp, to_timestamp
     )
 
 
 @mcp.tool(description="user.getTopAlbums — User's top albums")
-def user_get_top_albums(
+async def user_get_top_albums(
     user: str,
     period: Optional[str] = None,
     page: Optional[int] = None,
@@ -732,11 +838,11 @@ def user_get_top_albums(
     Returns:
         Dict containing user's top albums.
     """
-    return _clients()["user"].get_top_albums(user, period, page, limit)
+    return await _clients()["user"].get_top_albums(user, period, page, limit)
 
 
 @mcp.tool(description="user.getTopArtists — User's top artists")
-def user_get_top_artists(
+async def user_get_top_artists(
     user: str,
     period: Optional[str] = None,
     page: Optional[int] = None,
@@ -753,11 +859,11 @@ def user_get_top_artists(
     Returns:
         Dict containing user's top artists.
     """
-    return _clients()["user"].get_top_artists(user, period, page, limit)
+    return await _clients()["user"].get_top_artists(user, period, page, limit)
 
 
 @mcp.tool(description="user.getTopTags — User's top tags")
-def user_get_top_tags(user: str):
+async def user_get_top_tags(user: str):
     """User's top tags.
 
     Args:
@@ -766,11 +872,11 @@ def user_get_top_tags(user: str):
     Returns:
         Dict containing user's top tags.
     """
-    return _clients()["user"].get_top_tags(user)
+    return await _clients()["user"].get_top_tags(user)
 
 
 @mcp.tool(description="user.getTopTracks — User's top tracks")
-def user_get_top_tracks(
+async def user_get_top_tracks(
     user: str,
     period: Optional[str] = None,
     page: Optional[int] = None,
@@ -787,11 +893,11 @@ def user_get_top_tracks(
     Returns:
         Dict containing user's top tracks.
     """
-    return _clients()["user"].get_top_tracks(user, period, page, limit)
+    return await _clients()["user"].get_top_tracks(user, period, page, limit)
 
 
 @mcp.tool(description="user.getWeeklyAlbumChart — Weekly album chart for user")
-def user_get_weekly_album_chart(
+async def user_get_weekly_album_chart(
     user: str, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None
 ):
     """Weekly album chart for user.
@@ -804,11 +910,11 @@ def user_get_weekly_album_chart(
     Returns:
         Dict containing weekly album chart data.
     """
-    return _clients()["user"].get_weekly_album_chart(user, from_timestamp, to_timestamp)
+    return await _clients()["user"].get_weekly_album_chart(user, from_timestamp, to_timestamp)
 
 
 @mcp.tool(description="user.getWeeklyArtistChart — Weekly artist chart for user")
-def user_get_weekly_artist_chart(
+async def user_get_weekly_artist_chart(
     user: str, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None
 ):
     """Weekly artist chart for user.
@@ -821,7 +927,7 @@ def user_get_weekly_artist_chart(
     Returns:
         Dict containing weekly artist chart data.
     """
-    return _clients()["user"].get_weekly_artist_chart(
+    return await _clients()["user"].get_weekly_artist_chart(
         user, from_timestamp, to_timestamp
     )
 
@@ -829,7 +935,7 @@ def user_get_weekly_artist_chart(
 @mcp.tool(
     description="user.getWeeklyChartList — Available weekly chart ranges for user"
 )
-def user_get_weekly_chart_list(user: str):
+async def user_get_weekly_chart_list(user: str):
     """Available weekly chart ranges for user.
 
     Args:
@@ -838,11 +944,11 @@ def user_get_weekly_chart_list(user: str):
     Returns:
         Dict containing available weekly chart date ranges.
     """
-    return _clients()["user"].get_weekly_chart_list(user)
+    return await _clients()["user"].get_weekly_chart_list(user)
 
 
 @mcp.tool(description="user.getWeeklyTrackChart — Weekly track chart for user")
-def user_get_weekly_track_chart(
+async def user_get_weekly_track_chart(
     user: str, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None
 ):
     """Weekly track chart for user.
@@ -855,7 +961,7 @@ def user_get_weekly_track_chart(
     Returns:
         Dict containing weekly track chart data.
     """
-    return _clients()["user"].get_weekly_track_chart(user, from_timestamp, to_timestamp)
+    return await _clients()["user"].get_weekly_track_chart(user, from_timestamp, to_timestamp)
 
 
 if __name__ == "__main__":
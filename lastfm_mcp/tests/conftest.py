@@ -175,7 +175,7 @@ def clean_environment():
 @pytest.fixture
 def mock_get_request(mock_success_response):
     """Mock GET request that returns success response."""
-    with patch("lastfm_client.base.requests.get") as mock_get:
+    with patch("lastfm_client.base.requests.Session.get") as mock_get:
         mock_get.return_value = mock_success_response
         yield mock_get
 
@@ -183,7 +183,7 @@ def mock_get_request(mock_success_response):
 @pytest.fixture
 def mock_post_request(mock_success_response):
     """Mock POST request that returns success response."""
-    with patch("lastfm_client.base.requests.post") as mock_post:
+    with patch("lastfm_client.base.requests.Session.post") as mock_post:
         mock_post.return_value = mock_success_response
         yield mock_post
 
@@ -191,7 +191,7 @@ def mock_post_request(mock_success_response):
 @pytest.fixture
 def mock_get_request_error(mock_error_response):
     """Mock GET request that raises an error."""
-    with patch("lastfm_client.base.requests.get") as mock_get:
+    with patch("lastfm_client.base.requests.Session.get") as mock_get:
         mock_get.return_value = mock_error_response
         yield mock_get
 
@@ -199,6 +199,6 @@ def mock_get_request_error(mock_error_response):
 @pytest.fixture
 def mock_post_request_error(mock_error_response):
     """Mock POST request that raises an error."""
-    with patch("lastfm_client.base.requests.post") as mock_post:
+    with patch("lastfm_client.base.requests.Session.post") as mock_post:
         mock_post.return_value = mock_error_response
         yield mock_post
@@ -1,8 +1,13 @@
+import asyncio
+import json
 import os
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import hashlib
 
+import httpx
+import requests
+
 from lastfm_client import (
     LastfmClient,
     LastfmAPIBase,
@@ -15,7 +20,16 @@ from lastfm_client import (
     TagAPI,
     TrackAPI,
     UserAPI,
+    AsyncLastfmClient,
+    AsyncArtistAPI,
+    AsyncTrackAPI,
+    AsyncUserAPI,
 )
+from lastfm_client.base import AsyncLastfmAPIBase, create_session
+from lastfm_client.cache import ResponseCache
+from lastfm_client import export
+from lastfm_client.ratelimit import TokenBucket
+from lastfm_client.singleflight import SingleFlight
 
 
 class TestLastfmAPIBase:
@@ -71,7 +85,7 @@ class TestLastfmAPIBase:
         actual_sig = client._signature(params)
         assert actual_sig == expected_sig
 
-    @patch("lastfm_client.base.requests.get")
+    @patch("lastfm_client.base.requests.Session.get")
     def test_get_request_success(self, mock_get):
         """Test successful GET request."""
         mock_response = Mock()
@@ -89,7 +103,7 @@ class TestLastfmAPIBase:
         assert call_args[1]["params"]["api_key"] == "test_key"
         assert call_args[1]["params"]["format"] == "json"
 
-    @patch("lastfm_client.base.requests.post")
+    @patch("lastfm_client.base.requests.Session.post")
     def test_post_request_with_session_key(self, mock_post):
         """Test successful POST request with session key."""
         mock_response = Mock()
@@ -128,7 +142,7 @@ class TestLastfmAPIBase:
         ):
             client._request("test.method", {"param": "value"}, "POST")
 
-    @patch("lastfm_client.client.requests.get")
+    @patch("lastfm_client.base.requests.Session.get")
     def test_request_raises_for_status(self, mock_get):
         """Test that request properly raises for HTTP errors."""
         mock_response = Mock()
@@ -140,11 +154,458 @@ class TestLastfmAPIBase:
         with pytest.raises(Exception, match="HTTP Error"):
             client._request("test.method", {"param": "value"})
 
+    def test_create_session_configures_pool_and_retries(self):
+        """Test that the pooled session mounts a retrying adapter."""
+        session = create_session(pool_size=25, max_retries=5)
+
+        adapter = session.get_adapter("https://ws.audioscrobbler.com/2.0/")
+        assert adapter._pool_maxsize == 25
+        assert adapter.max_retries.total == 5
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+    def test_init_uses_provided_session(self):
+        """Test that an explicit session is used instead of creating one."""
+        session = Mock()
+        session.get.return_value.json.return_value = {"success": True}
+
+        client = LastfmAPIBase(api_key="test_key", session=session)
+        result = client._request("test.method", {})
+
+        assert client.session is session
+        assert result == {"success": True}
+        session.get.assert_called_once()
+
+
+class TestAsyncLastfmAPIBase:
+    """Test cases for the async Last.fm API base class."""
+
+    @staticmethod
+    def _mock_client(calls, payload):
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=payload)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def test_get_request_success(self):
+        """Test successful async GET request."""
+        calls = []
+        client = AsyncLastfmAPIBase(
+            api_key="test_key", http_client=self._mock_client(calls, {"success": True})
+        )
+
+        result = asyncio.run(client._request("test.method", {"param": "value"}))
+
+        assert result == {"success": True}
+        assert len(calls) == 1
+        assert calls[0].method == "GET"
+        assert calls[0].url.params["method"] == "test.method"
+        assert calls[0].url.params["api_key"] == "test_key"
+        assert calls[0].url.params["param"] == "value"
+
+    def test_post_request_is_signed(self):
+        """Test async POST request carries session key and signature."""
+        calls = []
+        client = AsyncLastfmAPIBase(
+            api_key="test_key",
+            api_secret="test_secret",
+            session_key="test_session",
+            http_client=self._mock_client(calls, {"success": True}),
+        )
+
+        asyncio.run(client._request("test.method", {"artist": "A"}, "POST"))
+
+        body = calls[0].content.decode()
+        assert calls[0].method == "POST"
+        assert "sk=test_session" in body
+        assert "api_sig=" in body
+
+    def test_post_request_missing_session_key(self):
+        """Test async POST request without session key raises error."""
+        client = AsyncLastfmAPIBase(api_key="test_key", api_secret="test_secret")
+
+        with pytest.raises(RuntimeError, match="requires a Last.fm session key"):
+            asyncio.run(client._request("test.method", {}, "POST"))
+
+    def test_sub_api_methods_are_awaitable(self):
+        """Test that async sub-APIs reuse sync parameter handling."""
+        calls = []
+        api = AsyncArtistAPI(
+            api_key="test_key",
+            http_client=self._mock_client(calls, {"artist": {"name": "Test Artist"}}),
+        )
+
+        result = asyncio.run(api.get_info(artist="Test Artist", autocorrect=1))
+
+        assert result == {"artist": {"name": "Test Artist"}}
+        assert calls[0].url.params["method"] == "artist.getinfo"
+        assert calls[0].url.params["autocorrect"] == "1"
+
+    def test_client_shares_one_http_client(self):
+        """Test that every async sub-API reuses the client's connection pool."""
+        client = AsyncLastfmClient(api_key="test_key")
+
+        assert isinstance(client.track, AsyncTrackAPI)
+        assert all(
+            api.http_client is client.http_client
+            for api in (client.album, client.artist, client.track, client.user)
+        )
+        asyncio.run(client.aclose())
+
+
+def _recent_page(page, total_pages, names, now_playing=False):
+    """Build one page of a user.getrecenttracks response."""
+    tracks = [{"name": name} for name in names]
+    if now_playing:
+        tracks.insert(0, {"name": "Live", "@attr": {"nowplaying": "true"}})
+    return {
+        "recenttracks": {
+            "track": tracks,
+            "@attr": {"page": str(page), "totalPages": str(total_pages)},
+        }
+    }
+
+
+class TestPagination:
+    """Test cases for the auto-paginating iterators."""
+
+    PAGES = {
+        1: _recent_page(1, 3, ["a", "b"], now_playing=True),
+        2: _recent_page(2, 3, ["c", "d"]),
+        3: _recent_page(3, 3, ["e"]),
+    }
+
+    @patch("lastfm_client.base.LastfmAPIBase._request")
+    def test_iter_recent_tracks_walks_all_pages(self, mock_request):
+        """Test that pages are followed to totalPages and now playing is skipped."""
+        mock_request.side_effect = lambda method, params: self.PAGES[params["page"]]
+        api = UserAPI(api_key="test_key")
+
+        names = [t["name"] for t in api.iter_recent_tracks("testuser", to_timestamp=100)]
+
+        assert names == ["a", "b", "c", "d", "e"]
+        assert [c.args[1]["page"] for c in mock_request.call_args_list] == [1, 2, 3]
+        assert mock_request.call_args_list[0].args[1] == {
+            "user": "testuser", "page": 1, "limit": 200, "to": 100
+        }
+
+    @patch("lastfm_client.base.LastfmAPIBase._request")
+    def test_early_stop_limits_requests(self, mock_request):
+        """Test that breaking out fetches at most one page ahead."""
+        mock_request.side_effect = lambda method, params: self.PAGES[params["page"]]
+        api = UserAPI(api_key="test_key")
+
+        tracks = api.iter_recent_tracks("testuser")
+        first = next(tracks)
+        tracks.close()
+
+        assert first["name"] == "a"
+        assert mock_request.call_count <= 2
+
+    @patch("lastfm_client.base.LastfmAPIBase._request")
+    def test_max_pages_without_prefetch(self, mock_request):
+        """Test max_pages and sequential fetching."""
+        mock_request.side_effect = lambda method, params: self.PAGES[params["page"]]
+        api = UserAPI(api_key="test_key")
+
+        names = [t["name"] for t in api.iter_recent_tracks("testuser", max_pages=2, prefetch=False)]
+
+        assert names == ["a", "b", "c", "d"]
+        assert mock_request.call_count == 2
+
+    @patch("lastfm_client.base.LastfmAPIBase._request")
+    def test_single_item_and_error_payloads(self, mock_request):
+        """Test that a lone item dict is wrapped and error payloads raise."""
+        api = LibraryAPI(api_key="test_key")
+        mock_request.return_value = {
+            "artists": {"artist": {"name": "Solo"}, "@attr": {"totalPages": "1"}}
+        }
+        assert list(api.iter_artists("testuser")) == [{"name": "Solo"}]
+
+        mock_request.return_value = {"error": 6, "message": "User not found"}
+        with pytest.raises(RuntimeError, match="User not found"):
+            list(api.iter_artists("nobody"))
+
+    @patch("lastfm_client.base.LastfmAPIBase._request")
+    def test_other_list_endpoints(self, mock_request):
+        """Test the container and item keys of the other iterators."""
+        mock_request.side_effect = [
+            {"lovedtracks": {"track": [{"name": "l"}], "@attr": {"totalPages": "1"}}},
+            {"toptracks": {"track": [{"name": "t"}], "@attr": {"totalPages": "1"}}},
+            {"topartists": {"artist": [{"name": "r"}], "@attr": {"totalPages": "1"}}},
+        ]
+
+        assert list(UserAPI(api_key="k").iter_loved_tracks("u")) == [{"name": "l"}]
+        assert list(ArtistAPI(api_key="k").iter_top_tracks("Cher")) == [{"name": "t"}]
+        assert list(TagAPI(api_key="k").iter_top_artists("rock")) == [{"name": "r"}]
+        methods = [c.args[0] for c in mock_request.call_args_list]
+        assert methods == ["user.getlovedtracks", "artist.gettoptracks", "tag.gettopartists"]
+
+    def test_async_iterator_prefetches_and_cancels(self):
+        """Test the async iterator pages through results and stops early."""
+        requested = []
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            requested.append(page)
+            return httpx.Response(200, json=self.PAGES[page])
+
+        api = AsyncUserAPI(
+            api_key="test_key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        async def consume(stop_after=None):
+            names = []
+            tracks = api.iter_recent_tracks("testuser")
+            async for track in tracks:
+                names.append(track["name"])
+                if len(names) == stop_after:
+                    break
+            await tracks.aclose()
+            return names
+
+        assert asyncio.run(consume()) == ["a", "b", "c", "d", "e"]
+        requested.clear()
+        assert asyncio.run(consume(stop_after=1)) == ["a"]
+        assert 1 in requested and 3 not in requested
+
+
+class TestTokenBucket:
+    """Test cases for the token-bucket rate limiter."""
+
+    def test_burst_then_steady_rate(self):
+        """Test that a full bucket allows a burst, then spaces calls by 1/rate."""
+        now = [0.0]
+        bucket = TokenBucket(rate=2, burst=2, clock=lambda: now[0])
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+        now[0] = 10.0
+        assert bucket.reserve() == 0
+
+    def test_invalid_configuration(self):
+        """Test that non-positive rates and bursts are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+
+class TestExportRecentTracks:
+    """Test cases for the parallel recent-tracks export."""
+
+    @staticmethod
+    def _user_api(pages, requested, failures=None):
+        failures = dict(failures or {})
+
+        async def handler(request):
+            page = int(request.url.params["page"])
+            requested.append(request)
+            if failures.get(page):
+                failures[page] -= 1
+                return httpx.Response(200, json={"error": 29, "message": "Rate limit exceeded"})
+            # Finish later pages first to prove output is reassembled in order
+            await asyncio.sleep(0.01 * (len(pages) - page))
+            return httpx.Response(200, json=pages[page])
+
+        return AsyncUserAPI(
+            api_key="test_key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+    PAGES = {
+        page: _recent_page(page, 5, [f"t{page}-{i}" for i in range(3)], now_playing=page == 1)
+        for page in range(1, 6)
+    }
+
+    def test_jsonl_export_in_page_order(self, tmp_path):
+        """Test that all pages are fetched concurrently and written in order."""
+        requested = []
+        path = tmp_path / "scrobbles.jsonl"
+        api = self._user_api(self.PAGES, requested)
+
+        count = asyncio.run(export.export_recent_tracks(
+            api, "testuser", str(path), to_timestamp=1700000000, concurrency=4, rate=1000
+        ))
+
+        names = [json.loads(line)["name"] for line in path.read_text().splitlines()]
+        assert count == 15
+        assert names == [f"t{p}-{i}" for p in range(1, 6) for i in range(3)]
+        assert {r.url.params["to"] for r in requested} == {"1700000000"}
+        assert {r.url.params["limit"] for r in requested} == {"200"}
+
+    def test_transient_errors_are_retried(self, tmp_path, monkeypatch):
+        """Test that Last.fm rate-limit errors are retried with backoff."""
+        monkeypatch.setattr(export, "RETRY_BACKOFF", 0)
+        requested = []
+        api = self._user_api(self.PAGES, requested, failures={3: 2})
+
+        count = asyncio.run(export.export_recent_tracks(
+            api, "testuser", str(tmp_path / "out.jsonl"), rate=1000
+        ))
+
+        assert count == 15
+        assert [int(r.url.params["page"]) for r in requested].count(3) == 3
+
+    def test_http_429_is_retried_after_retry_after(self, tmp_path, monkeypatch):
+        """Test that HTTP 429 responses are retried, waiting for Retry-After."""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(export.asyncio, "sleep", fake_sleep)
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "7"})
+            return httpx.Response(200, json=_recent_page(1, 1, ["a", "b", "c"]))
+
+        api = AsyncUserAPI(
+            api_key="test_key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        count = asyncio.run(export.export_recent_tracks(
+            api, "testuser", str(tmp_path / "out.jsonl"), rate=1000
+        ))
+
+        assert count == 3
+        assert len(calls) == 2
+        assert delays == [7.0]
+
+    def test_permanent_error_raises(self, tmp_path):
+        """Test that non-transient Last.fm errors abort the export."""
+        api = self._user_api({1: {"error": 6, "message": "User not found"}}, [])
+
+        with pytest.raises(RuntimeError, match="User not found"):
+            asyncio.run(export.export_recent_tracks(api, "nobody", str(tmp_path / "x.jsonl")))
+
+    def test_unknown_format(self, tmp_path):
+        """Test that unsupported formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            asyncio.run(export.export_recent_tracks(
+                AsyncUserAPI(api_key="k"), "u", str(tmp_path / "x.csv"), format="csv"
+            ))
+
+    def test_parquet_export(self, tmp_path):
+        """Test Parquet output with flattened columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        pages = {1: {"recenttracks": {
+            "track": [{
+                "name": "Song",
+                "artist": {"#text": "Band", "mbid": ""},
+                "album": {"#text": "Record", "mbid": "a1"},
+                "date": {"uts": "1700000000", "#text": "14 Nov 2023, 22:13"},
+                "url": "https://www.last.fm/music/Band/_/Song",
+            }],
+            "@attr": {"totalPages": "1"},
+        }}}
+        path = tmp_path / "scrobbles.parquet"
+
+        asyncio.run(export.export_recent_tracks(self._user_api(pages, []), "u", str(path)))
+
+        rows = pq.read_table(path).to_pylist()
+        assert rows == [{
+            "uts": 1700000000, "date": "14 Nov 2023, 22:13", "artist": "Band",
+            "artist_mbid": None, "album": "Record", "album_mbid": "a1", "track": "Song",
+            "track_mbid": None, "url": "https://www.last.fm/music/Band/_/Song",
+        }]
+
+
+class TestResponseCache:
+    """Test cases for the Last.fm response cache."""
+
+    def test_key_is_canonical_and_ignores_api_key(self):
+        """Test that parameter order and the API key do not affect the key."""
+        cache = ResponseCache()
+
+        first = cache.key_for("artist.getInfo", {"artist": "Cher", "lang": "en", "api_key": "a"})
+        second = cache.key_for("artist.getinfo", {"lang": "en", "artist": "Cher", "api_key": "b"})
+
+        assert first == second == "artist.getinfo?artist=Cher&lang=en"
+
+    def test_key_escapes_separators(self):
+        """Test that values containing & or = cannot collide with other parameters."""
+        cache = ResponseCache()
+
+        smuggled = cache.key_for("artist.getinfo", {"artist": "x&lang=de"})
+        separate = cache.key_for("artist.getinfo", {"artist": "x", "lang": "de"})
+
+        assert smuggled != separate
+        assert cache.key_for("artist.getinfo", {"artist": "AC/DC & Friends"}) == (
+            "artist.getinfo?artist=AC%2FDC+%26+Friends"
+        )
+
+    def test_post_and_user_specific_requests_bypass_cache(self):
+        """Test that writes and user-specific reads are never cached."""
+        cache = ResponseCache()
+
+        assert cache.key_for("track.love", {"artist": "A", "track": "B"}, "POST") is None
+        assert cache.key_for("user.getrecenttracks", {"user": "rj"}) is None
+        assert cache.key_for("artist.getinfo", {"artist": "A", "username": "rj"}) is None
+        assert cache.key_for("auth.gettoken", {}) is None
+
+    def test_entries_expire_after_per_method_ttl(self):
+        """Test TTL expiry using a controllable clock."""
+        now = [0.0]
+        cache = ResponseCache(ttls={"chart.gettopartists": 10}, clock=lambda: now[0])
+        key = cache.key_for("chart.gettopartists", {})
+
+        cache.set(key, {"artists": []}, cache.ttl_for("chart.gettopartists"))
+        assert cache.get(key) == {"artists": []}
+
+        now[0] = 11.0
+        assert cache.get(key) is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 0}
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = ResponseCache(max_size=2)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")
+        cache.set("c", 3, 60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_request_served_from_cache(self):
+        """Test that repeated GETs only hit the network once."""
+        session = Mock()
+        session.get.return_value.json.return_value = {"artist": {"name": "Cher"}}
+        client = ArtistAPI(api_key="test_key", session=session, cache=ResponseCache())
+
+        first = client.get_info(artist="Cher")
+        second = client.get_info(artist="Cher")
+
+        assert first == second == {"artist": {"name": "Cher"}}
+        session.get.assert_called_once()
+        assert client.cache.hits == 1
+
+    def test_error_payloads_are_not_cached(self):
+        """Test that Last.fm error responses are not stored."""
+        session = Mock()
+        session.get.return_value.json.return_value = {"error": 6, "message": "not found"}
+        client = ArtistAPI(api_key="test_key", session=session, cache=ResponseCache())
+
+        client.get_info(artist="Nobody")
+        client.get_info(artist="Nobody")
+
+        assert session.get.call_count == 2
+
 
 class TestAlbumAPI:
     """Test cases for the Album API."""
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_add_tags(self, mock_request):
         """Test adding tags to an album."""
         mock_request.return_value = {"status": "ok"}
@@ -159,7 +620,7 @@ class TestAlbumAPI:
             "POST",
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_info(self, mock_request):
         """Test getting album information."""
         mock_request.return_value = {"album": {"name": "Test Album"}}
@@ -172,7 +633,7 @@ class TestAlbumAPI:
             "album.getinfo", {"artist": "Test Artist", "album": "Test Album"}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_tags(self, mock_request):
         """Test getting album tags."""
         mock_request.return_value = {"tags": {"tag": []}}
@@ -185,7 +646,7 @@ class TestAlbumAPI:
             "album.gettags", {"artist": "Test Artist", "album": "Test Album"}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_search(self, mock_request):
         """Test album search."""
         mock_request.return_value = {"results": {"albummatches": {}}}
@@ -202,7 +663,7 @@ class TestAlbumAPI:
 class TestArtistAPI:
     """Test cases for the Artist API."""
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_info(self, mock_request):
         """Test getting artist information."""
         mock_request.return_value = {"artist": {"name": "Test Artist"}}
@@ -215,7 +676,7 @@ class TestArtistAPI:
             "artist.getinfo", {"artist": "Test Artist"}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_similar(self, mock_request):
         """Test getting similar artists."""
         mock_request.return_value = {"similarartists": {"artist": []}}
@@ -228,7 +689,7 @@ class TestArtistAPI:
             "artist.getsimilar", {"artist": "Test Artist", "limit": 5}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_top_albums(self, mock_request):
         """Test getting artist's top albums."""
         mock_request.return_value = {"topalbums": {"album": []}}
@@ -241,7 +702,7 @@ class TestArtistAPI:
             "artist.gettopalbums", {"artist": "Test Artist", "limit": 10}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_search(self, mock_request):
         """Test artist search."""
         mock_request.return_value = {"results": {"artistmatches": {}}}
@@ -258,7 +719,7 @@ class TestArtistAPI:
 class TestAuthAPI:
     """Test cases for the Auth API."""
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_token(self, mock_request):
         """Test getting authentication token."""
         mock_request.return_value = {"token": "test_token_123"}
@@ -269,7 +730,7 @@ class TestAuthAPI:
         assert result == {"token": "test_token_123"}
         mock_request.assert_called_once_with("auth.gettoken", {})
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_session(self, mock_request):
         """Test getting session with token."""
         mock_request.return_value = {"session": {"key": "session_123"}}
@@ -282,7 +743,7 @@ class TestAuthAPI:
             "auth.getsession", {"token": "test_token_123"}, "POST"
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_mobile_session(self, mock_request):
         """Test getting mobile session."""
         mock_request.return_value = {"session": {"key": "mobile_session_123"}}
@@ -301,7 +762,7 @@ class TestAuthAPI:
 class TestChartAPI:
     """Test cases for the Chart API."""
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_top_artists(self, mock_request):
         """Test getting top artists chart."""
         mock_request.return_value = {"artists": {"artist": []}}
@@ -314,7 +775,7 @@ class TestChartAPI:
             "chart.gettopartists", {"page": 1, "limit": 50}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_top_tracks(self, mock_request):
         """Test getting top tracks chart."""
         mock_request.return_value = {"tracks": {"track": []}}
@@ -329,7 +790,7 @@ class TestChartAPI:
 class TestTrackAPI:
     """Test cases for the Track API."""
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_info(self, mock_request):
         """Test getting track information."""
         mock_request.return_value = {"track": {"name": "Test Track"}}
@@ -342,7 +803,7 @@ class TestTrackAPI:
             "track.getinfo", {"artist": "Test Artist", "track": "Test Track"}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_scrobble(self, mock_request):
         """Test scrobbling a track."""
         mock_request.return_value = {"scrobbles": {"scrobble": {}}}
@@ -370,7 +831,136 @@ class TestTrackAPI:
             "POST",
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
+    def test_scrobble_batch(self, mock_request):
+        """Test that scrobbles are sent 50 per request with per-item status."""
+
+        def respond(method, params, http_method):
+            count = sum(1 for k in params if k.startswith("track["))
+            entries = [{"ignoredMessage": {"code": "0", "#text": ""}} for _ in range(count)]
+            if "artist[0]" in params and params["artist[0]"] == "Artist 50":
+                entries[1] = {"ignoredMessage": {"code": "3", "#text": "Timestamp too old"}}
+            return {"scrobbles": {"scrobble": entries, "@attr": {"accepted": count}}}
+
+        mock_request.side_effect = respond
+        api = TrackAPI(
+            api_key="test_key", api_secret="test_secret", session_key="test_session"
+        )
+        scrobbles = [
+            {"artist": f"Artist {i}", "track": f"Track {i}", "timestamp": 1640995200 + i}
+            for i in range(120)
+        ]
+        scrobbles[0]["album"] = "Test Album"
+
+        result = api.scrobble_batch(scrobbles, concurrency=3)
+
+        assert mock_request.call_count == 3
+        first = mock_request.call_args_list[0].args
+        assert first[0] == "track.scrobble" and first[2] == "POST"
+        assert first[1]["artist[49]"] == "Artist 49"
+        assert first[1]["album[0]"] == "Test Album"
+        assert "album[1]" not in first[1]
+        assert (result["accepted"], result["ignored"], result["failed"], result["requests"]) == (119, 1, 0, 3)
+        assert result["scrobbles"][51] == {
+            "index": 51,
+            "artist": "Artist 51",
+            "track": "Track 51",
+            "timestamp": 1640995251,
+            "status": "ignored",
+            "code": 3,
+            "message": "Timestamp too old",
+        }
+        assert [r["index"] for r in result["scrobbles"]] == list(range(120))
+
+    def test_scrobble_batch_reports_failed_request_and_keeps_going(self):
+        """Test that a batch whose request raises is marked failed and later batches still report."""
+        ok = {"scrobbles": {"scrobble": [{"ignoredMessage": {"code": "0", "#text": ""}}] * 50}}
+        api = TrackAPI(
+            api_key="test_key", api_secret="test_secret", session_key="test_session"
+        )
+        scrobbles = [{"artist": "A", "track": f"T{i}", "timestamp": i + 1} for i in range(150)]
+
+        with patch.object(
+            api, "_request", side_effect=[ok, requests.exceptions.ReadTimeout("timed out"), ok]
+        ) as mock_request:
+            result = api.scrobble_batch(scrobbles)
+
+        assert mock_request.call_count == 3
+        assert (result["accepted"], result["failed"], result["requests"]) == (100, 50, 3)
+        assert result["scrobbles"][49]["status"] == "accepted"
+        assert result["scrobbles"][50]["status"] == "failed"
+        assert result["scrobbles"][99]["message"] == "ReadTimeout: timed out"
+        assert result["scrobbles"][100]["status"] == "accepted"
+
+    def test_async_scrobble_batch_reports_failed_request(self):
+        """Test that an async batch failing at the transport level does not lose the others."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 2:
+                raise httpx.ConnectError("connection reset")
+            scrobble = {"ignoredMessage": {"code": "0", "#text": ""}}
+            return httpx.Response(200, json={"scrobbles": {"scrobble": [scrobble] * 50}})
+
+        api = AsyncTrackAPI(
+            api_key="test_key",
+            api_secret="test_secret",
+            session_key="test_session",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        scrobbles = [{"artist": "A", "track": f"T{i}", "timestamp": i + 1} for i in range(150)]
+
+        result = asyncio.run(api.scrobble_batch(scrobbles))
+
+        assert len(calls) == 3
+        assert (result["accepted"], result["failed"]) == (100, 50)
+        assert result["scrobbles"][75]["message"] == "ConnectError: connection reset"
+
+    def test_scrobble_batch_rejects_incomplete_items(self):
+        """Test that nothing is sent when a scrobble lacks a required field."""
+        api = TrackAPI(
+            api_key="test_key", api_secret="test_secret", session_key="test_session"
+        )
+
+        with patch.object(api, "_request") as mock_request:
+            with pytest.raises(ValueError, match="Scrobble 1 is missing timestamp"):
+                api.scrobble_batch([
+                    {"artist": "A", "track": "T", "timestamp": 1},
+                    {"artist": "A", "track": "T"},
+                ])
+        mock_request.assert_not_called()
+
+    def test_async_scrobble_batch_signs_each_request(self):
+        """Test async batches are signed POSTs and Last.fm errors mark the batch failed."""
+        bodies = []
+
+        def handler(request):
+            bodies.append(dict(httpx.QueryParams(request.content.decode())))
+            if len(bodies) == 2:
+                return httpx.Response(200, json={"error": 9, "message": "Invalid session key"})
+            scrobble = {"ignoredMessage": {"code": "0", "#text": ""}}
+            return httpx.Response(200, json={"scrobbles": {"scrobble": [scrobble] * 50}})
+
+        api = AsyncTrackAPI(
+            api_key="test_key",
+            api_secret="test_secret",
+            session_key="test_session",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        scrobbles = [{"artist": "A", "track": f"T{i}", "timestamp": i + 1} for i in range(60)]
+
+        result = asyncio.run(api.scrobble_batch(scrobbles))
+
+        assert len(bodies) == 2
+        assert bodies[0]["method"] == "track.scrobble"
+        assert bodies[0]["track[49]"] == "T49" and "track[50]" not in bodies[0]
+        assert bodies[1]["track[9]"] == "T59"
+        assert bodies[1]["api_sig"] == api._signature({k: v for k, v in bodies[1].items() if k != "api_sig"})
+        assert (result["accepted"], result["failed"]) == (50, 10)
+        assert result["scrobbles"][55]["message"] == "Invalid session key"
+
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_love_track(self, mock_request):
         """Test loving a track."""
         mock_request.return_value = {"status": "ok"}
@@ -385,7 +975,7 @@ class TestTrackAPI:
             "track.love", {"artist": "Test Artist", "track": "Test Track"}, "POST"
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_search(self, mock_request):
         """Test track search."""
         mock_request.return_value = {"results": {"trackmatches": {}}}
@@ -403,7 +993,7 @@ class TestTrackAPI:
 class TestUserAPI:
     """Test cases for the User API."""
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_info(self, mock_request):
         """Test getting user information."""
         mock_request.return_value = {"user": {"name": "testuser"}}
@@ -414,7 +1004,7 @@ class TestUserAPI:
         assert result == {"user": {"name": "testuser"}}
         mock_request.assert_called_once_with("user.getinfo", {"user": "testuser"})
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_recent_tracks(self, mock_request):
         """Test getting user's recent tracks."""
         mock_request.return_value = {"recenttracks": {"track": []}}
@@ -427,7 +1017,7 @@ class TestUserAPI:
             "user.getrecenttracks", {"user": "testuser", "limit": 10}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_top_artists(self, mock_request):
         """Test getting user's top artists."""
         mock_request.return_value = {"topartists": {"artist": []}}
@@ -440,7 +1030,7 @@ class TestUserAPI:
             "user.gettopartists", {"user": "testuser", "period": "7day", "limit": 20}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_loved_tracks(self, mock_request):
         """Test getting user's loved tracks."""
         mock_request.return_value = {"lovedtracks": {"track": []}}
@@ -457,7 +1047,7 @@ class TestUserAPI:
 class TestTagAPI:
     """Test cases for the Tag API."""
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_info(self, mock_request):
         """Test getting tag information."""
         mock_request.return_value = {"tag": {"name": "rock"}}
@@ -468,7 +1058,7 @@ class TestTagAPI:
         assert result == {"tag": {"name": "rock"}}
         mock_request.assert_called_once_with("tag.getinfo", {"tag": "rock"})
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_similar(self, mock_request):
         """Test getting similar tags."""
         mock_request.return_value = {"similartags": {"tag": []}}
@@ -479,7 +1069,7 @@ class TestTagAPI:
         assert result == {"similartags": {"tag": []}}
         mock_request.assert_called_once_with("tag.getsimilar", {"tag": "rock"})
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_top_artists(self, mock_request):
         """Test getting top artists for a tag."""
         mock_request.return_value = {"topartists": {"artist": []}}
@@ -496,7 +1086,7 @@ class TestTagAPI:
 class TestGeoAPI:
     """Test cases for the Geo API."""
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_top_artists(self, mock_request):
         """Test getting top artists by country."""
         mock_request.return_value = {"topartists": {"artist": []}}
@@ -509,7 +1099,7 @@ class TestGeoAPI:
             "geo.gettopartists", {"country": "United States", "limit": 30}
         )
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_top_tracks(self, mock_request):
         """Test getting top tracks by country and location."""
         mock_request.return_value = {"toptracks": {"track": []}}
@@ -527,7 +1117,7 @@ class TestGeoAPI:
 class TestLibraryAPI:
     """Test cases for the Library API."""
 
-    @patch("lastfm_client.client.LastfmAPIBase._request")
+    @patch("lastfm_client.base.LastfmAPIBase._request")
     def test_get_artists(self, mock_request):
         """Test getting user's library artists."""
         mock_request.return_value = {"artists": {"artist": []}}
@@ -545,7 +1135,170 @@ class TestLibraryAPI:
 class TestLastfmClientIntegration:
     """Integration tests for the complete Last.fm client."""
 
-    @patch("lastfm_client.client.requests.get")
+    def test_sub_apis_share_one_session(self):
+        """Test that every sub-API reuses the client's pooled session."""
+        client = LastfmClient(api_key="test_key", pool_size=4)
+
+        sub_apis = [
+            client.album, client.artist, client.auth, client.chart, client.geo,
+            client.library, client.tag, client.track, client.user,
+        ]
+        assert all(api.session is client.session for api in sub_apis)
+        adapter = client.session.get_adapter("https://ws.audioscrobbler.com/2.0/")
+        assert adapter._pool_maxsize == 4
+
+    def test_sub_apis_share_one_rate_limiter(self):
+        """Test that all sub-APIs draw from one token bucket, sync and async."""
+        shared = TokenBucket(rate=5)
+        client = LastfmClient(api_key="test_key", rate_limiter=shared)
+        async_client = AsyncLastfmClient(api_key="test_key", rate_limiter=shared)
+
+        assert all(
+            api.rate_limiter is shared
+            for api in (client.album, client.user, async_client.track, async_client.tag)
+        )
+        assert LastfmClient(api_key="test_key", rate_limit=None).user.rate_limiter is None
+        asyncio.run(async_client.aclose())
+
+    @patch("lastfm_client.base.requests.Session.get")
+    def test_requests_wait_on_rate_limiter(self, mock_get):
+        """Test that network requests take a token and cache hits do not."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"artist": {"name": "Cher"}}
+        mock_get.return_value = mock_response
+        limiter = Mock(spec=TokenBucket)
+        client = LastfmClient(api_key="test_key", cache=ResponseCache(), rate_limiter=limiter)
+
+        client.artist.get_info(artist="Cher")
+        client.artist.get_info(artist="Cher")
+        client.user.get_info("someone")
+
+        assert limiter.acquire.call_count == 2
+
+    def test_async_requests_wait_on_rate_limiter(self):
+        """Test that async requests wait on the limiter without blocking."""
+        now = [0.0]
+        limiter = TokenBucket(rate=1, burst=1, clock=lambda: now[0])
+        api = AsyncArtistAPI(
+            api_key="test_key",
+            http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+            ),
+            rate_limiter=limiter,
+        )
+        waits = []
+
+        async def fake_sleep(delay):
+            waits.append(delay)
+
+        with patch("lastfm_client.ratelimit.asyncio.sleep", fake_sleep):
+            async def run():
+                await asyncio.gather(*(api.get_info(artist=str(i)) for i in range(3)))
+            asyncio.run(run())
+
+        assert waits == [pytest.approx(1.0), pytest.approx(2.0)]
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        """Test that threads asking for the same data share one HTTP request."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        release = threading.Event()
+        calls = []
+
+        def slow_get(*args, **kwargs):
+            calls.append(kwargs["params"]["artist"])
+            release.wait(5)
+            response = Mock()
+            response.json.return_value = {"artist": {"name": "Cher"}}
+            return response
+
+        client = LastfmClient(api_key="test_key", rate_limit=None)
+        with patch("lastfm_client.base.requests.Session.get", side_effect=slow_get):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(client.artist.get_info, artist="Cher") for _ in range(4)]
+                while client.singleflight.stats()["coalesced"] < 3:
+                    threading.Event().wait(0.001)
+                release.set()
+                results = [f.result() for f in futures]
+
+        assert calls == ["Cher"]
+        assert all(r == {"artist": {"name": "Cher"}} for r in results)
+        assert client.singleflight.stats() == {"executed": 1, "coalesced": 3, "in_flight": 0}
+
+    def test_requests_with_look_alike_params_are_not_coalesced(self):
+        """Test that a value containing & or = is not mistaken for extra parameters."""
+        seen = []
+
+        def handler(request):
+            seen.append(dict(request.url.params))
+            return httpx.Response(200, json={"ok": True})
+
+        api = AsyncArtistAPI(
+            api_key="test_key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            singleflight=SingleFlight(),
+        )
+
+        async def run():
+            await asyncio.gather(
+                api.get_info(artist="x&lang=de"),
+                api.get_info(artist="x", lang="de"),
+            )
+
+        asyncio.run(run())
+
+        assert len(seen) == 2
+        assert api.singleflight.stats()["coalesced"] == 0
+
+    def test_coalesced_error_reaches_every_caller(self):
+        """Test that followers receive the leader's exception."""
+        flight = SingleFlight()
+
+        async def run():
+            gate = asyncio.Event()
+
+            async def failing():
+                await gate.wait()
+                raise RuntimeError("boom")
+
+            callers = [asyncio.ensure_future(flight.ado("k", failing)) for _ in range(3)]
+            await asyncio.sleep(0)
+            gate.set()
+            return await asyncio.gather(*callers, return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        assert [str(r) for r in results] == ["boom"] * 3
+        assert flight.stats() == {"executed": 1, "coalesced": 2, "in_flight": 0}
+
+    def test_async_identical_requests_are_coalesced(self):
+        """Test that concurrent identical async GETs send one request and POSTs are not shared."""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request.method)
+            return httpx.Response(200, json={"ok": True})
+
+        api = AsyncArtistAPI(
+            api_key="test_key",
+            api_secret="test_secret",
+            session_key="test_session",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            singleflight=SingleFlight(),
+        )
+
+        async def run():
+            await asyncio.gather(*(api.get_info(artist="Cher") for _ in range(5)))
+            await asyncio.gather(*(api.add_tags("Cher", "pop") for _ in range(2)))
+
+        asyncio.run(run())
+
+        assert requests_seen == ["GET", "POST", "POST"]
+        assert api.singleflight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+        assert LastfmClient(api_key="test_key", coalesce=False).artist.singleflight is None
+
+    @patch("lastfm_client.base.requests.Session.get")
     def test_end_to_end_request_flow(self, mock_get):
         """Test complete request flow from API call to response."""
         # Setup mock response
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from fastmcp import Client
+
+import server
+from lastfm_client import client as client_module
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    """Reset the server's lazily built clients and disable its response cache."""
+    monkeypatch.setattr(server, "_generation", None)
+    monkeypatch.setattr(server, "_cache", None)
+    monkeypatch.setenv("LASTFM_API_KEY", "old_key")
+    yield
+
+
+class TestClientRegistry:
+    """Test cases for the server's lazy, reloadable client registry."""
+
+    def test_concurrent_first_use_builds_once(self, fresh_registry, monkeypatch):
+        """Test that concurrent first calls share one freshly built registry."""
+        built = []
+        original = server.AsyncLastfmClient
+
+        def slow_client(*args, **kwargs):
+            built.append(args)
+            time.sleep(0.05)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(server, "AsyncLastfmClient", slow_client)
+        barrier = threading.Barrier(8)
+        registries = []
+
+        def first_use():
+            barrier.wait()
+            registries.append(server._clients())
+
+        threads = [threading.Thread(target=first_use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert len(registries) == 8
+        assert all(registry is registries[0] for registry in registries)
+
+    def test_reload_picks_up_new_credentials_and_keeps_serving(self, fresh_registry, monkeypatch):
+        """Test that a reload mid-call leaves the running call's client open."""
+        seen_keys = []
+        first_call_started = asyncio.Event()
+        release_first_call = asyncio.Event()
+
+        async def handler(request):
+            seen_keys.append(request.url.params["api_key"])
+            if len(seen_keys) == 1:
+                first_call_started.set()
+                await release_first_call.wait()
+            return httpx.Response(200, json={"artists": {"artist": []}})
+
+        monkeypatch.setattr(
+            client_module,
+            "create_async_client",
+            lambda *args: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        async def run():
+            async with Client(server.mcp) as mcp_client:
+                first = asyncio.ensure_future(mcp_client.call_tool("chart_get_top_artists", {}))
+                await first_call_started.wait()
+                old_client = server._generation.client
+
+                monkeypatch.setenv("LASTFM_API_KEY", "new_key")
+                await server.reload_clients()
+                assert not old_client.http_client.is_closed
+
+                release_first_call.set()
+                first_result = await first
+                second_result = await mcp_client.call_tool("chart_get_top_artists", {})
+            return old_client, first_result, second_result
+
+        old_client, first_result, second_result = asyncio.run(run())
+
+        assert seen_keys == ["old_key", "new_key"]
+        assert first_result.data == {"artists": {"artist": []}}
+        assert second_result.data == {"artists": {"artist": []}}
+        assert old_client.http_client.is_closed
+        assert not server._generation.client.http_client.is_closed
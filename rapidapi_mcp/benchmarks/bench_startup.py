@@ -0,0 +1,74 @@
+"""
+Benchmark launcher start-up time with lazy versus eager domain imports.
+
+Each sample runs in a fresh interpreter, the way `python server.py <domain>`
+does. `fastmcp` is imported first and timed separately, because it costs
+far more than anything the launcher controls and its run-to-run noise would
+hide the difference. The launcher is then timed in-process: "eager (all
+domains)" imports and builds every domain server, which is what server.py
+used to do on import; "lazy <domain>" imports and builds only the domain
+being launched. Scenarios are interleaved so drift affects them equally.
+
+Usage:
+    python benchmarks/bench_startup.py [--domain NAME] [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMED = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import fastmcp\n"
+    "floor = time.perf_counter() - start\n"
+    "start = time.perf_counter()\n"
+    "{body}"
+    "print(floor, time.perf_counter() - start)\n"
+)
+EAGER = "import server\nfor name in server.SERVERS:\n    server.SERVERS[name][0]\n"
+LAZY = "import server\nserver.SERVERS[{domain!r}][0]\n"
+
+
+def sample(body):
+    result = subprocess.run(
+        [sys.executable, "-c", TIMED.format(body=body)],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    floor, elapsed = map(float, result.stdout.split())
+    return floor, elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--domain", default="finance")
+    arg_parser.add_argument("--repeat", type=int, default=30)
+    args = arg_parser.parse_args()
+
+    scenarios = {"eager (all domains)": EAGER, "lazy " + args.domain: LAZY.format(domain=args.domain)}
+    floors = []
+    timings = {name: [] for name in scenarios}
+    for _ in range(args.repeat):
+        for name, body in scenarios.items():
+            floor, elapsed = sample(body)
+            floors.append(floor)
+            timings[name].append(elapsed)
+
+    eager, lazy = (statistics.median(values) for values in timings.values())
+    print(f"{'scenario':>22} {'median ms':>10}")
+    print(f"{'fastmcp import':>22} {statistics.median(floors) * 1000:>10.1f}")
+    for name, values in timings.items():
+        print(f"{name:>22} {statistics.median(values) * 1000:>10.1f}")
+    print(f"lazy saves {(eager - lazy) * 1000:.1f} ms of launcher time ({eager / lazy:.1f}x less) "
+          f"after fastmcp is imported")
+
+
+if __name__ == "__main__":
+    main()
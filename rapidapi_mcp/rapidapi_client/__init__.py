@@ -1,5 +1,5 @@
 """Client library backing the RapidAPI MCP servers."""
 
-from .rapidapi_tools import MissingRapidAPIKeyError, RapidAPIClient
+from .rapidapi_tools import MissingRapidAPIKeyError, RapidAPIClient, ResponseCache
 
-__all__ = ["MissingRapidAPIKeyError", "RapidAPIClient"]
+__all__ = ["MissingRapidAPIKeyError", "RapidAPIClient", "ResponseCache"]
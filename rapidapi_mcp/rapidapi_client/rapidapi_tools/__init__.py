@@ -1,6 +1,9 @@
 """Collection of Python wrappers for RapidAPI-powered tools."""
 
+from .cache import ResponseCache
 from .client import MissingRapidAPIKeyError, RapidAPIClient
+from .ratelimit import HostRateLimiter
+from .aggregate import multi_search
 from .entertainment import (
     get_actor_details,
     get_spotify_albums,
@@ -41,8 +44,10 @@ from .social import (
 )
 
 __all__ = [
+    "HostRateLimiter",
     "MissingRapidAPIKeyError",
     "RapidAPIClient",
+    "ResponseCache",
     "search_jobs",
     "get_job_details",
     "get_twelve_data_price",
@@ -76,4 +81,5 @@ __all__ = [
     "get_business_details",
     "get_business_reviews",
     "search_web",
+    "multi_search",
 ]
@@ -0,0 +1,75 @@
+"""Fan a single query out to several RapidAPI domains at once."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from .client import RapidAPIClient
+from .entertainment import search_imdb, search_spotify
+from .news import search_news
+from .search import search_web
+from .social import search_tweets
+
+SourceSearch = Callable[..., Awaitable[dict[str, Any]]]
+
+# Search functions by source name; each takes the query first and a ``client`` keyword
+SOURCES: dict[str, SourceSearch] = {
+    "news": search_news,
+    "tweets": search_tweets,
+    "web": search_web,
+    "spotify": search_spotify,
+    "imdb": search_imdb,
+}
+
+DEFAULT_SOURCES = ("news", "tweets", "web")
+
+
+async def _run_source(name: str, query: str, client: RapidAPIClient) -> tuple[str, dict[str, Any]]:
+    """Run one source search, capturing its result or error and how long it took."""
+
+    started = time.perf_counter()
+    try:
+        data = await SOURCES[name](query, client=client)
+        error = None
+    except Exception as exc:
+        # One failing source must not sink the others
+        data = None
+        error = f"{type(exc).__name__}: {exc}"
+    return name, {
+        "ok": error is None,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "data": data,
+        "error": error,
+    }
+
+
+async def multi_search(
+    query: str,
+    *,
+    sources: list[str] | None = None,
+    client: RapidAPIClient | None = None,
+) -> dict[str, Any]:
+    """Search news, tweets, the web, Spotify and/or IMDB for one query concurrently.
+
+    Every selected source runs at the same time over one shared client, so the
+    call takes roughly as long as the slowest source. A failing source is
+    reported in its own entry and does not affect the others.
+    """
+
+    selected = list(dict.fromkeys(sources or DEFAULT_SOURCES))
+    unknown = [name for name in selected if name not in SOURCES]
+    if unknown:
+        raise ValueError(
+            f"Unknown source(s): {', '.join(unknown)}. Choose from: {', '.join(SOURCES)}"
+        )
+
+    client = client or RapidAPIClient()
+    started = time.perf_counter()
+    results = dict(await asyncio.gather(*(_run_source(name, query, client) for name in selected)))
+    return {
+        "query": query,
+        "sources": selected,
+        "results": results,
+        "errors": sum(1 for result in results.values() if not result["ok"]),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
@@ -0,0 +1,164 @@
+"""Response caching for metered RapidAPI endpoints."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+__all__ = ["CacheEntry", "ResponseCache", "DEFAULT_HOST_TTLS"]
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 300.0
+DEFAULT_STALE_TTL = 86400.0
+
+DEFAULT_HOST_TTLS: dict[str, float] = {
+    "imdb8.p.rapidapi.com": 86400.0,
+    "jsearch.p.rapidapi.com": 900.0,
+    "local-business-data.p.rapidapi.com": 3600.0,
+    "real-time-news-data.p.rapidapi.com": 300.0,
+    "real-time-web-search.p.rapidapi.com": 1800.0,
+    "spotify23.p.rapidapi.com": 21600.0,
+    "steam2.p.rapidapi.com": 3600.0,
+    "tasty.p.rapidapi.com": 86400.0,
+    "twelve-data1.p.rapidapi.com": 30.0,
+    "twitter154.p.rapidapi.com": 120.0,
+    "zillow-com4.p.rapidapi.com": 3600.0,
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached response with its freshness and staleness deadlines."""
+
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+class ResponseCache:
+    """Thread-safe, size-bounded LRU cache for RapidAPI responses.
+
+    Entries stay fresh for the TTL configured for their host. Once expired they
+    are kept for a further ``stale_ttl`` seconds so :class:`RapidAPIClient` can
+    serve them when the upstream is throttling. Cached responses are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        default_ttl: float = DEFAULT_TTL,
+        host_ttls: Mapping[str, float] | None = None,
+        stale_ttl: float = DEFAULT_STALE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Configure the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before LRU eviction.
+            default_ttl: Freshness in seconds for hosts missing from ``host_ttls``.
+            host_ttls: Per-host freshness overrides, merged over ``DEFAULT_HOST_TTLS``.
+                A TTL of ``0`` disables caching for that host.
+            stale_ttl: How long expired entries remain available as a fallback.
+            clock: Monotonic time source, mainly for tests.
+        """
+
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.host_ttls = {**DEFAULT_HOST_TTLS, **(host_ttls or {})}
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    def ttl_for(self, host: str) -> float:
+        """Return the freshness TTL in seconds for ``host``."""
+
+        return self.host_ttls.get(host, self.default_ttl)
+
+    @staticmethod
+    def key_for(
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        json_body: Any | None = None,
+    ) -> str:
+        """Build a canonical cache key from the request signature."""
+
+        canonical_params = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        body = json.dumps(json_body, sort_keys=True, default=str) if json_body is not None else ""
+        return json.dumps([method.upper(), url, canonical_params, body])
+
+    def get(self, key: str) -> Any | None:
+        """Return a fresh cached value for ``key`` or ``None``."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self._clock()
+            if entry is None or entry.fresh_until <= now:
+                if entry is not None and entry.stale_until <= now:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def get_stale(self, key: str) -> Any | None:
+        """Return an expired-but-retained value for ``key`` or ``None``."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.stale_until <= self._clock():
+                return None
+            self.stale_hits += 1
+            return entry.value
+
+    def has_stale(self, key: str) -> bool:
+        """Return ``True`` if ``key`` has a retained value, without counting a hit."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.stale_until > self._clock()
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds, evicting the LRU entry if full."""
+
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._entries[key] = CacheEntry(value, now + ttl, now + ttl + self.stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.stale_hits = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss, stale-hit and eviction counters plus the current size."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,7 +1,10 @@
 """Utilities for interacting with RapidAPI endpoints."""
 
+import asyncio
+import functools
 import os
-from typing import Any, Mapping
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Mapping
 from urllib.parse import urlparse
 
 import httpx
@@ -9,14 +12,29 @@ from dotenv import load_dotenv
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic_core import core_schema
 
+from .cache import ResponseCache
+from .ratelimit import HostRateLimiter, backoff_delay, parse_retry_after
+
 __all__ = ["RapidAPIClient", "MissingRapidAPIKeyError", "clean_dict", "bool_to_str"]
 
-load_dotenv()
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+DEFAULT_MAX_RETRIES = 3
+
 
 class MissingRapidAPIKeyError(RuntimeError):
     """Raised when the RAPIDAPI_KEY environment variable has not been configured."""
 
 
+@functools.cache
+def _load_env_file() -> None:
+    """Load ``.env`` into the environment once, the first time a key is looked up."""
+
+    load_dotenv()
+
+
 def get_api_key(explicit_key: str | None = None) -> str:
     """Return the RapidAPI key, prioritising ``explicit_key`` then ``RAPIDAPI_KEY``.
 
@@ -31,6 +49,9 @@ def get_api_key(explicit_key: str | None = None) -> str:
     """
 
     key = explicit_key or os.getenv("RAPIDAPI_KEY")
+    if not key:
+        _load_env_file()
+        key = os.getenv("RAPIDAPI_KEY")
     if not key:
         raise MissingRapidAPIKeyError(
             "Set the RAPIDAPI_KEY environment variable or provide an explicit key "
@@ -54,11 +75,57 @@ def bool_to_str(value: bool | None) -> str | None:
 
 
 class RapidAPIClient:
-    """Thin wrapper around :class:`httpx.AsyncClient` with RapidAPI defaults."""
+    """Thin wrapper around :class:`httpx.AsyncClient` with RapidAPI defaults.
+
+    The underlying HTTP client is long-lived: it is opened on first use (or by
+    :meth:`start`) and keeps its connection pool, TLS sessions and, when
+    enabled, HTTP/2 connections alive until :meth:`aclose` is called. Use
+    :meth:`lifespan` to tie that lifecycle to a FastMCP server.
+
+    When a :class:`ResponseCache` is supplied, identical requests are served
+    from it until their per-host TTL expires, and expired entries are served
+    as a fallback while the upstream is throttling.
 
-    def __init__(self, api_key: str | None = None, *, timeout: float = 30.0) -> None:
-        self.api_key = get_api_key(api_key)
+    Every upstream host gets its own :class:`HostRateLimiter`, which paces
+    requests from the ``x-ratelimit-*`` response headers. Throttled responses
+    (429/503) are retried up to ``max_retries`` times with jittered exponential
+    backoff, honouring ``Retry-After``, and pause the whole host meanwhile.
+
+    Identical concurrent requests are coalesced into a single upstream call
+    (single-flight); ``coalesced`` counts the calls that were served this way.
+    Shared results must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        timeout: float = 30.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        cache: ResponseCache | None = None,
+        rate_limit: bool = True,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        coalesce: bool = True,
+    ) -> None:
+        self._api_key = api_key
         self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._http: httpx.AsyncClient | None = None
+        self.cache = cache
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self._limiters: dict[str, HostRateLimiter] = {}
+        self.coalesce = coalesce
+        self.coalesced = 0
+        self._inflight: dict[str, asyncio.Future] = {}
 
     @classmethod
     def __get_pydantic_core_schema__(
@@ -80,6 +147,70 @@ class RapidAPIClient:
 
         return {"type": "object", "title": "RapidAPIClient"}
 
+    @property
+    def api_key(self) -> str:
+        """Return the RapidAPI key, resolving it from the environment on first use.
+
+        Raises:
+            MissingRapidAPIKeyError: If the key cannot be located.
+        """
+
+        if not self._api_key:
+            self._api_key = get_api_key(self._api_key)
+        return self._api_key
+
+    def limiter_for(self, host: str) -> HostRateLimiter:
+        """Return the rate limiter for ``host``, creating it on first use."""
+
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = self._limiters[host] = HostRateLimiter()
+        return limiter
+
+    @property
+    def is_started(self) -> bool:
+        """Return ``True`` while the pooled HTTP client is open."""
+
+        return self._http is not None and not self._http.is_closed
+
+    async def start(self) -> None:
+        """Open the pooled HTTP client if it is not already running.
+
+        Raises:
+            ImportError: If ``http2`` is enabled but the ``h2`` package is missing.
+        """
+
+        if not self.is_started:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "RapidAPIClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    @asynccontextmanager
+    async def lifespan(self, server: Any = None) -> AsyncIterator[None]:
+        """FastMCP lifespan hook: start the pool on startup, close it on shutdown."""
+
+        await self.start()
+        try:
+            yield
+        finally:
+            await self.aclose()
+
     async def request(
         self,
         method: str,
@@ -89,27 +220,124 @@ class RapidAPIClient:
         json: Any | None = None,
         headers: Mapping[str, str] | None = None,
     ) -> Any:
-        """Perform an HTTP request using the RapidAPI key."""
+        """Perform an HTTP request using the RapidAPI key, consulting the cache if set.
+
+        Concurrent calls with the same signature (method, URL, params and JSON
+        body) share one upstream request and its result or error.
+        """
+
+        host = urlparse(url).netloc
+        key = ResponseCache.key_for(method, url, params, json)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if not self.coalesce:
+            return await self._fetch(key, method, url, host, params=params, json=json, headers=headers)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch(key, method, url, host, params=params, json=json, headers=headers)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._forget_inflight, key))
+        else:
+            self.coalesced += 1
+        # Shielded so a cancelled caller does not cancel the call others are awaiting
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: asyncio.Future) -> None:
+        """Drop a finished upstream call from the in-flight table."""
+
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the error as retrieved even if every caller was cancelled
+            task.exception()
+
+    async def _fetch(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        host: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> Any:
+        """Call the upstream, falling back to stale cache entries and caching the result."""
+
+        if self.cache is None:
+            return await self._send(method, url, host, params=params, json=json, headers=headers)
+
+        # With a stale copy to fall back on, a throttled call is not worth retrying
+        retries = 0 if self.cache.has_stale(key) else self.max_retries
+        try:
+            data = await self._send(
+                method, url, host, params=params, json=json, headers=headers, retries=retries
+            )
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code in THROTTLE_STATUS_CODES:
+                stale = self.cache.get_stale(key)
+                if stale is not None:
+                    return stale
+            raise
+
+        self.cache.set(key, data, self.cache.ttl_for(host))
+        return data
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        host: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        headers: Mapping[str, str] | None = None,
+        retries: int | None = None,
+    ) -> Any:
+        """Send the request over the pooled HTTP client and decode the JSON body.
+
+        Waits on the host's rate limiter first, and retries throttled responses
+        up to ``retries`` times (default ``max_retries``) with backoff.
+        """
 
-        parsed = urlparse(url)
-        host_header = parsed.netloc
         request_headers = {
             "x-rapidapi-key": self.api_key,
-            "x-rapidapi-host": host_header,
+            "x-rapidapi-host": host,
         }
         if headers:
             request_headers.update(headers)
+        if retries is None:
+            retries = self.max_retries
+        limiter = self.limiter_for(host) if self.rate_limit else None
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.request(
+        await self.start()
+        for attempt in range(retries + 1):
+            if limiter is not None:
+                await limiter.acquire()
+            response = await self._http.request(
                 method,
                 url,
                 params=params,
                 json=json,
                 headers=request_headers,
             )
-            response.raise_for_status()
-            return response.json()
+            if limiter is not None:
+                limiter.update(response.headers)
+            if response.status_code not in THROTTLE_STATUS_CODES or attempt == retries:
+                break
+            delay = backoff_delay(attempt, parse_retry_after(response.headers.get("retry-after")))
+            if limiter is not None:
+                limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+        response.raise_for_status()
+        return response.json()
 
     async def get(
         self,
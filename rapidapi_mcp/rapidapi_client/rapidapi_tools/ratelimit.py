@@ -0,0 +1,155 @@
+"""Adaptive per-host rate limiting for RapidAPI upstreams."""
+
+import asyncio
+import email.utils
+import random
+import re
+import time
+from typing import Callable, Mapping
+
+__all__ = ["HostRateLimiter", "parse_retry_after", "backoff_delay"]
+
+DEFAULT_PACING_WINDOW = 60.0
+DEFAULT_MAX_WAIT = 60.0
+DEFAULT_BACKOFF_BASE = 1.0
+DEFAULT_MAX_BACKOFF = 30.0
+
+# Matches e.g. x-ratelimit-requests-remaining or x-ratelimit-rapid-free-plans-hard-limit-reset
+_RATELIMIT_HEADER = re.compile(r"^x-ratelimit-(?P<name>.+)-(?P<field>limit|remaining|reset)$")
+
+# Reset values above this are Unix timestamps rather than seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def parse_retry_after(value: str | None, *, now: float | None = None) -> float | None:
+    """Return the delay in seconds requested by a ``Retry-After`` header.
+
+    Accepts both the delta-seconds and HTTP-date forms; returns ``None`` when
+    the header is missing or unparseable.
+    """
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    current = time.time() if now is None else now
+    return max(0.0, when.timestamp() - current)
+
+
+def backoff_delay(
+    attempt: int,
+    retry_after: float | None = None,
+    *,
+    base: float = DEFAULT_BACKOFF_BASE,
+    cap: float = DEFAULT_MAX_BACKOFF,
+    rng: Callable[[float, float], float] = random.uniform,
+) -> float:
+    """Return a jittered exponential backoff delay for retry ``attempt`` (0-based).
+
+    Half of the exponential step is fixed and half is random, so concurrent
+    callers spread out instead of retrying in lockstep. A ``Retry-After`` hint
+    is treated as a lower bound.
+    """
+
+    step = min(cap, base * 2 ** attempt)
+    delay = step / 2 + rng(0.0, step / 2)
+    if retry_after is not None:
+        delay = max(delay, retry_after + rng(0.0, base / 2))
+    return delay
+
+
+class HostRateLimiter:
+    """Throttle requests to one RapidAPI host based on its rate-limit headers.
+
+    After every response the limiter reads the ``x-ratelimit-*-remaining`` and
+    ``-reset`` headers. For quotas that reset within ``pacing_window`` seconds
+    it spaces the remaining requests evenly over the time left, so a burst is
+    smoothed instead of exhausting the quota up front. An exhausted quota, or a
+    429, pauses the host until the quota resets or the backoff expires, as
+    long as that is no more than ``max_wait`` seconds away. Longer quotas
+    (e.g. monthly plan limits) are left for the upstream to enforce.
+    """
+
+    def __init__(
+        self,
+        *,
+        pacing_window: float = DEFAULT_PACING_WINDOW,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Configure the limiter.
+
+        Args:
+            pacing_window: Only quotas resetting within this many seconds are paced.
+            max_wait: Longest pause applied before sending a request.
+            clock: Monotonic time source, mainly for tests.
+        """
+
+        self.pacing_window = pacing_window
+        self.max_wait = max_wait
+        self._clock = clock
+        self.interval = 0.0
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+
+    def reserve(self) -> float:
+        """Claim the next send slot and return how long to wait for it."""
+
+        now = self._clock()
+        slot = max(now, self._next_slot, self._blocked_until)
+        slot = min(slot, now + self.max_wait)
+        self._next_slot = slot + self.interval
+        return slot - now
+
+    async def acquire(self) -> None:
+        """Wait until this host may be called again."""
+
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Adapt the pacing interval from a response's rate-limit headers."""
+
+        buckets: dict[str, dict[str, float]] = {}
+        for name, value in headers.items():
+            match = _RATELIMIT_HEADER.match(name.lower())
+            if not match:
+                continue
+            try:
+                number = float(value)
+            except ValueError:
+                continue
+            buckets.setdefault(match["name"], {})[match["field"]] = number
+
+        now = self._clock()
+        interval = 0.0
+        for bucket in buckets.values():
+            remaining = bucket.get("remaining")
+            reset = bucket.get("reset")
+            if remaining is None or reset is None:
+                continue
+            if reset > _EPOCH_THRESHOLD:
+                reset -= time.time()
+            reset = max(0.0, reset)
+            if reset > self.pacing_window and remaining > 0:
+                continue
+            if remaining <= 0:
+                if reset <= self.max_wait:
+                    self._blocked_until = max(self._blocked_until, now + reset)
+                continue
+            interval = max(interval, reset / remaining)
+        if buckets:
+            self.interval = interval
+
+    def pause(self, delay: float) -> None:
+        """Hold every request to this host for ``delay`` seconds, e.g. after a 429."""
+
+        self._blocked_until = max(self._blocked_until, self._clock() + delay)
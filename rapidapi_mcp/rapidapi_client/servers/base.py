@@ -2,43 +2,125 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import inspect
+import sys
 from typing import Any, Callable, Iterable, Tuple
 
 from fastmcp import FastMCP
+from fastmcp.tools import FunctionTool
+
+from ..rapidapi_tools import RapidAPIClient, ResponseCache
+from .schema_cache import SchemaCache, default_schema_cache
 
 ToolSpec = Tuple[Callable[..., Any], str, str]
 
 
-def build_server(name: str, instructions: str, tool_specs: Iterable[ToolSpec]) -> FastMCP:
-    """Create a :class:`FastMCP` server and register tool functions."""
+def bind_client(func: Callable[..., Any], client: RapidAPIClient) -> Callable[..., Any]:
+    """Wrap a tool coroutine so every call receives the shared ``client``."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        kwargs["client"] = client
+        return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def _required_without_defaults(func: Callable[..., Any], params_schema: dict[str, Any]) -> None:
+    """Drop parameters that have defaults (and ``client``) from the schema's ``required`` list."""
+
+    required = params_schema.get("required", [])
+    if not required:
+        return
+
+    signature = inspect.signature(func)
+    optional_params = {
+        param_name
+        for param_name, param in signature.parameters.items()
+        if param.default is not inspect._empty
+    }
+    optional_params.add("client")
+
+    updated_required = [name for name in required if name not in optional_params]
+    if updated_required:
+        params_schema["required"] = updated_required
+    else:
+        params_schema.pop("required", None)
+
+
+def build_server(
+    name: str,
+    instructions: str,
+    tool_specs: Iterable[ToolSpec],
+    *,
+    client: RapidAPIClient | None = None,
+    schema_cache: SchemaCache | bool = True,
+) -> FastMCP:
+    """Create a :class:`FastMCP` server and register tool functions.
+
+    A single :class:`RapidAPIClient` (``client`` or a new cached one) is
+    injected into every tool, and its pooled HTTP connection is opened with the
+    server lifespan and closed on shutdown.
+
+    Tool schemas come from ``schema_cache`` (the packaged cache when ``True``)
+    whenever its fingerprint for the function still matches; other tools are
+    introspected as usual. Pass ``False`` to always introspect.
+    """
 
-    server = FastMCP(name, instructions=instructions)
+    if schema_cache is True:
+        schema_cache = default_schema_cache()
+    client = client or RapidAPIClient(cache=ResponseCache())
+    server = FastMCP(name, instructions=instructions, lifespan=client.lifespan)
     for func, tool_name, description in tool_specs:
+        cached = schema_cache.lookup(name, tool_name, func) if schema_cache else None
+        if cached is not None:
+            server.add_tool(
+                FunctionTool(
+                    fn=bind_client(func, client),
+                    name=tool_name,
+                    description=description,
+                    parameters=copy.deepcopy(cached["parameters"]),
+                    output_schema=copy.deepcopy(cached["output_schema"]),
+                )
+            )
+            continue
+
         tool = server.tool(
-            func,
+            bind_client(func, client),
             name=tool_name,
             description=description,
             exclude_args=["client"],
         )
+        _required_without_defaults(func, tool.parameters)
 
-        params_schema = tool.parameters
-        required = set(params_schema.get("required", []))
-        if not required:
-            continue
+    return server
+
+
+_MODULE_SERVERS: dict[str, FastMCP] = {}
 
-        signature = inspect.signature(func)
-        optional_params = {
-            param_name
-            for param_name, param in signature.parameters.items()
-            if param.default is not inspect._empty
-        }
-        optional_params.add("client")
 
-        updated_required = [name for name in required if name not in optional_params]
-        if updated_required:
-            params_schema["required"] = updated_required
-        else:
-            params_schema.pop("required", None)
+def module_server(module_name: str) -> FastMCP:
+    """Return the standalone server of a domain module, building it on first use.
 
+    Domain modules only declare ``NAME``, ``INSTRUCTIONS`` and ``TOOLS``, so
+    importing one (e.g. from the gateway) creates no server or client.
+    """
+
+    server = _MODULE_SERVERS.get(module_name)
+    if server is None:
+        module = sys.modules[module_name]
+        server = _MODULE_SERVERS[module_name] = build_server(module.NAME, module.INSTRUCTIONS, module.TOOLS)
     return server
+
+
+def lazy_server_attribute(module_name: str) -> Callable[[str], Any]:
+    """Return a module ``__getattr__`` that resolves ``server`` via :func:`module_server`."""
+
+    def __getattr__(name: str) -> Any:
+        if name == "server":
+            return module_server(module_name)
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from .base import build_server
+from .base import ToolSpec, lazy_server_attribute, module_server
+from .workers import run_workers
 from ..rapidapi_tools import (
     get_actor_details,
     get_spotify_albums,
@@ -24,45 +25,49 @@ INSTRUCTIONS = (
     "launching."
 )
 
-server = build_server(
-    "rapidapi-entertainment",
-    INSTRUCTIONS,
-    [
-        (search_imdb, "search_imdb", "Search the IMDB catalogue."),
-        (get_title_details, "get_title_details", "Retrieve IMDB title details."),
-        (get_actor_details, "get_actor_details", "Retrieve IMDB person details."),
-        (steam_search_games, "steam_search_games", "Search the Steam store."),
-        (steam_get_app_details, "steam_get_app_details", "Fetch Steam app metadata."),
-        (steam_get_app_reviews, "steam_get_app_reviews", "Fetch Steam app reviews."),
-        (search_spotify, "search_spotify", "Search Spotify content."),
-        (get_spotify_albums, "get_spotify_albums", "Fetch Spotify album details."),
-        (get_spotify_artists, "get_spotify_artists", "Fetch Spotify artist details."),
-        (
-            get_spotify_artist_overview,
-            "get_spotify_artist_overview",
-            "Fetch overview data for a Spotify artist.",
-        ),
-        (
-            get_spotify_related_artists,
-            "get_spotify_related_artists",
-            "Fetch related artists for a Spotify artist.",
-        ),
-        (
-            get_spotify_artist_albums,
-            "get_spotify_artist_albums",
-            "Fetch albums released by a Spotify artist.",
-        ),
-    ],
-)
+NAME = "rapidapi-entertainment"
+
+TOOLS: list[ToolSpec] = [
+    (search_imdb, "search_imdb", "Search the IMDB catalogue."),
+    (get_title_details, "get_title_details", "Retrieve IMDB title details."),
+    (get_actor_details, "get_actor_details", "Retrieve IMDB person details."),
+    (steam_search_games, "steam_search_games", "Search the Steam store."),
+    (steam_get_app_details, "steam_get_app_details", "Fetch Steam app metadata."),
+    (steam_get_app_reviews, "steam_get_app_reviews", "Fetch Steam app reviews."),
+    (search_spotify, "search_spotify", "Search Spotify content."),
+    (get_spotify_albums, "get_spotify_albums", "Fetch Spotify album details."),
+    (get_spotify_artists, "get_spotify_artists", "Fetch Spotify artist details."),
+    (
+        get_spotify_artist_overview,
+        "get_spotify_artist_overview",
+        "Fetch overview data for a Spotify artist.",
+    ),
+    (
+        get_spotify_related_artists,
+        "get_spotify_related_artists",
+        "Fetch related artists for a Spotify artist.",
+    ),
+    (
+        get_spotify_artist_albums,
+        "get_spotify_artist_albums",
+        "Fetch albums released by a Spotify artist.",
+    ),
+]
+
+# The standalone server is built on first access to ``server``
+__getattr__ = lazy_server_attribute(__name__)
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 9404
 
 
-def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
-    """Run the entertainment server using the HTTP transport."""
+def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1) -> None:
+    """Run the entertainment server using the HTTP transport, optionally across ``workers`` processes."""
 
-    server.run(transport="http", host=host, port=port)
+    if workers > 1:
+        run_workers(f"{__package__}.entertainment:server", host=host, port=port, workers=workers)
+        return
+    module_server(__name__).run(transport="http", host=host, port=port)
 
 
 if __name__ == "__main__":
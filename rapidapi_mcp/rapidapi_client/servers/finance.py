@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from .base import build_server
+from .base import ToolSpec, lazy_server_attribute, module_server
+from .workers import run_workers
 from ..rapidapi_tools import get_twelve_data_price, get_twelve_data_quote
 
 INSTRUCTIONS = (
@@ -10,23 +11,27 @@ INSTRUCTIONS = (
     "is configured (environment or .env) before launching."
 )
 
-server = build_server(
-    "rapidapi-finance",
-    INSTRUCTIONS,
-    [
-        (get_twelve_data_price, "twelve_data_price", "Retrieve the latest price for a symbol from Twelve Data."),
-        (get_twelve_data_quote, "twelve_data_quote", "Retrieve quote information for a symbol from Twelve Data."),
-    ],
-)
+NAME = "rapidapi-finance"
+
+TOOLS: list[ToolSpec] = [
+    (get_twelve_data_price, "twelve_data_price", "Retrieve the latest price for a symbol from Twelve Data."),
+    (get_twelve_data_quote, "twelve_data_quote", "Retrieve quote information for a symbol from Twelve Data."),
+]
+
+# The standalone server is built on first access to ``server``
+__getattr__ = lazy_server_attribute(__name__)
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 9402
 
 
-def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
-    """Run the finance server using the HTTP transport."""
+def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1) -> None:
+    """Run the finance server using the HTTP transport, optionally across ``workers`` processes."""
 
-    server.run(transport="http", host=host, port=port)
+    if workers > 1:
+        run_workers(f"{__package__}.finance:server", host=host, port=port, workers=workers)
+        return
+    module_server(__name__).run(transport="http", host=host, port=port)
 
 
 if __name__ == "__main__":
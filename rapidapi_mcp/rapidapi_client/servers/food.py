@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from .base import build_server
+from .base import ToolSpec, lazy_server_attribute, module_server
+from .workers import run_workers
 from ..rapidapi_tools import search_recipes
 
 INSTRUCTIONS = (
@@ -10,22 +11,26 @@ INSTRUCTIONS = (
     "in the environment or .env before starting."
 )
 
-server = build_server(
-    "rapidapi-food",
-    INSTRUCTIONS,
-    [
-        (search_recipes, "search_recipes", "Search for recipes using Tasty."),
-    ],
-)
+NAME = "rapidapi-food"
+
+TOOLS: list[ToolSpec] = [
+    (search_recipes, "search_recipes", "Search for recipes using Tasty."),
+]
+
+# The standalone server is built on first access to ``server``
+__getattr__ = lazy_server_attribute(__name__)
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 9403
 
 
-def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
-    """Run the food server using the HTTP transport."""
+def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1) -> None:
+    """Run the food server using the HTTP transport, optionally across ``workers`` processes."""
 
-    server.run(transport="http", host=host, port=port)
+    if workers > 1:
+        run_workers(f"{__package__}.food:server", host=host, port=port, workers=workers)
+        return
+    module_server(__name__).run(transport="http", host=host, port=port)
 
 
 if __name__ == "__main__":
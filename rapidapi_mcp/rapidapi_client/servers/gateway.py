@@ -0,0 +1,79 @@
+"""Single-process gateway that serves every domain server on one port."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from fastmcp import FastMCP
+
+from .base import build_server
+from .registry import DOMAIN_MODULES, load_domain
+from .workers import run_workers
+from ..rapidapi_tools import RapidAPIClient, ResponseCache
+
+INSTRUCTIONS = (
+    "This server combines every Tyumi RapidAPI domain server in one process. Tools are "
+    "prefixed with their domain, e.g. finance_twelve_data_price. Ensure RAPIDAPI_KEY is "
+    "configured via environment or .env prior to launch."
+)
+
+DEFAULT_HOST = "0.0.0.0"
+DEFAULT_PORT = 9400
+
+
+def build_gateway(
+    domains: Iterable[str] | None = None,
+    *,
+    client: RapidAPIClient | None = None,
+) -> FastMCP:
+    """Create a gateway server that mounts the selected domain servers.
+
+    Domain modules only declare their tools, so each domain server is built
+    exactly once here, around one shared :class:`RapidAPIClient` (``client``
+    or a new cached one). The connection pool, response cache, rate limiters
+    and in-flight coalescing are therefore shared across domains. The
+    gateway's lifespan owns that client; domains are mounted directly rather
+    than as proxies so their own lifespans never close it early.
+
+    Raises:
+        ValueError: If an unknown domain is requested.
+    """
+
+    selected = list(domains or DOMAIN_MODULES)
+    unknown = [name for name in selected if name not in DOMAIN_MODULES]
+    if unknown:
+        raise ValueError(f"Unknown domain(s): {', '.join(unknown)}")
+
+    client = client or RapidAPIClient(cache=ResponseCache())
+    gateway = FastMCP("rapidapi-gateway", instructions=INSTRUCTIONS, lifespan=client.lifespan)
+    for name in selected:
+        module = load_domain(name)
+        domain_server = build_server(module.NAME, module.INSTRUCTIONS, module.TOOLS, client=client)
+        gateway.mount(domain_server, prefix=name, as_proxy=False)
+    return gateway
+
+
+def run_server(
+    *,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    domains: Iterable[str] | None = None,
+    workers: int = 1,
+) -> None:
+    """Run the gateway using the HTTP transport, optionally across ``workers`` processes."""
+
+    selected = list(domains) if domains is not None else None
+    if workers > 1:
+        run_workers(
+            f"{__package__}.gateway:build_gateway",
+            host=host,
+            port=port,
+            workers=workers,
+            options={"domains": selected},
+        )
+        return
+    build_gateway(selected).run(transport="http", host=host, port=port)
+
+
+if __name__ == "__main__":
+    run_server()
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from .base import build_server
+from .base import ToolSpec, lazy_server_attribute, module_server
+from .workers import run_workers
 from ..rapidapi_tools import get_job_details, search_jobs
 
 INSTRUCTIONS = (
@@ -10,23 +11,27 @@ INSTRUCTIONS = (
     "Configure the RAPIDAPI_KEY environment variable (or .env file) before starting."
 )
 
-server = build_server(
-    "rapidapi-jobs",
-    INSTRUCTIONS,
-    [
-        (search_jobs, "search_jobs", "Search for job listings via JSearch."),
-        (get_job_details, "get_job_details", "Fetch details for a JSearch job posting."),
-    ],
-)
+NAME = "rapidapi-jobs"
+
+TOOLS: list[ToolSpec] = [
+    (search_jobs, "search_jobs", "Search for job listings via JSearch."),
+    (get_job_details, "get_job_details", "Fetch details for a JSearch job posting."),
+]
+
+# The standalone server is built on first access to ``server``
+__getattr__ = lazy_server_attribute(__name__)
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 9401
 
 
-def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
-    """Run the jobs server using the HTTP transport."""
+def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1) -> None:
+    """Run the jobs server using the HTTP transport, optionally across ``workers`` processes."""
 
-    server.run(transport="http", host=host, port=port)
+    if workers > 1:
+        run_workers(f"{__package__}.jobs:server", host=host, port=port, workers=workers)
+        return
+    module_server(__name__).run(transport="http", host=host, port=port)
 
 
 if __name__ == "__main__":
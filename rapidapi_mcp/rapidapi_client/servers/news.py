@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from .base import build_server
+from .base import ToolSpec, lazy_server_attribute, module_server
+from .workers import run_workers
 from ..rapidapi_tools import get_full_story_coverage, get_headlines, get_local_headlines, search_news
 
 INSTRUCTIONS = (
@@ -10,29 +11,33 @@ INSTRUCTIONS = (
     "Ensure RAPIDAPI_KEY is configured via environment or .env prior to launch."
 )
 
-server = build_server(
-    "rapidapi-news",
-    INSTRUCTIONS,
-    [
-        (search_news, "search_news", "Search Real-Time News Data articles."),
-        (get_headlines, "get_headlines", "Retrieve top news headlines."),
-        (get_local_headlines, "get_local_headlines", "Retrieve local news headlines."),
-        (
-            get_full_story_coverage,
-            "get_full_story_coverage",
-            "Retrieve coverage for a Real-Time News Data story.",
-        ),
-    ],
-)
+NAME = "rapidapi-news"
+
+TOOLS: list[ToolSpec] = [
+    (search_news, "search_news", "Search Real-Time News Data articles."),
+    (get_headlines, "get_headlines", "Retrieve top news headlines."),
+    (get_local_headlines, "get_local_headlines", "Retrieve local news headlines."),
+    (
+        get_full_story_coverage,
+        "get_full_story_coverage",
+        "Retrieve coverage for a Real-Time News Data story.",
+    ),
+]
+
+# The standalone server is built on first access to ``server``
+__getattr__ = lazy_server_attribute(__name__)
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 9407
 
 
-def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
-    """Run the news server using the HTTP transport."""
+def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1) -> None:
+    """Run the news server using the HTTP transport, optionally across ``workers`` processes."""
 
-    server.run(transport="http", host=host, port=port)
+    if workers > 1:
+        run_workers(f"{__package__}.news:server", host=host, port=port, workers=workers)
+        return
+    module_server(__name__).run(transport="http", host=host, port=port)
 
 
 if __name__ == "__main__":
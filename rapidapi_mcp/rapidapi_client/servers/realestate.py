@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from .base import build_server
+from .base import ToolSpec, lazy_server_attribute, module_server
+from .workers import run_workers
 from ..rapidapi_tools import get_property_details, search_rental_properties
 
 INSTRUCTIONS = (
@@ -10,31 +11,35 @@ INSTRUCTIONS = (
     "Set RAPIDAPI_KEY in the environment or .env before running."
 )
 
-server = build_server(
-    "rapidapi-realestate",
-    INSTRUCTIONS,
-    [
-        (
-            search_rental_properties,
-            "search_rental_properties",
-            "Search for rental properties using Zillow.",
-        ),
-        (
-            get_property_details,
-            "get_property_details",
-            "Retrieve detailed information for a Zillow property.",
-        ),
-    ],
-)
+NAME = "rapidapi-realestate"
+
+TOOLS: list[ToolSpec] = [
+    (
+        search_rental_properties,
+        "search_rental_properties",
+        "Search for rental properties using Zillow.",
+    ),
+    (
+        get_property_details,
+        "get_property_details",
+        "Retrieve detailed information for a Zillow property.",
+    ),
+]
+
+# The standalone server is built on first access to ``server``
+__getattr__ = lazy_server_attribute(__name__)
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 9406
 
 
-def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
-    """Run the real estate server using the HTTP transport."""
+def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1) -> None:
+    """Run the real estate server using the HTTP transport, optionally across ``workers`` processes."""
 
-    server.run(transport="http", host=host, port=port)
+    if workers > 1:
+        run_workers(f"{__package__}.realestate:server", host=host, port=port, workers=workers)
+        return
+    module_server(__name__).run(transport="http", host=host, port=port)
 
 
 if __name__ == "__main__":
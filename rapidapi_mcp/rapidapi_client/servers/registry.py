@@ -0,0 +1,35 @@
+"""Registry of domain server modules, imported only when first needed."""
+
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+
+# Domain name -> module defining NAME, INSTRUCTIONS, TOOLS, server and run_server
+DOMAIN_MODULES: dict[str, str] = {
+    "entertainment": f"{__package__}.entertainment",
+    "finance": f"{__package__}.finance",
+    "food": f"{__package__}.food",
+    "jobs": f"{__package__}.jobs",
+    "news": f"{__package__}.news",
+    "search": f"{__package__}.search",
+    "realestate": f"{__package__}.realestate",
+    "social": f"{__package__}.social",
+}
+
+
+def load_domain(name: str) -> ModuleType:
+    """Import and return the server module for domain ``name``.
+
+    Importing a domain module builds its FastMCP server, so only the domains
+    that are actually served pay for tool registration and schema generation.
+
+    Raises:
+        ValueError: If ``name`` is not a registered domain.
+    """
+
+    try:
+        module_name = DOMAIN_MODULES[name]
+    except KeyError:
+        raise ValueError(f"Unknown domain: {name}") from None
+    return importlib.import_module(module_name)
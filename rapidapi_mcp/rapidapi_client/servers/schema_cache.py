@@ -0,0 +1,150 @@
+"""Precomputed tool schemas so servers can start without schema introspection.
+
+Generating a tool's JSON schema means building a Pydantic model from the
+function signature, which dominates cold start for servers with many tools.
+``tool_schemas.json`` (next to this module) stores the input and output
+schema of every domain tool together with a fingerprint of the function it
+was generated from. The file is accepted when its format version matches and
+it was generated under the installed FastMCP major version; the per-tool
+fingerprint then decides which entries are still valid, and anything else
+falls back to normal introspection.
+
+Regenerate the file after changing a tool's signature::
+
+    python -m rapidapi_client.servers.schema_cache
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+import fastmcp
+
+SCHEMA_CACHE_PATH = Path(__file__).with_name("tool_schemas.json")
+SCHEMA_CACHE_VERSION = 1
+
+
+def _major(version: str) -> str:
+    return version.split(".", 1)[0]
+
+
+def fingerprint(func: Callable[..., Any]) -> str:
+    """Hash everything about ``func`` that shapes its tool schema.
+
+    Covers the parameter names and kinds, defaults and annotations without
+    calling :func:`inspect.signature`, so checking it is cheap.
+    """
+
+    code = func.__code__
+    argcount = code.co_argcount + code.co_kwonlyargcount
+    parts = (
+        func.__module__,
+        func.__qualname__,
+        code.co_varnames[:argcount],
+        code.co_argcount,
+        repr(func.__defaults__),
+        repr(sorted((func.__kwdefaults__ or {}).items())),
+        repr(sorted((name, str(value)) for name, value in func.__annotations__.items())),
+    )
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class SchemaCache:
+    """Tool schemas keyed by ``"<server name>/<tool name>"``.
+
+    ``hits`` and ``misses`` count lookups, so a stale cache shows up as misses.
+    """
+
+    def __init__(
+        self,
+        entries: dict[str, dict[str, Any]] | None = None,
+        fastmcp_version: str | None = None,
+    ) -> None:
+        self.entries = entries or {}
+        self.fastmcp_version = fastmcp_version or fastmcp.__version__
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path = SCHEMA_CACHE_PATH) -> "SchemaCache":
+        """Read a cache file; a missing or incompatible file yields an empty cache."""
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        generated_with = str(data.get("fastmcp", ""))
+        if data.get("version") != SCHEMA_CACHE_VERSION or _major(generated_with) != _major(fastmcp.__version__):
+            return cls()
+        return cls(data.get("tools", {}), generated_with)
+
+    def lookup(self, server_name: str, tool_name: str, func: Callable[..., Any]) -> dict[str, Any] | None:
+        """Return the cached ``parameters``/``output_schema`` for a tool if still valid."""
+
+        entry = self.entries.get(f"{server_name}/{tool_name}")
+        if entry is not None and entry.get("fingerprint") == fingerprint(func):
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(
+        self,
+        server_name: str,
+        tool_name: str,
+        func: Callable[..., Any],
+        parameters: dict[str, Any],
+        output_schema: dict[str, Any] | None,
+    ) -> None:
+        """Record the schemas generated for a tool."""
+
+        self.entries[f"{server_name}/{tool_name}"] = {
+            "fingerprint": fingerprint(func),
+            "parameters": parameters,
+            "output_schema": output_schema,
+        }
+
+    def save(self, path: Path = SCHEMA_CACHE_PATH) -> None:
+        """Write the cache as stable, diff-friendly JSON."""
+
+        data = {
+            "version": SCHEMA_CACHE_VERSION,
+            "fastmcp": self.fastmcp_version,
+            "tools": dict(sorted(self.entries.items())),
+        }
+        path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+@functools.cache
+def default_schema_cache() -> SchemaCache:
+    """Return the packaged schema cache, loaded once per process."""
+
+    return SchemaCache.load()
+
+
+def generate(path: Path = SCHEMA_CACHE_PATH) -> SchemaCache:
+    """Introspect every domain server's tools and write their schemas to ``path``."""
+
+    from .base import build_server
+    from .registry import DOMAIN_MODULES, load_domain
+
+    cache = SchemaCache()
+    for domain in DOMAIN_MODULES:
+        module = load_domain(domain)
+        server = build_server(module.NAME, module.INSTRUCTIONS, module.TOOLS, schema_cache=False)
+        tools = asyncio.run(server.get_tools())
+        for func, tool_name, _ in module.TOOLS:
+            tool = tools[tool_name]
+            cache.store(module.NAME, tool_name, func, tool.parameters, tool.output_schema)
+    cache.save(path)
+    return cache
+
+
+if __name__ == "__main__":
+    written = generate()
+    print(f"Wrote {len(written.entries)} tool schemas to {SCHEMA_CACHE_PATH}")
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from .base import build_server
+from .base import ToolSpec, lazy_server_attribute, module_server
+from .workers import run_workers
 from ..rapidapi_tools import (
     get_business_details,
     get_business_reviews,
     local_business_search,
+    multi_search,
     search_web,
 )
 
@@ -15,39 +17,49 @@ INSTRUCTIONS = (
     "Ensure RAPIDAPI_KEY is configured via environment or .env prior to launch."
 )
 
-server = build_server(
-    "rapidapi-search",
-    INSTRUCTIONS,
-    [
-        (   search_web, 
-            "search_web",
-            "Supports all Google Advanced Search operators (site:, inurl:, intitle:, etc)."),
-        (
-            local_business_search,
-            "local_business_search",
-            "Search for local businesses using Local Business Data.",
-        ),
-        (
-            get_business_details,
-            "get_business_details",
-            "Retrieve Local Business Data details for a business.",
-        ),
-        (
-            get_business_reviews,
-            "get_business_reviews",
-            "Retrieve Local Business Data reviews for a business.",
-        ),
-    ],
-)
+NAME = "rapidapi-search"
+
+TOOLS: list[ToolSpec] = [
+    (   search_web, 
+        "search_web",
+        "Supports all Google Advanced Search operators (site:, inurl:, intitle:, etc)."),
+    (
+        local_business_search,
+        "local_business_search",
+        "Search for local businesses using Local Business Data.",
+    ),
+    (
+        get_business_details,
+        "get_business_details",
+        "Retrieve Local Business Data details for a business.",
+    ),
+    (
+        get_business_reviews,
+        "get_business_reviews",
+        "Retrieve Local Business Data reviews for a business.",
+    ),
+    (
+        multi_search,
+        "multi_search",
+        "Search several sources (news, tweets, web, spotify, imdb) for one query "
+        "concurrently and return each source's results, timing and error together.",
+    ),
+]
+
+# The standalone server is built on first access to ``server``
+__getattr__ = lazy_server_attribute(__name__)
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 9408
 
 
-def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
-    """Run the search server using the HTTP transport."""
+def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1) -> None:
+    """Run the search server using the HTTP transport, optionally across ``workers`` processes."""
 
-    server.run(transport="http", host=host, port=port)
+    if workers > 1:
+        run_workers(f"{__package__}.search:server", host=host, port=port, workers=workers)
+        return
+    module_server(__name__).run(transport="http", host=host, port=port)
 
 
 if __name__ == "__main__":
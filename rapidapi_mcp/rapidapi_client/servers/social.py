@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from .base import build_server
+from .base import ToolSpec, lazy_server_attribute, module_server
+from .workers import run_workers
 from ..rapidapi_tools import (
     get_trending_topics,
     get_tweet_details,
@@ -19,27 +20,31 @@ INSTRUCTIONS = (
     ".env before starting."
 )
 
-server = build_server(
-    "rapidapi-social",
-    INSTRUCTIONS,
-    [
-        (search_tweets, "search_tweets", "Search tweets via Twitter154."),
-        (get_user_profile, "get_user_profile", "Fetch a Twitter profile."),
-        (get_user_tweets, "get_user_tweets", "Fetch recent tweets from a user."),
-        (get_trending_topics, "get_trending_topics", "Fetch trending topics."),
-        (get_tweet_details, "get_tweet_details", "Fetch a single tweet's details."),
-        (search_users, "search_users", "Search for Twitter users."),
-    ],
-)
+NAME = "rapidapi-social"
+
+TOOLS: list[ToolSpec] = [
+    (search_tweets, "search_tweets", "Search tweets via Twitter154."),
+    (get_user_profile, "get_user_profile", "Fetch a Twitter profile."),
+    (get_user_tweets, "get_user_tweets", "Fetch recent tweets from a user."),
+    (get_trending_topics, "get_trending_topics", "Fetch trending topics."),
+    (get_tweet_details, "get_tweet_details", "Fetch a single tweet's details."),
+    (search_users, "search_users", "Search for Twitter users."),
+]
+
+# The standalone server is built on first access to ``server``
+__getattr__ = lazy_server_attribute(__name__)
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 9405
 
 
-def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
-    """Run the social server using the HTTP transport."""
+def run_server(*, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1) -> None:
+    """Run the social server using the HTTP transport, optionally across ``workers`` processes."""
 
-    server.run(transport="http", host=host, port=port)
+    if workers > 1:
+        run_workers(f"{__package__}.social:server", host=host, port=port, workers=workers)
+        return
+    module_server(__name__).run(transport="http", host=host, port=port)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,303 @@
+"""Run one FastMCP server across several worker processes sharing a port."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import multiprocessing as mp
+import os
+import signal
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import uvicorn
+from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+GRACEFUL_TIMEOUT = 10.0
+STARTUP_TIMEOUT = 30.0
+RESPAWN_DELAY = 1.0
+POLL_INTERVAL = 0.5
+HEALTH_PATH = "/health"
+
+
+def load_server(target: str, options: dict[str, Any] | None = None) -> FastMCP:
+    """Resolve ``"package.module:attribute"`` to a FastMCP server.
+
+    The attribute may be a server or a factory returning one; a factory is
+    called with ``options`` as keyword arguments.
+
+    Raises:
+        ValueError: If ``options`` are given for a target that is not a factory.
+    """
+
+    module_name, _, attribute = target.partition(":")
+    value = getattr(importlib.import_module(module_name), attribute or "server")
+    if isinstance(value, FastMCP):
+        if options:
+            raise ValueError(f"{target} is a server, not a factory; it takes no options")
+        return value
+    return value(**(options or {}))
+
+
+def bind_socket(host: str, port: int, *, reuse_port: bool) -> socket.socket:
+    """Create a listening TCP socket, optionally with ``SO_REUSEPORT`` set."""
+
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def add_health_route(server: FastMCP, index: int) -> None:
+    """Expose ``GET /health`` reporting the worker that answered."""
+
+    started = time.monotonic()
+
+    @server.custom_route(HEALTH_PATH, methods=["GET"])
+    async def health(request: Request) -> JSONResponse:
+        return JSONResponse(
+            {
+                "status": "ok",
+                "server": server.name,
+                "worker": index,
+                "pid": os.getpid(),
+                "uptime": round(time.monotonic() - started, 1),
+            }
+        )
+
+
+async def _serve(server: FastMCP, sock: socket.socket, ready: Any) -> None:
+    # Streamable HTTP sessions live in one process, and a client's next
+    # connection may land on another worker, so workers run stateless.
+    app = server.http_app(transport="http", stateless_http=True)
+    config = uvicorn.Config(app, lifespan="on", timeout_graceful_shutdown=GRACEFUL_TIMEOUT)
+    uv_server = uvicorn.Server(config)
+    task = asyncio.ensure_future(uv_server.serve(sockets=[sock]))
+    while not uv_server.started and not task.done():
+        await asyncio.sleep(0.05)
+    if uv_server.started:
+        ready.set()
+    await task
+
+
+def _worker_main(
+    target: str,
+    options: dict[str, Any] | None,
+    index: int,
+    host: str,
+    port: int,
+    listener: socket.socket | None,
+    ready: Any,
+) -> None:
+    """Entry point of a worker process."""
+
+    for name in ("SIGHUP", "SIGTERM"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), signal.SIG_DFL)
+    sock = listener or bind_socket(host, port, reuse_port=True)
+    server = load_server(target, options)
+    add_health_route(server, index)
+    asyncio.run(_serve(server, sock, ready))
+
+
+@dataclass
+class Worker:
+    """Supervisor-side state of one worker slot."""
+
+    index: int
+    process: mp.Process
+    ready: Any
+    started_at: float = field(default_factory=time.monotonic)
+    restarts: int = 0
+
+    def health(self) -> dict[str, Any]:
+        """Return liveness, readiness and restart count for this slot."""
+
+        return {
+            "worker": self.index,
+            "pid": self.process.pid,
+            "alive": self.process.is_alive(),
+            "ready": self.ready.is_set(),
+            "restarts": self.restarts,
+            "uptime": round(time.monotonic() - self.started_at, 1),
+        }
+
+
+class WorkerPool:
+    """Supervise ``workers`` processes that all serve ``target`` on one port.
+
+    Where the platform supports ``SO_REUSEPORT`` each worker binds its own
+    socket and the kernel balances connections between them; elsewhere the
+    supervisor binds a single listener that every worker accepts from.
+    ``options`` are passed to ``target`` when it names a server factory.
+    Workers that exit unexpectedly are respawned. ``SIGHUP`` triggers a
+    rolling restart: each replacement is started and ready before the worker
+    it replaces is asked to finish in-flight requests and exit.
+    """
+
+    def __init__(
+        self,
+        target: str,
+        *,
+        host: str,
+        port: int,
+        workers: int,
+        options: dict[str, Any] | None = None,
+        reuse_port: bool | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.target = target
+        self.options = options
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.reuse_port = hasattr(socket, "SO_REUSEPORT") if reuse_port is None else reuse_port
+        self._context = mp.get_context()
+        self._listener: socket.socket | None = None
+        self._slots: list[Worker] = []
+        self._stopping = False
+        self._restart_requested = False
+
+    def _spawn(self, index: int, restarts: int = 0) -> Worker:
+        ready = self._context.Event()
+        process = self._context.Process(
+            target=_worker_main,
+            name=f"{self.target}-worker-{index}",
+            args=(self.target, self.options, index, self.host, self.port, self._listener, ready),
+        )
+        process.start()
+        return Worker(index=index, process=process, ready=ready, restarts=restarts)
+
+    @staticmethod
+    def _stop_worker(worker: Worker, timeout: float = GRACEFUL_TIMEOUT) -> None:
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.process.join(timeout)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+
+    def start(self) -> None:
+        """Start every worker."""
+
+        if self.reuse_port:
+            # Bind once up front so a port clash fails here, not in every worker.
+            # Without SO_REUSEPORT, so a server already holding it is detected.
+            bind_socket(self.host, self.port, reuse_port=False).close()
+        else:
+            self._listener = bind_socket(self.host, self.port, reuse_port=False)
+        self._slots = [self._spawn(index) for index in range(self.workers)]
+
+    def health(self) -> list[dict[str, Any]]:
+        """Return the health of every worker slot."""
+
+        return [worker.health() for worker in self._slots]
+
+    def restart(self, timeout: float = STARTUP_TIMEOUT) -> bool:
+        """Replace the workers one at a time without dropping the port.
+
+        A replacement that is not serving within ``timeout`` is terminated and
+        the worker it was meant to replace keeps running.
+
+        Returns:
+            ``True`` if every worker was replaced.
+        """
+
+        replaced = True
+        for position, old in enumerate(list(self._slots)):
+            new = self._spawn(old.index, old.restarts + 1)
+            if not new.ready.wait(timeout):
+                print(
+                    f"[{self.target}] replacement for worker {old.index} (pid={new.process.pid}) "
+                    f"was not ready within {timeout:g}s; keeping pid={old.process.pid}.",
+                    flush=True,
+                )
+                self._stop_worker(new)
+                replaced = False
+                continue
+            self._slots[position] = new
+            self._stop_worker(old)
+        return replaced
+
+    def check(self) -> None:
+        """Respawn workers that have exited."""
+
+        for position, worker in enumerate(self._slots):
+            if worker.process.is_alive() or self._stopping:
+                continue
+            print(
+                f"[{self.target}] worker {worker.index} (pid={worker.process.pid}) exited "
+                f"with code {worker.process.exitcode}; respawning.",
+                flush=True,
+            )
+            time.sleep(RESPAWN_DELAY)
+            self._slots[position] = self._spawn(worker.index, worker.restarts + 1)
+
+    def stop(self) -> None:
+        """Ask every worker to shut down gracefully and wait for them."""
+
+        self._stopping = True
+        for worker in self._slots:
+            if worker.process.is_alive():
+                worker.process.terminate()
+        for worker in self._slots:
+            self._stop_worker(worker)
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    def run(self) -> None:
+        """Start the workers and supervise them until interrupted."""
+
+        def request_restart(signum: int, frame: Any) -> None:
+            self._restart_requested = True
+
+        def request_stop(signum: int, frame: Any) -> None:
+            raise KeyboardInterrupt
+
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, request_restart)
+        signal.signal(signal.SIGTERM, request_stop)
+
+        self.start()
+        mode = "SO_REUSEPORT" if self.reuse_port else "shared listener"
+        print(
+            f"[{self.target}] Serving on {self.host}:{self.port} with {self.workers} workers ({mode}); "
+            f"pids={[worker.process.pid for worker in self._slots]}",
+            flush=True,
+        )
+        try:
+            while True:
+                time.sleep(POLL_INTERVAL)
+                if self._restart_requested:
+                    self._restart_requested = False
+                    print(f"[{self.target}] Rolling restart...", flush=True)
+                    self.restart()
+                self.check()
+        except KeyboardInterrupt:
+            print(f"\n[{self.target}] Stopping workers...", flush=True)
+        finally:
+            self.stop()
+
+
+def run_workers(
+    target: str,
+    *,
+    host: str,
+    port: int,
+    workers: int,
+    options: dict[str, Any] | None = None,
+) -> None:
+    """Serve ``target`` from ``workers`` processes sharing ``host:port``."""
+
+    WorkerPool(target, host=host, port=port, workers=workers, options=options).run()
@@ -3,89 +3,101 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import multiprocessing as mp
-from typing import Callable, Dict, List, Tuple
+from collections.abc import Mapping
+from typing import Any, Callable, Iterator, List, Tuple
 
 from fastmcp import FastMCP
 
-from rapidapi_client.servers import (
-    entertainment,
-    finance,
-    food,
-    jobs,
-    news,
-    search,
-    realestate,
-    social,
-)
-
-ENTERTAINMENT_HOST = entertainment.DEFAULT_HOST
-ENTERTAINMENT_PORT = entertainment.DEFAULT_PORT
-entertainment_server = entertainment.server
-run_entertainment_server = entertainment.run_server
-
-FINANCE_HOST = finance.DEFAULT_HOST
-FINANCE_PORT = finance.DEFAULT_PORT
-finance_server = finance.server
-run_finance_server = finance.run_server
-
-FOOD_HOST = food.DEFAULT_HOST
-FOOD_PORT = food.DEFAULT_PORT
-food_server = food.server
-run_food_server = food.run_server
-
-JOBS_HOST = jobs.DEFAULT_HOST
-JOBS_PORT = jobs.DEFAULT_PORT
-jobs_server = jobs.server
-run_jobs_server = jobs.run_server
-
-NEWS_HOST = news.DEFAULT_HOST
-NEWS_PORT = news.DEFAULT_PORT
-news_server = news.server
-run_news_server = news.run_server
-
-SEARCH_HOST = search.DEFAULT_HOST
-SEARCH_PORT = search.DEFAULT_PORT
-search_server = search.server
-run_search_server = search.run_server
-
-REALESTATE_HOST = realestate.DEFAULT_HOST
-REALESTATE_PORT = realestate.DEFAULT_PORT
-realestate_server = realestate.server
-run_realestate_server = realestate.run_server
-
-SOCIAL_HOST = social.DEFAULT_HOST
-SOCIAL_PORT = social.DEFAULT_PORT
-social_server = social.server
-run_social_server = social.run_server
+from rapidapi_client.servers import gateway
+from rapidapi_client.servers.registry import DOMAIN_MODULES, load_domain
+
+GATEWAY_HOST = gateway.DEFAULT_HOST
+GATEWAY_PORT = gateway.DEFAULT_PORT
+run_gateway = gateway.run_server
 
 ServerEntry = Tuple[FastMCP, Callable[..., None], str, int]
+LaunchEntry = Tuple[Callable[..., None], str, int]
+
+
+class LazyServers(Mapping[str, ServerEntry]):
+    """Mapping of domain name to :data:`ServerEntry`, importing each domain on first access.
+
+    Iterating or listing the domains imports nothing; looking one up imports
+    (and so builds) only that domain's server.
+    """
+
+    def __getitem__(self, name: str) -> ServerEntry:
+        if name not in DOMAIN_MODULES:
+            raise KeyError(name)
+        module = load_domain(name)
+        return (module.server, module.run_server, module.DEFAULT_HOST, module.DEFAULT_PORT)
+
+    def launcher(self, name: str) -> LaunchEntry:
+        """Return ``(run_server, default host, default port)`` without building the server.
 
-SERVERS: Dict[str, ServerEntry] = {
-    "entertainment": (entertainment_server, run_entertainment_server, ENTERTAINMENT_HOST, ENTERTAINMENT_PORT),
-    "finance": (finance_server, run_finance_server, FINANCE_HOST, FINANCE_PORT),
-    "food": (food_server, run_food_server, FOOD_HOST, FOOD_PORT),
-    "jobs": (jobs_server, run_jobs_server, JOBS_HOST, JOBS_PORT),
-    "news": (news_server, run_news_server, NEWS_HOST, NEWS_PORT),
-    "search": (search_server, run_search_server, SEARCH_HOST, SEARCH_PORT),
-    "realestate": (realestate_server, run_realestate_server, REALESTATE_HOST, REALESTATE_PORT),
-    "social": (social_server, run_social_server, SOCIAL_HOST, SOCIAL_PORT),
-}
+        The runner builds the server in the process that serves it, so a
+        supervisor launching worker processes never builds it itself.
+        """
+
+        if name not in DOMAIN_MODULES:
+            raise KeyError(name)
+        module = load_domain(name)
+        return (module.run_server, module.DEFAULT_HOST, module.DEFAULT_PORT)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(DOMAIN_MODULES)
+
+    def __len__(self) -> int:
+        return len(DOMAIN_MODULES)
+
+
+SERVERS: LazyServers = LazyServers()
 
 __all__ = ["SERVERS"]
 
+# Legacy module attributes (e.g. FINANCE_PORT, finance_server, run_finance_server),
+# resolved on first access so they do not force every domain to load
+_LAZY_ATTRIBUTES: dict[str, Tuple[str, str]] = {}
+for _domain, _module in DOMAIN_MODULES.items():
+    _LAZY_ATTRIBUTES.update(
+        {
+            f"{_domain.upper()}_HOST": (_module, "DEFAULT_HOST"),
+            f"{_domain.upper()}_PORT": (_module, "DEFAULT_PORT"),
+            f"{_domain}_server": (_module, "server"),
+            f"run_{_domain}_server": (_module, "run_server"),
+        }
+    )
+del _domain, _module
 
-def run_all_servers(*, host: str | None = None) -> None:
-    """Run all domain servers concurrently using separate processes."""
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def run_all_servers(*, host: str | None = None, workers: int = 1) -> None:
+    """Run all domain servers concurrently using separate processes.
+
+    With ``workers`` above one, each domain supervises that many worker
+    processes on its port.
+
+    See :func:`run_gateway` for a single-process alternative on one port.
+    """
 
     processes: List[Tuple[str, mp.Process]] = []
     try:
-        for name, (_, runner, default_host, default_port) in SERVERS.items():
+        for name in SERVERS:
+            runner, default_host, default_port = SERVERS.launcher(name)
             bound_host = host or default_host
             process = mp.Process(
                 target=runner,
                 name=f"{name}-server",
-                kwargs={"host": bound_host, "port": default_port},
+                kwargs={"host": bound_host, "port": default_port, "workers": workers},
             )
             process.start()
             processes.append((name, process))
@@ -115,26 +127,44 @@ def main() -> None:
     )
     parser.add_argument("domain", nargs="?", choices=sorted(SERVERS), help="Domain server to launch.")
     parser.add_argument("--all", action="store_true", help="Launch every domain server concurrently.")
+    parser.add_argument(
+        "--gateway",
+        action="store_true",
+        help=f"Serve every domain from one process and port (default {GATEWAY_PORT}), tools prefixed by domain.",
+    )
     parser.add_argument("--host", default=None, help="Host interface to bind (default per server).")
     parser.add_argument("--port", type=int, default=None, help="Port to bind (default per server).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes sharing each port via SO_REUSEPORT (default 1). SIGHUP restarts them gracefully.",
+    )
     args = parser.parse_args()
 
-    if args.all and args.domain:
-        parser.error("Specify either a domain or --all, not both.")
+    if sum((bool(args.domain), args.all, args.gateway)) > 1:
+        parser.error("Specify only one of a domain, --all or --gateway.")
+
+    if not args.all and not args.domain and not args.gateway:
+        parser.error("Choose a domain to launch or pass --all or --gateway to run every server.")
 
-    if not args.all and not args.domain:
-        parser.error("Choose a domain to launch or pass --all to run every server.")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1.")
+
+    if args.gateway:
+        run_gateway(host=args.host or GATEWAY_HOST, port=args.port or GATEWAY_PORT, workers=args.workers)
+        return
 
     if args.all:
         if args.port is not None:
             parser.error("--port cannot be combined with --all because each server has an explicit port.")
-        run_all_servers(host=args.host)
+        run_all_servers(host=args.host, workers=args.workers)
         return
 
-    server, runner, default_host, default_port = SERVERS[args.domain]
+    runner, default_host, default_port = SERVERS.launcher(args.domain)
     host = args.host or default_host
     port = args.port or default_port
-    runner(host=host, port=port)
+    runner(host=host, port=port, workers=args.workers)
 
 
 if __name__ == "__main__":
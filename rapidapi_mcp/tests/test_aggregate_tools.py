@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from rapidapi_client.rapidapi_tools.aggregate import multi_search
+
+
+class StubRapidAPIClient:
+    def __init__(self, payloads, delay=0.05):
+        self.payloads = payloads
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def get(self, url, *, params=None, headers=None):
+        self.calls.append({"url": url, "params": params})
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            for fragment, payload in self.payloads.items():
+                if fragment in url:
+                    if isinstance(payload, Exception):
+                        raise payload
+                    return payload
+            raise AssertionError(f"unexpected url {url}")
+        finally:
+            self.active -= 1
+
+
+def test_multi_search_fans_out_concurrently():
+    client = StubRapidAPIClient(
+        {
+            "real-time-news-data": {"data": [{"title": "Story"}]},
+            "twitter154": {"results": [{"text": "Tweet"}]},
+            "real-time-web-search": {"data": [{"title": "Page"}, {"title": "Other"}]},
+        }
+    )
+
+    result = asyncio.run(multi_search("fusion power", client=client))
+
+    assert client.max_active == 3
+    assert result["sources"] == ["news", "tweets", "web"]
+    assert result["errors"] == 0
+    assert result["results"]["news"]["data"]["count"] == 1
+    assert result["results"]["web"]["data"]["count"] == 2
+    assert all(entry["ok"] and entry["elapsed_ms"] >= 40 for entry in result["results"].values())
+
+
+def test_multi_search_reports_per_source_errors():
+    client = StubRapidAPIClient(
+        {
+            "imdb8": RuntimeError("upstream down"),
+            "spotify23": {"tracks": {"items": [{"name": "Song"}]}},
+        },
+        delay=0,
+    )
+
+    result = asyncio.run(multi_search("dune", sources=["imdb", "spotify", "imdb"], client=client))
+
+    assert result["sources"] == ["imdb", "spotify"]
+    assert result["errors"] == 1
+    assert result["results"]["imdb"] == {
+        "ok": False,
+        "elapsed_ms": result["results"]["imdb"]["elapsed_ms"],
+        "data": None,
+        "error": "RuntimeError: upstream down",
+    }
+    assert result["results"]["spotify"]["data"]["count"] == 1
+
+
+def test_multi_search_rejects_unknown_sources():
+    client = StubRapidAPIClient({})
+
+    with pytest.raises(ValueError, match="Unknown source"):
+        asyncio.run(multi_search("x", sources=["web", "radio"], client=client))
+
+    assert client.calls == []
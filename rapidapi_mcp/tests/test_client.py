@@ -0,0 +1,283 @@
+import asyncio
+
+import httpx
+import pytest
+
+from rapidapi_client.rapidapi_tools.cache import ResponseCache
+from rapidapi_client.rapidapi_tools import ratelimit
+from rapidapi_client.rapidapi_tools.client import RapidAPIClient
+from rapidapi_client.rapidapi_tools.ratelimit import HostRateLimiter, backoff_delay, parse_retry_after
+
+
+def _mock_http(calls):
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_request_injects_rapidapi_headers():
+    calls = []
+    client = RapidAPIClient("test-key")
+    client._http = _mock_http(calls)
+
+    result = asyncio.run(client.get("https://jsearch.p.rapidapi.com/search", params={"query": "python"}))
+
+    assert result == {"ok": True}
+    request = calls[0]
+    assert request.headers["x-rapidapi-key"] == "test-key"
+    assert request.headers["x-rapidapi-host"] == "jsearch.p.rapidapi.com"
+    assert request.url.params["query"] == "python"
+
+
+def test_pooled_http_client_is_reused_across_requests():
+    calls = []
+    client = RapidAPIClient("test-key")
+    http = _mock_http(calls)
+    client._http = http
+
+    async def run():
+        await client.get("https://jsearch.p.rapidapi.com/search")
+        await client.post("https://jsearch.p.rapidapi.com/search", json={"q": 1})
+        return client._http
+
+    assert asyncio.run(run()) is http
+    assert len(calls) == 2
+
+
+def test_lifespan_starts_and_closes_pool():
+    client = RapidAPIClient("test-key", max_connections=5, max_keepalive_connections=2)
+
+    async def run():
+        async with client.lifespan():
+            assert client.is_started
+            assert client.limits.max_connections == 5
+        return client.is_started
+
+    assert asyncio.run(run()) is False
+
+
+def test_request_raises_for_error_status():
+    client = RapidAPIClient("test-key")
+    client._http = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(500, json={}))
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get("https://jsearch.p.rapidapi.com/search"))
+
+
+def _counting_client(cache, responses):
+    calls = []
+    client = RapidAPIClient("test-key", cache=cache)
+
+    def handler(request):
+        calls.append(request)
+        return responses.pop(0)
+
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, calls
+
+
+def test_cache_serves_identical_requests_once():
+    cache = ResponseCache()
+    client, calls = _counting_client(
+        cache,
+        [httpx.Response(200, json={"data": 1}), httpx.Response(200, json={"data": 2})],
+    )
+    url = "https://imdb8.p.rapidapi.com/title/v2/get-overview"
+
+    async def run():
+        first = await client.get(url, params={"tconst": "tt1", "country": "US"})
+        second = await client.get(url, params={"country": "US", "tconst": "tt1"})
+        third = await client.get(url, params={"tconst": "tt2", "country": "US"})
+        return first, second, third
+
+    assert asyncio.run(run()) == ({"data": 1}, {"data": 1}, {"data": 2})
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_cache_key_includes_json_body():
+    key = ResponseCache.key_for("POST", "https://zillow-com4.p.rapidapi.com/x", None, {"b": 1, "a": 2})
+
+    assert key == ResponseCache.key_for("post", "https://zillow-com4.p.rapidapi.com/x", {}, {"a": 2, "b": 1})
+    assert key != ResponseCache.key_for("POST", "https://zillow-com4.p.rapidapi.com/x", None, {"a": 3, "b": 1})
+
+
+def test_stale_entry_served_when_throttled():
+    now = [0.0]
+    cache = ResponseCache(host_ttls={"steam2.p.rapidapi.com": 10}, clock=lambda: now[0])
+    client, calls = _counting_client(
+        cache,
+        [httpx.Response(200, json={"name": "Portal"}), httpx.Response(429, json={})],
+    )
+    url = "https://steam2.p.rapidapi.com/appDetail/400"
+
+    async def run():
+        await client.get(url)
+        now[0] = 20.0
+        return await client.get(url)
+
+    assert asyncio.run(run()) == {"name": "Portal"}
+    assert len(calls) == 2
+    assert cache.stats()["stale_hits"] == 1
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff and pacing sleeps instead of waiting."""
+
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def test_throttled_request_without_stale_entry_raises(sleeps):
+    client, calls = _counting_client(ResponseCache(), [httpx.Response(429, json={}) for _ in range(4)])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get("https://steam2.p.rapidapi.com/appDetail/400"))
+    assert len(calls) == 1 + client.max_retries
+
+
+def test_throttled_request_retries_after_retry_after(sleeps):
+    client, calls = _counting_client(
+        None,
+        [httpx.Response(429, headers={"Retry-After": "2"}, json={}), httpx.Response(200, json={"ok": True})],
+    )
+
+    assert asyncio.run(client.get("https://twitter154.p.rapidapi.com/user/details")) == {"ok": True}
+    assert len(calls) == 2
+    assert len(sleeps) == 1 and 2.0 <= sleeps[0] <= 2.5
+
+
+def test_limiter_paces_from_ratelimit_headers():
+    now = [100.0]
+    limiter = HostRateLimiter(clock=lambda: now[0])
+    limiter.update({
+        "x-ratelimit-requests-limit": "500000",
+        "x-ratelimit-requests-remaining": "499000",
+        "x-ratelimit-requests-reset": "2000000",
+        "x-ratelimit-rapid-free-plans-hard-limit-remaining": "4",
+        "x-ratelimit-rapid-free-plans-hard-limit-reset": "2",
+    })
+
+    assert limiter.interval == pytest.approx(0.5)
+    assert [limiter.reserve() for _ in range(3)] == [0.0, pytest.approx(0.5), pytest.approx(1.0)]
+
+
+def test_limiter_blocks_until_short_quota_resets():
+    now = [0.0]
+    limiter = HostRateLimiter(clock=lambda: now[0])
+    limiter.update({"x-ratelimit-requests-remaining": "0", "x-ratelimit-requests-reset": "5"})
+    assert limiter.reserve() == pytest.approx(5.0)
+
+    monthly = HostRateLimiter(clock=lambda: now[0])
+    monthly.update({"x-ratelimit-requests-remaining": "0", "x-ratelimit-requests-reset": "86400"})
+    assert monthly.reserve() == 0.0
+
+
+def test_backoff_is_exponential_and_jittered():
+    low = [backoff_delay(n, rng=lambda a, b: a) for n in range(4)]
+    high = [backoff_delay(n, rng=lambda a, b: b) for n in range(4)]
+
+    assert low == [0.5, 1.0, 2.0, 4.0]
+    assert high == [1.0, 2.0, 4.0, 8.0]
+    assert backoff_delay(0, retry_after=10, rng=lambda a, b: a) == 10
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0) == 10.0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("a")
+    cache.set("c", 3, 60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.evictions == 1
+
+
+def test_zero_host_ttl_disables_caching():
+    cache = ResponseCache(host_ttls={"twelve-data1.p.rapidapi.com": 0})
+    cache.set("k", {"price": 1}, cache.ttl_for("twelve-data1.p.rapidapi.com"))
+
+    assert len(cache) == 0
+
+
+def _slow_client(status=200, **kwargs):
+    calls = []
+    client = RapidAPIClient("test-key", **kwargs)
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(status, json={"q": request.url.params.get("q")})
+
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, calls
+
+
+def test_identical_concurrent_requests_share_one_call():
+    client, calls = _slow_client()
+    url = "https://real-time-news-data.p.rapidapi.com/top-headlines"
+
+    async def run():
+        return await asyncio.gather(
+            client.get(url, params={"q": "US"}),
+            client.get(url, params={"q": "US"}),
+            client.get(url, params={"q": "GB"}),
+        )
+
+    assert asyncio.run(run()) == [{"q": "US"}, {"q": "US"}, {"q": "GB"}]
+    assert len(calls) == 2
+    assert client.coalesced == 1
+    assert client._inflight == {}
+
+
+def test_coalesced_callers_all_receive_the_error():
+    client, calls = _slow_client(status=404)
+    url = "https://imdb8.p.rapidapi.com/title/get-details"
+
+    async def run():
+        return await asyncio.gather(
+            *(client.get(url, params={"q": "tt0111161"}) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    client, calls = _slow_client()
+    url = "https://imdb8.p.rapidapi.com/title/get-details"
+
+    async def run():
+        first = asyncio.ensure_future(client.get(url, params={"q": "tt1"}))
+        second = asyncio.ensure_future(client.get(url, params={"q": "tt1"}))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == {"q": "tt1"}
+    assert len(calls) == 1
+
+
+def test_coalescing_can_be_disabled():
+    client, calls = _slow_client(coalesce=False)
+    url = "https://real-time-news-data.p.rapidapi.com/top-headlines"
+
+    async def run():
+        await asyncio.gather(client.get(url), client.get(url))
+
+    asyncio.run(run())
+    assert len(calls) == 2
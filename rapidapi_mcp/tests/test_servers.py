@@ -0,0 +1,285 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+
+import fastmcp
+import httpx
+import pytest
+from fastmcp import Client
+
+from rapidapi_client.rapidapi_tools import RapidAPIClient, search_web
+from rapidapi_client.servers import build_server
+from rapidapi_client.servers.gateway import build_gateway
+from rapidapi_client.servers.registry import DOMAIN_MODULES, load_domain
+from rapidapi_client.servers.schema_cache import SchemaCache
+from rapidapi_client.servers.workers import WorkerPool, add_health_route, load_server
+
+
+def test_build_server_injects_one_shared_client():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"data": [{"title": "Result"}]})
+
+    client = RapidAPIClient("test-key")
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http = http
+    server = build_server("test", "instructions", [(search_web, "search_web", "Search.")], client=client)
+
+    async def run():
+        async with Client(server) as mcp_client:
+            tool = (await mcp_client.list_tools())[0]
+            first = await mcp_client.call_tool("search_web", {"query": "one"})
+            second = await mcp_client.call_tool("search_web", {"query": "two"})
+        return tool, first, second
+
+    tool, first, second = asyncio.run(run())
+
+    assert "client" not in tool.inputSchema["properties"]
+    assert first.data["count"] == 1
+    assert second.data["query"] == "two"
+    assert len(calls) == 2
+    assert all(request.headers["x-rapidapi-key"] == "test-key" for request in calls)
+    assert http.is_closed
+
+
+def test_client_resolves_api_key_lazily(monkeypatch):
+    monkeypatch.delenv("RAPIDAPI_KEY", raising=False)
+    client = RapidAPIClient()
+
+    monkeypatch.setenv("RAPIDAPI_KEY", "from-env")
+
+    assert client.api_key == "from-env"
+
+
+def test_gateway_mounts_every_domain_on_one_shared_client():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        return httpx.Response(200, json={"data": [{"title": "Result"}]})
+
+    client = RapidAPIClient("test-key")
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http = http
+    server = build_gateway(client=client)
+
+    async def run():
+        async with Client(server) as mcp_client:
+            names = {tool.name for tool in await mcp_client.list_tools()}
+            web = await mcp_client.call_tool("search_search_web", {"query": "one"})
+            still_open = not http.is_closed
+            news = await mcp_client.call_tool("news_search_news", {"query": "two"})
+        return names, web, still_open, news
+
+    names, web, still_open, news = asyncio.run(run())
+
+    assert {"finance_twelve_data_price", "social_search_tweets", "jobs_search_jobs"} <= names
+    assert web.data["count"] == 1
+    assert news.data["count"] == 1
+    assert still_open
+    assert calls == ["real-time-web-search.p.rapidapi.com", "real-time-news-data.p.rapidapi.com"]
+    assert http.is_closed
+
+
+def test_load_server_accepts_servers_and_factories():
+    from rapidapi_client.servers import finance, gateway
+
+    assert load_server("rapidapi_client.servers.finance:server") is finance.server
+    built = load_server("rapidapi_client.servers.gateway:build_gateway")
+    assert built.name == "rapidapi-gateway"
+    assert built is not gateway.build_gateway
+
+
+def test_load_server_passes_options_to_factories():
+    built = load_server("rapidapi_client.servers.gateway:build_gateway", {"domains": ["finance"]})
+
+    tools = asyncio.run(built.get_tools())
+    assert tools and all(name.startswith("finance_") for name in tools)
+    with pytest.raises(ValueError):
+        load_server("rapidapi_client.servers.finance:server", {"domains": ["finance"]})
+
+
+def test_gateway_does_not_build_standalone_domain_servers():
+    from rapidapi_client.servers import base, news
+
+    base._MODULE_SERVERS.pop(news.__name__, None)
+    build_gateway(["news"])
+
+    assert news.__name__ not in base._MODULE_SERVERS
+    assert "server" not in vars(news)
+
+
+def test_worker_health_route_reports_worker():
+    server = build_server("test", "instructions", [(search_web, "search_web", "Search.")])
+    add_health_route(server, 3)
+    app = server.http_app(transport="http", stateless_http=True)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://worker") as http:
+            return await http.get("/health")
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert response.json()["worker"] == 3
+    assert response.json()["server"] == "test"
+
+
+def test_worker_pool_rejects_zero_workers():
+    with pytest.raises(ValueError):
+        WorkerPool("rapidapi_client.servers.finance:server", host="127.0.0.1", port=0, workers=0)
+
+
+class FakeProcess:
+    def __init__(self, pid):
+        self.pid = pid
+        self.exitcode = None
+        self.terminated = False
+
+    def is_alive(self):
+        return not self.terminated
+
+    def terminate(self):
+        self.terminated = True
+
+    def join(self, timeout=None):
+        pass
+
+    def kill(self):
+        self.terminated = True
+
+
+class FakeReady:
+    def __init__(self, ready):
+        self.ready = ready
+
+    def wait(self, timeout=None):
+        return self.ready
+
+    def is_set(self):
+        return self.ready
+
+
+def test_worker_pool_restart_keeps_worker_when_replacement_is_not_ready(monkeypatch):
+    from rapidapi_client.servers.workers import Worker
+
+    pool = WorkerPool("rapidapi_client.servers.finance:server", host="127.0.0.1", port=0, workers=1)
+    old = Worker(index=0, process=FakeProcess(1), ready=FakeReady(True))
+    new = Worker(index=0, process=FakeProcess(2), ready=FakeReady(False), restarts=1)
+    pool._slots = [old]
+    monkeypatch.setattr(pool, "_spawn", lambda index, restarts=0: new)
+
+    assert pool.restart(timeout=0) is False
+    assert pool._slots == [old]
+    assert not old.process.terminated
+    assert new.process.terminated
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="needs SO_REUSEPORT")
+def test_worker_pool_start_detects_port_held_with_reuse_port():
+    holder = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    holder.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    holder.bind(("127.0.0.1", 0))
+    holder.listen(1)
+    pool = WorkerPool(
+        "rapidapi_client.servers.finance:server",
+        host="127.0.0.1",
+        port=holder.getsockname()[1],
+        workers=1,
+        reuse_port=True,
+    )
+    try:
+        with pytest.raises(OSError):
+            pool.start()
+        assert pool._slots == []
+    finally:
+        holder.close()
+
+
+def test_launcher_imports_only_the_requested_domain():
+    code = (
+        "import sys, server\n"
+        "before = {m for m in sys.modules if m.startswith('rapidapi_client.servers.')}\n"
+        "entry = server.SERVERS['finance']\n"
+        "after = {m for m in sys.modules if m.startswith('rapidapi_client.servers.')}\n"
+        "print(sorted(after - before), entry[3], server.SEARCH_PORT, sorted(server.SERVERS) == sorted(server.DOMAIN_MODULES))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "['rapidapi_client.servers.finance'] 9402 9408 True"
+
+
+def test_launcher_lookup_does_not_build_the_server():
+    import server
+    from rapidapi_client.servers import base, jobs
+
+    base._MODULE_SERVERS.pop(jobs.__name__, None)
+    runner, host, port = server.SERVERS.launcher("jobs")
+
+    assert (runner, host, port) == (jobs.run_server, jobs.DEFAULT_HOST, jobs.DEFAULT_PORT)
+    assert jobs.__name__ not in base._MODULE_SERVERS
+    with pytest.raises(KeyError):
+        server.SERVERS.launcher("nope")
+
+
+def test_packaged_schema_cache_matches_introspection():
+    cache = SchemaCache.load()
+    if cache.fastmcp_version != fastmcp.__version__:
+        pytest.skip(f"tool_schemas.json was generated with fastmcp {cache.fastmcp_version}")
+
+    for domain in DOMAIN_MODULES:
+        module = load_domain(domain)
+        cached = asyncio.run(build_server(module.NAME, module.INSTRUCTIONS, module.TOOLS, schema_cache=cache).get_tools())
+        fresh = asyncio.run(build_server(module.NAME, module.INSTRUCTIONS, module.TOOLS, schema_cache=False).get_tools())
+        for name, tool in fresh.items():
+            assert cached[name].parameters == tool.parameters
+            assert cached[name].output_schema == tool.output_schema
+
+    assert cache.misses == 0, "run `python -m rapidapi_client.servers.schema_cache` to refresh tool_schemas.json"
+
+
+def test_schema_cache_is_used_only_while_fingerprint_matches():
+    def handler(request):
+        return httpx.Response(200, json={"data": []})
+
+    client = RapidAPIClient("test-key")
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    parameters = {"type": "object", "properties": {"query": {"type": "string", "description": "cached"}}}
+    cache = SchemaCache()
+    cache.store("test", "search_web", search_web, parameters, None)
+    cache.store("test", "stale", search_web, parameters, None)
+    cache.entries["test/stale"]["fingerprint"] = "outdated"
+    specs = [(search_web, "search_web", "Search."), (search_web, "stale", "Search.")]
+    server = build_server("test", "instructions", specs, client=client, schema_cache=cache)
+
+    async def run():
+        async with Client(server) as mcp_client:
+            tools = {tool.name: tool for tool in await mcp_client.list_tools()}
+            result = await mcp_client.call_tool("search_web", {"query": "one"})
+        return tools, result
+
+    tools, result = asyncio.run(run())
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert tools["search_web"].inputSchema["properties"]["query"]["description"] == "cached"
+    assert "description" not in tools["stale"].inputSchema["properties"]["query"]
+    assert result.data["query"] == "one"
+
+
+def test_schema_cache_loads_across_fastmcp_patch_versions(tmp_path, monkeypatch):
+    path = tmp_path / "tool_schemas.json"
+    cache = SchemaCache()
+    cache.store("test", "search_web", search_web, {"type": "object"}, None)
+    cache.fastmcp_version = "2.0.0"
+    cache.save(path)
+
+    monkeypatch.setattr(fastmcp, "__version__", "2.99.1")
+    assert SchemaCache.load(path).lookup("test", "search_web", search_web) is not None
+    monkeypatch.setattr(fastmcp, "__version__", "3.0.0")
+    assert SchemaCache.load(path).entries == {}